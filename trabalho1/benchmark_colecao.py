@@ -0,0 +1,268 @@
+'''
+Compara o desempenho das implementações de Colecao.
+
+Para cada implementação, tamanho de álbum e densidade (número de figurinhas
+inseridas dividido pelo tamanho do álbum), executa as cargas:
+
+- insere: abertura de pacotes (figurinhas sorteadas uniformemente);
+- lista: consultas às listagens (colecao_sem_repeticao, colecao_com_repeticao
+  e faltantes);
+- troca: troca_maxima entre pares de coleções;
+- remove: remoção de metade das figurinhas inseridas.
+
+O resultado é escrito em JSON com as operações por segundo de cada carga, o
+pico de memória para montar uma coleção (medido com tracemalloc em uma
+execução separada) e, para cada carga, o expoente da curva de escala
+(inclinação de log(tempo por operação) por log(tamanho do álbum)).
+
+Uso:
+    python benchmark_colecao.py --tamanhos 100 1000 10000 100000 \\
+        --densidades 0.01 0.1 1 3 --saida resultado.json
+'''
+from __future__ import annotations
+import argparse
+import importlib
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+
+IMPLEMENTACOES = ['colecao_arranjo', 'colecao_no', 'colecao_abb']
+CARGAS = ['insere', 'lista', 'troca', 'remove']
+
+
+def gera_carga(tamanho: int, densidade: float, semente: int) -> tuple[list[int], list[int], list[int]]:
+    '''
+    Devolve as figurinhas inseridas em duas coleções do álbum com *tamanho*
+    figurinhas e as figurinhas removidas da primeira coleção.
+    Exemplos
+    >>> a, b, r = gera_carga(100, 0.5, 1)
+    >>> len(a), len(b), len(r)
+    (50, 50, 25)
+    >>> all(1 <= f <= 100 for f in a + b)
+    True
+    >>> from collections import Counter
+    >>> Counter(r) - Counter(a)
+    Counter()
+    '''
+    rng = random.Random(semente)
+    n = max(1, round(tamanho * densidade))
+    a = [rng.randint(1, tamanho) for _ in range(n)]
+    b = [rng.randint(1, tamanho) for _ in range(n)]
+    removidas = rng.sample(a, n // 2)
+    return a, b, removidas
+
+
+def executa(Colecao, tamanho: int, densidade: float, semente: int, consultas: int,
+            prazo: float = math.inf) -> dict:
+    '''
+    Executa as cargas na implementação *Colecao* e devolve um dicionário com
+    o número de operações, o tempo (em segundos) e as operações por segundo
+    de cada carga.
+    Gera TimeoutError se as cargas não terminam até o instante *prazo*
+    (de time.perf_counter).
+    Exemplos
+    >>> import colecao_arranjo
+    >>> r = executa(colecao_arranjo.Colecao, 50, 1, 1, 2)
+    >>> sorted(r)
+    ['insere', 'lista', 'remove', 'troca']
+    >>> r['insere']['operacoes'], r['lista']['operacoes'], r['remove']['operacoes']
+    (100, 6, 25)
+    >>> executa(colecao_arranjo.Colecao, 50, 1, 1, 2, time.perf_counter())
+    Traceback (most recent call last):
+    ...
+    TimeoutError: prazo esgotado
+    '''
+    a, b, removidas = gera_carga(tamanho, densidade, semente)
+    resultado = {}
+
+    c1 = Colecao(tamanho)
+    c2 = Colecao(tamanho)
+    inicio = time.perf_counter()
+    for f in a:
+        c1.insere(f)
+        verifica_prazo(prazo)
+    for f in b:
+        c2.insere(f)
+        verifica_prazo(prazo)
+    resultado['insere'] = medida(len(a) + len(b), time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    for _ in range(consultas):
+        c1.colecao_sem_repeticao()
+        c1.colecao_com_repeticao()
+        c1.faltantes()
+        verifica_prazo(prazo)
+    resultado['lista'] = medida(3 * consultas, time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    c1.troca_maxima(c2)
+    resultado['troca'] = medida(1, time.perf_counter() - inicio)
+
+    # As figurinhas removidas são escolhidas entre as que estão na coleção
+    # depois da troca, para que todas as remoções sejam válidas
+    quantidades = c1.quantidades()
+    validas = []
+    for f in removidas:
+        if quantidades[f - 1] > 0:
+            quantidades[f - 1] -= 1
+            validas.append(f)
+    inicio = time.perf_counter()
+    for f in validas:
+        c1.remove(f)
+        verifica_prazo(prazo)
+    resultado['remove'] = medida(len(validas), time.perf_counter() - inicio)
+    return resultado
+
+
+def verifica_prazo(prazo: float):
+    '''
+    Gera TimeoutError se o instante *prazo* (de time.perf_counter) já passou.
+    '''
+    if time.perf_counter() > prazo:
+        raise TimeoutError('prazo esgotado')
+
+
+def medida(operacoes: int, segundos: float) -> dict:
+    '''
+    Devolve o dicionário com o número de *operacoes*, os *segundos* e as
+    operações por segundo.
+    Exemplos
+    >>> medida(10, 0.5)
+    {'operacoes': 10, 'segundos': 0.5, 'operacoes_por_segundo': 20.0}
+    '''
+    por_segundo = operacoes / segundos if segundos > 0 else None
+    return {'operacoes': operacoes, 'segundos': segundos, 'operacoes_por_segundo': por_segundo}
+
+
+def pico_memoria(Colecao, tamanho: int, densidade: float, semente: int,
+                 prazo: float = math.inf) -> int:
+    '''
+    Devolve o pico de memória (em bytes) alocada para criar uma coleção
+    com a carga de inserção.
+    Gera TimeoutError se a coleção não é criada até o instante *prazo*.
+    '''
+    a, _, _ = gera_carga(tamanho, densidade, semente)
+    tracemalloc.start()
+    try:
+        c = Colecao(tamanho)
+        for f in a:
+            c.insere(f)
+            verifica_prazo(prazo)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def expoente(pontos: list[tuple[int, float]]) -> float | None:
+    '''
+    Devolve a inclinação da reta de mínimos quadrados de log(y) por log(x)
+    dos *pontos* (x, y), ou None se não há dois pontos com x diferentes
+    (os pontos com x ou y não positivo são ignorados).
+    Também é usada por trabalho2/benchmark_arvores.py.
+    Exemplos
+    >>> expoente([(10, 1.0), (100, 10.0), (1000, 100.0)])
+    1.0
+    >>> round(expoente([(10, 1.0), (100, 100.0)]), 6)
+    2.0
+    >>> expoente([(10, 1.0)]) is None
+    True
+    >>> expoente([(10, 1.0), (10, 2.0), (100, 0.0)]) is None
+    True
+    '''
+    pontos = [(math.log(x), math.log(y)) for x, y in pontos if x > 0 and y > 0]
+    if len(pontos) < 2:
+        return None
+    mx = sum(x for x, _ in pontos) / len(pontos)
+    my = sum(y for _, y in pontos) / len(pontos)
+    var = sum((x - mx) ** 2 for x, _ in pontos)
+    if var == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in pontos) / var
+
+
+def benchmark(implementacoes: list[str], tamanhos: list[int], densidades: list[float],
+              semente: int = 0, consultas: int = 10, limite: float = 60.0, verboso: bool = False) -> dict:
+    '''
+    Executa as cargas para cada implementação (nome do módulo com a classe
+    Colecao), tamanho e densidade, e devolve o resultado que é escrito em JSON.
+    Uma execução que leva mais que *limite* segundos é interrompida e marcada
+    como esgotada, e os tamanhos maiores com a mesma densidade não são
+    executados para a mesma implementação.
+    Se *verboso* é True, escreve o progresso na saída de erros.
+    Exemplos
+    >>> r = benchmark(['colecao_arranjo', 'colecao_abb'], [10, 100], [1.0], consultas=1)
+    >>> len(r['execucoes'])
+    4
+    >>> sorted(r['curvas']['colecao_abb']['1.0'])
+    ['insere', 'lista', 'remove', 'troca']
+    '''
+    execucoes = []
+    curvas: dict = {}
+    for nome in implementacoes:
+        Colecao = importlib.import_module(nome).Colecao
+        curvas[nome] = {}
+        for densidade in densidades:
+            pontos: dict[str, list] = {carga: [] for carga in CARGAS}
+            esgotada = False
+            for tamanho in sorted(tamanhos):
+                execucao = {'implementacao': nome, 'tamanho': tamanho, 'densidade': densidade}
+                execucoes.append(execucao)
+                if esgotada:
+                    execucao['ignorada'] = True
+                    continue
+                try:
+                    cargas = executa(Colecao, tamanho, densidade, semente, consultas,
+                                     time.perf_counter() + limite)
+                    execucao['cargas'] = cargas
+                    execucao['pico_memoria'] = pico_memoria(Colecao, tamanho, densidade, semente,
+                                                            time.perf_counter() + limite)
+                except TimeoutError:
+                    execucao['esgotada'] = True
+                    esgotada = True
+                    continue
+                for carga in CARGAS:
+                    if cargas[carga]['operacoes'] > 0:
+                        pontos[carga].append((tamanho, cargas[carga]['segundos'] / cargas[carga]['operacoes']))
+                if verboso:
+                    print(f'concluída: {nome}, tamanho {tamanho}, densidade {densidade}', file=sys.stderr)
+            curvas[nome][str(densidade)] = {
+                carga: {'pontos': pontos[carga], 'expoente': expoente(pontos[carga])}
+                for carga in CARGAS
+            }
+    return {
+        'parametros': {'implementacoes': implementacoes, 'tamanhos': tamanhos, 'densidades': densidades,
+                       'semente': semente, 'consultas': consultas, 'limite': limite},
+        'execucoes': execucoes,
+        'curvas': curvas,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara as implementações de Colecao.')
+    parser.add_argument('--implementacoes', nargs='+', default=IMPLEMENTACOES,
+                        help='módulos com a classe Colecao')
+    parser.add_argument('--tamanhos', nargs='+', type=int, default=[100, 1000, 10000, 100000])
+    parser.add_argument('--densidades', nargs='+', type=float, default=[0.01, 0.1, 1.0, 3.0])
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--consultas', type=int, default=10, help='repetições das listagens')
+    parser.add_argument('--limite', type=float, default=60.0,
+                        help='segundos de uma execução a partir dos quais os tamanhos maiores são ignorados')
+    parser.add_argument('--saida', help='arquivo JSON (padrão: saída padrão)')
+    parser.add_argument('--verboso', action='store_true', help='escreve o progresso na saída de erros')
+    args = parser.parse_args()
+
+    resultado = benchmark(args.implementacoes, args.tamanhos, args.densidades,
+                          args.semente, args.consultas, args.limite, args.verboso)
+    if args.saida is None:
+        json.dump(resultado, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.saida, 'w') as arquivo:
+            json.dump(resultado, arquivo, indent=2)
+
+
+if __name__ == '__main__':
+    main()
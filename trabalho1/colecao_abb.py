@@ -0,0 +1,867 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterator
+from conjunto_bits import ConjuntoBits, todas, figurinhas
+
+@dataclass
+class No:
+    '''
+    Um nó em uma árvore AVL (ABB balanceada) de figurinhas, com a quantidade
+    da figurinha e informações sobre a subárvore do nó.
+    '''
+    esq: Arvore
+    figurinha: int
+    quantidade: int
+    dir: Arvore
+    altura: int
+    distintas: int
+    repetidas: int
+    # *altura* é a altura da subárvore, *distintas* é o número de nós da
+    # subárvore e *repetidas* é o número de nós da subárvore com quantidade > 1
+
+# Árvore AVL de figurinhas
+Arvore = No | None
+
+class Colecao:
+    '''
+    Uma coleção com a quantidade de figurinhas (enumeradas) total 
+    de uma pessoa que possue algumas operações relacionadas
+    a trocas de figurinhas entre pessoas.
+    Exemplos
+    >>> c = Colecao(5)
+    >>> c.colecao_sem_repeticao()
+    '[]'
+    >>> c.colecao_com_repeticao()
+    '[]'
+    >>> c.insere(1)
+    >>> c.insere(1)
+    >>> c.insere(2)
+    >>> c.insere(2)
+    >>> c.insere(3)
+    >>> c.insere(3)
+    >>> c.insere(5)
+    >>> c.colecao_sem_repeticao()
+    '[1, 2, 3, 5]'
+    >>> c.colecao_com_repeticao()
+    '[1 (1), 2 (1), 3 (1)]'
+    >>> c.remove(1)
+    >>> c.remove(2)
+    >>> c.remove(5)
+    >>> c.colecao_sem_repeticao()
+    '[1, 2, 3]'
+    >>> c.colecao_com_repeticao()
+    '[3 (1)]'
+    '''
+    raiz: Arvore
+    # A coleção é uma árvore AVL ordenada pelas figurinhas, com um nó
+    # para cada figurinha presente (e sua quantidade total)
+    presentes: ConjuntoBits
+    repetidas: ConjuntoBits
+    # Conjuntos (veja conjunto_bits) com as figurinhas que estão na coleção
+    # e com as que estão repetidas, mantidos por *insere* e *remove*
+
+    def __init__(self, ultima_figurinha: int):
+        '''
+        Cria uma nova coleção com capacidade para armazenar até a *ultima_figurinha*
+        do álbum de figurinhas(desconsiderando as repetidas).
+        '''
+        self.ultima_figurinha = ultima_figurinha
+        self.raiz = None
+        self.presentes = ConjuntoBits(ultima_figurinha)
+        self.repetidas = ConjuntoBits(ultima_figurinha)
+
+
+    def insere(self, figurinha: int):
+        '''
+        Insere a *figurinha* na coleção de maneira que possa haver figurinhas repetidas.
+        Requer que a *figurinha* inserida faça parte do álbum.
+        Exemplos
+        >>> c = Colecao(10)
+        >>> for i in range(1, 11):
+        ...     c.insere(i)
+        >>> for i in range(3, 8):
+        ...     c.insere(i)
+        >>> c.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7, 8, 9, 10]'
+        >>> c.colecao_com_repeticao()
+        '[3 (1), 4 (1), 5 (1), 6 (1), 7 (1)]'
+        >>> c.insere(0)
+        Traceback (most recent call last):
+        ...
+        ValueError: figurinha não faz parte do álbum
+        '''
+        if figurinha < 1 or figurinha > self.ultima_figurinha:
+            raise ValueError('figurinha não faz parte do álbum')
+        self.raiz = insere_no(self.raiz, figurinha)
+        if figurinha not in self.presentes:
+            self.presentes.insere(figurinha)
+        else:
+            self.repetidas.insere(figurinha)
+
+
+    def remove(self, figurinha: int):
+        '''
+        Remove a *figurinha* da coleção de maneira que possa haver figurinha repetidas.
+        Requer que a *figurinha* removida faça parte do álbum.
+        Requer que a *figurinha* removida esteja na coleção(podendo ser única ou repetida).
+        Exemplos
+        >>> c = Colecao(10)
+        >>> for i in range(1, 11):
+        ...     c.insere(i)
+        >>> c.insere(2)
+        >>> c.insere(3)
+        >>> c.insere(2)
+        >>> c.remove(1)
+        >>> c.remove(5)
+        >>> c.colecao_sem_repeticao()
+        '[2, 3, 4, 6, 7, 8, 9, 10]'
+        >>> c.colecao_com_repeticao()
+        '[2 (2), 3 (1)]'
+        >>> c.remove(1)
+        Traceback (most recent call last):
+        ...
+        ValueError: figurinha não está na coleção
+        >>> c.remove(11)
+        Traceback (most recent call last):
+        ...
+        ValueError: figurinha não faz parte do álbum
+        '''
+        if figurinha < 1 or figurinha > self.ultima_figurinha:
+            raise ValueError('figurinha não faz parte do álbum')
+        if figurinha not in self.presentes:
+            raise ValueError('figurinha não está na coleção')
+        self.raiz = remove_no(self.raiz, figurinha)
+        no = busca_no(self.raiz, figurinha)
+        if no is None:
+            self.presentes.remove(figurinha)
+        elif no.quantidade == 1:
+            self.repetidas.remove(figurinha)
+
+
+    def colecao_sem_repeticao(self) -> str:
+        '''
+        Devolve uma lista com os elementos da coleção sem repetição.
+        Exemplos
+        >>> c = Colecao(5)
+        >>> c.colecao_sem_repeticao()
+        '[]'
+        >>> c.insere(2)
+        >>> for i in range(1, 6):
+        ...     c.insere(i)
+        >>> c.insere(1)
+        >>> c.insere(2)
+        >>> c.insere(3)
+        >>> c.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5]'
+        '''
+        return self.figurinhas_entre(1, self.ultima_figurinha)
+
+
+    def colecao_com_repeticao(self) -> str:
+        '''
+        Devolve uma lista com os elementos da coleção com repetição.
+        Exemplos
+        >>> c = Colecao(5)
+        >>> c.colecao_com_repeticao()
+        '[]'
+        >>> c.insere(2)
+        >>> for i in range(1, 6):
+        ...     c.insere(i)
+        >>> c.colecao_com_repeticao()
+        '[2 (1)]'
+        >>> c.insere(1)
+        >>> c.insere(2)
+        >>> c.insere(3)
+        >>> c.colecao_com_repeticao()
+        '[1 (1), 2 (2), 3 (1)]'
+        '''
+        return self.repetidas_entre(1, self.ultima_figurinha)
+
+
+    def quantidades(self) -> list[int]:
+        '''
+        Devolve uma lista com a quantidade total de cada figurinha da coleção
+        (a quantidade da figurinha 1 está na posição 0, a da figurinha 2 na posição 1, etc.).
+        Exemplos
+        >>> c = Colecao(5)
+        >>> c.quantidades()
+        [0, 0, 0, 0, 0]
+        >>> c.insere(4)
+        >>> c.insere(2)
+        >>> c.insere(4)
+        >>> c.quantidades()
+        [0, 1, 0, 2, 0]
+        '''
+        quantidades = [0] * self.ultima_figurinha
+        for no in em_ordem(self.raiz, 1, self.ultima_figurinha):
+            quantidades[no.figurinha - 1] = no.quantidade
+        return quantidades
+
+
+    def faltantes(self) -> str:
+        '''
+        Devolve uma lista com as figurinhas do álbum que não estão na coleção.
+        Exemplos
+        >>> c = Colecao(6)
+        >>> c.faltantes()
+        '[1, 2, 3, 4, 5, 6]'
+        >>> c.insere(2)
+        >>> c.insere(5)
+        >>> c.insere(5)
+        >>> c.faltantes()
+        '[1, 3, 4, 6]'
+        >>> c.remove(2)
+        >>> c.remove(5)
+        >>> c.faltantes()
+        '[1, 2, 3, 4, 6]'
+        '''
+        return str(figurinhas(todas(self.ultima_figurinha) & ~self.presentes.bits()))
+
+
+    def num_faltantes(self) -> int:
+        '''
+        Devolve o número de figurinhas do álbum que não estão na coleção.
+        Exemplos
+        >>> c = Colecao(6)
+        >>> c.num_faltantes()
+        6
+        >>> c.insere(2)
+        >>> c.insere(5)
+        >>> c.insere(5)
+        >>> c.num_faltantes()
+        4
+        >>> c.remove(5)
+        >>> c.num_faltantes()
+        4
+        '''
+        return self.ultima_figurinha - len(self.presentes)
+
+
+    def faltam_de(self, outra: Colecao) -> str:
+        '''
+        Devolve uma lista com as figurinhas que não estão na coleção e que
+        estão repetidas na *outra* coleção.
+        Requer que os álbuns sejam os mesmos(tamanhos iguais).
+        Exemplos
+        >>> c1 = Colecao(6)
+        >>> c2 = Colecao(6)
+        >>> for i in [1, 2, 2, 5]:
+        ...     c1.insere(i)
+        >>> for i in [1, 1, 3, 3, 4, 6, 6]:
+        ...     c2.insere(i)
+        >>> c1.faltam_de(c2)
+        '[3, 6]'
+        >>> c2.faltam_de(c1)
+        '[2]'
+        >>> c1.faltam_de(Colecao(5))
+        Traceback (most recent call last):
+        ...
+        ValueError: Álbuns diferentes
+        '''
+        if self.ultima_figurinha != outra.ultima_figurinha:
+            raise ValueError('Álbuns diferentes')
+        return str(figurinhas(outra.repetidas.bits() & ~self.presentes.bits()))
+
+
+    def figurinhas_entre(self, inicio: int, fim: int) -> str:
+        '''
+        Devolve uma lista com os elementos da coleção sem repetição que estão
+        entre *inicio* e *fim* (inclusive).
+        Exemplos
+        >>> c = Colecao(300)
+        >>> for i in [150, 99, 100, 200, 201, 120, 120]:
+        ...     c.insere(i)
+        >>> c.figurinhas_entre(100, 200)
+        '[100, 120, 150, 200]'
+        >>> c.figurinhas_entre(202, 300)
+        '[]'
+        '''
+        return str([no.figurinha for no in em_ordem(self.raiz, inicio, fim)])
+
+    def repetidas_entre(self, inicio: int, fim: int) -> str:
+        '''
+        Devolve uma lista com os elementos da coleção com repetição que estão
+        entre *inicio* e *fim* (inclusive).
+        Exemplos
+        >>> c = Colecao(300)
+        >>> for i in [150, 99, 99, 100, 200, 200, 200, 120, 150]:
+        ...     c.insere(i)
+        >>> c.repetidas_entre(100, 200)
+        '[150 (1), 200 (2)]'
+        >>> c.repetidas_entre(1, 99)
+        '[99 (1)]'
+        >>> c.repetidas_entre(201, 300)
+        '[]'
+        '''
+        colecao = '['
+        for no in em_ordem(self.raiz, inicio, fim, True):
+            if len(colecao) > 1:
+                colecao += ', '
+            colecao += str(no.figurinha) + ' (' + str(no.quantidade - 1) + ')'
+        colecao += ']'
+        return colecao
+
+    def num_figurinhas_entre(self, inicio: int, fim: int) -> int:
+        '''
+        Devolve o número de elementos da coleção sem repetição que estão
+        entre *inicio* e *fim* (inclusive).
+        Exemplos
+        >>> c = Colecao(300)
+        >>> for i in [150, 99, 100, 200, 201, 120, 120]:
+        ...     c.insere(i)
+        >>> c.num_figurinhas_entre(100, 200)
+        4
+        >>> c.num_figurinhas_entre(1, 300)
+        6
+        >>> c.num_figurinhas_entre(202, 300)
+        0
+        '''
+        if inicio > fim:
+            return 0
+        return conta_menores(self.raiz, fim + 1) - conta_menores(self.raiz, inicio)
+
+    def num_repetidas_entre(self, inicio: int, fim: int) -> int:
+        '''
+        Devolve o número de elementos da coleção com repetição que estão
+        entre *inicio* e *fim* (inclusive).
+        Exemplos
+        >>> c = Colecao(300)
+        >>> for i in [150, 99, 99, 100, 200, 200, 200, 120, 150]:
+        ...     c.insere(i)
+        >>> c.num_repetidas_entre(100, 200)
+        2
+        >>> c.num_repetidas_entre(1, 300)
+        3
+        '''
+        if inicio > fim:
+            return 0
+        return conta_menores(self.raiz, fim + 1, True) - conta_menores(self.raiz, inicio, True)
+
+    def sucessora(self, figurinha: int) -> int | None:
+        '''
+        Devolve a menor figurinha da coleção que é maior que *figurinha*,
+        ou None se ela não existe.
+        Exemplos
+        >>> c = Colecao(300)
+        >>> for i in [150, 99, 100, 200]:
+        ...     c.insere(i)
+        >>> c.sucessora(100)
+        150
+        >>> c.sucessora(1)
+        99
+        >>> c.sucessora(200) is None
+        True
+        '''
+        resposta = None
+        t = self.raiz
+        while t is not None:
+            if t.figurinha > figurinha:
+                resposta = t.figurinha
+                t = t.esq
+            else:
+                t = t.dir
+        return resposta
+
+    def antecessora(self, figurinha: int) -> int | None:
+        '''
+        Devolve a maior figurinha da coleção que é menor que *figurinha*,
+        ou None se ela não existe.
+        Exemplos
+        >>> c = Colecao(300)
+        >>> for i in [150, 99, 100, 200]:
+        ...     c.insere(i)
+        >>> c.antecessora(150)
+        100
+        >>> c.antecessora(300)
+        200
+        >>> c.antecessora(99) is None
+        True
+        '''
+        resposta = None
+        t = self.raiz
+        while t is not None:
+            if t.figurinha < figurinha:
+                resposta = t.figurinha
+                t = t.dir
+            else:
+                t = t.esq
+        return resposta
+
+
+    def troca_maxima(self, outra: Colecao):
+        '''
+        Realiza a troca máxima entre *self* e *outra* coleção, de modo que apenas
+        as figurinhas repetidas serão trocadas, e em ordem crescente.
+        Requer que os álbuns sejam os mesmos(tamanhos iguais).
+        Exemplos
+
+        # Teste com coleção *c1* possuindo uma repetida que *c2* não tem,
+        # *c2* possuindo 5 repetidas que *c1* não tem.
+        # (apenas 1 deve ser trocada).
+        # Além da troca de coleções vazias no começo.
+
+        >>> c1 = Colecao(10)
+        >>> c2 = Colecao(10)
+        >>> c1.troca_maxima(c2)
+        >>> c1.colecao_sem_repeticao()
+        '[]'
+        >>> c1.colecao_com_repeticao()
+        '[]'
+        >>> c2.colecao_sem_repeticao()
+        '[]'
+        >>> c2.colecao_com_repeticao()
+        '[]'
+        >>> for i in range(1, 3):
+        ...     c1.insere(i)
+        >>> c1.insere(1)
+        >>> c1.insere(2)
+        >>> c1.insere(2)
+        >>> c1.insere(8)
+        >>> for i in range(3, 8):
+        ...     c2.insere(i)
+        >>> c2.insere(1)
+        >>> c2.insere(1)
+        >>> c2.insere(3)
+        >>> c2.insere(3)
+        >>> c2.insere(5)
+        >>> c2.insere(5)
+        >>> c2.insere(6)
+        >>> c1.colecao_sem_repeticao()
+        '[1, 2, 8]'
+        >>> c1.colecao_com_repeticao()
+        '[1 (1), 2 (2)]'
+        >>> c2.colecao_sem_repeticao()
+        '[1, 3, 4, 5, 6, 7]'
+        >>> c2.colecao_com_repeticao()
+        '[1 (1), 3 (2), 5 (2), 6 (1)]'
+        >>> c1.troca_maxima(c2)
+        >>> c1.colecao_sem_repeticao()
+        '[1, 2, 3, 8]'
+        >>> c1.colecao_com_repeticao()
+        '[1 (1), 2 (1)]'
+        >>> c2.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7]'
+        >>> c2.colecao_com_repeticao()
+        '[1 (1), 3 (1), 5 (2), 6 (1)]'
+
+        # Teste com coleção *c3* possuindo as mesmas repetidas que *c4*
+        # (nada deve ser trocado).
+
+        >>> c3 = Colecao(20)
+        >>> c4 = Colecao(20)
+        >>> for i in range(1, 8):
+        ...     c3.insere(i)
+        >>> c3.insere(1)
+        >>> c3.insere(2)
+        >>> c3.insere(2)
+        >>> c3.insere(3)
+        >>> c3.insere(4)
+        >>> for i in range(1, 14):
+        ...     c4.insere(i)
+        >>> c4.insere(1)
+        >>> c4.insere(2)
+        >>> c4.insere(2)
+        >>> c4.insere(3)
+        >>> c4.insere(4)
+        >>> c3.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7]'
+        >>> c3.colecao_com_repeticao()
+        '[1 (1), 2 (2), 3 (1), 4 (1)]'
+        >>> c4.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13]'
+        >>> c4.colecao_com_repeticao()
+        '[1 (1), 2 (2), 3 (1), 4 (1)]'
+        >>> c3.troca_maxima(c4)
+        >>> c3.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7]'
+        >>> c3.colecao_com_repeticao()
+        '[1 (1), 2 (2), 3 (1), 4 (1)]'
+        >>> c4.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13]'
+        >>> c4.colecao_com_repeticao()
+        '[1 (1), 2 (2), 3 (1), 4 (1)]'
+
+        # Teste com coleção *c6* possuindo figurinhas repetidas que *c5* não tem,
+        # porém possuindo as repetidas que *c5* tem(nada deve ser trocado).
+
+        >>> c5 = Colecao(20)
+        >>> c6 = Colecao(20)
+        >>> for i in range(1, 8):
+        ...     c5.insere(i)
+        >>> c5.insere(1)
+        >>> c5.insere(2)
+        >>> c5.insere(2)
+        >>> for i in range(1, 10):
+        ...     c6.insere(i)
+        >>> c6.insere(1)
+        >>> c6.insere(2)
+        >>> c6.insere(8)
+        >>> c6.insere(9)
+        >>> c5.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7]'
+        >>> c5.colecao_com_repeticao()
+        '[1 (1), 2 (2)]'
+        >>> c6.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7, 8, 9]'
+        >>> c6.colecao_com_repeticao()
+        '[1 (1), 2 (1), 8 (1), 9 (1)]'
+        >>> c5.troca_maxima(c6)
+        >>> c5.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7]'
+        >>> c5.colecao_com_repeticao()
+        '[1 (1), 2 (2)]'
+        >>> c6.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7, 8, 9]'
+        >>> c6.colecao_com_repeticao()
+        '[1 (1), 2 (1), 8 (1), 9 (1)]'
+
+        # Teste com coleção *c7* possuindo apenas a figurinha 1(repetida 3 vezes)
+        # e *c8* possuindo apenas a figurinha 2(repetida 1 vez)
+        # (apenas 1 deve ser trocada).
+
+        >>> c7 = Colecao(20)
+        >>> c8 = Colecao(20)
+        >>> c7.insere(1)
+        >>> c7.insere(1)
+        >>> c7.insere(1)
+        >>> c7.insere(1)
+        >>> c8.insere(2)
+        >>> c8.insere(2)
+        >>> c7.colecao_sem_repeticao()
+        '[1]'
+        >>> c7.colecao_com_repeticao()
+        '[1 (3)]'
+        >>> c8.colecao_sem_repeticao()
+        '[2]'
+        >>> c8.colecao_com_repeticao()
+        '[2 (1)]'
+        >>> c7.troca_maxima(c8)
+        >>> c7.colecao_sem_repeticao()
+        '[1, 2]'
+        >>> c7.colecao_com_repeticao()
+        '[1 (2)]'
+        >>> c8.colecao_sem_repeticao()
+        '[1, 2]'
+        >>> c8.colecao_com_repeticao()
+        '[]'
+
+        # Teste com a coleção *c9* e *c10* não possuindo figurinhas repetidas
+        # (nada deve ser trocado).
+
+        >>> c9 = Colecao(20)
+        >>> c10 = Colecao(20)
+        >>> for i in range(1, 8):
+        ...     c9.insere(i)
+        >>> for i in range(1, 10):
+        ...     c10.insere(i)
+        >>> c9.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7]'
+        >>> c9.colecao_com_repeticao()
+        '[]'
+        >>> c10.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7, 8, 9]'
+        >>> c10.colecao_com_repeticao()
+        '[]'
+        >>> c9.troca_maxima(c10)
+        >>> c9.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7]'
+        >>> c9.colecao_com_repeticao()
+        '[]'
+        >>> c10.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7, 8, 9]'
+
+        # Teste com coleção *c11* e *c12* possuindo figurinhas repetidas que o outro
+        já possui(nada deve ser trocado).
+
+        >>> c11 = Colecao(20)
+        >>> c12 = Colecao(20)
+        >>> for i in range(1, 8):
+        ...     c11.insere(i)
+        >>> c11.insere(1)
+        >>> c11.insere(4)
+        >>> for i in range(1, 10):
+        ...     c12.insere(i)
+        >>> c12.insere(1)
+        >>> c12.insere(3)
+        >>> c11.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7]'
+        >>> c11.colecao_com_repeticao()
+        '[1 (1), 4 (1)]'
+        >>> c12.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7, 8, 9]'
+        >>> c12.colecao_com_repeticao()
+        '[1 (1), 3 (1)]'
+        >>> c11.troca_maxima(c12)
+        >>> c11.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7]'
+        >>> c11.colecao_com_repeticao()
+        '[1 (1), 4 (1)]'
+        >>> c12.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7, 8, 9]'
+        >>> c12.colecao_com_repeticao()
+        '[1 (1), 3 (1)]'
+
+        # Teste com coleção *c13* e *c14* possuindo 3 figurinhas disponíveis para troca
+
+        >>> c13 = Colecao(20)
+        >>> c14 = Colecao(20)
+        >>> c13.insere(3)
+        >>> c13.insere(2)
+        >>> c13.insere(1)
+        >>> c13.insere(2)        
+        >>> c13.insere(5)
+        >>> c13.insere(1)
+        >>> c13.insere(5)
+        >>> c14.insere(4)
+        >>> c14.insere(8)
+        >>> c14.insere(4)
+        >>> c14.insere(3)
+        >>> c14.insere(8)
+        >>> c14.insere(7)
+        >>> c14.insere(4)
+        >>> c14.insere(6)
+        >>> c14.insere(7)
+        >>> c14.insere(6)
+        >>> c13.colecao_sem_repeticao()
+        '[1, 2, 3, 5]'
+        >>> c13.colecao_com_repeticao()
+        '[1 (1), 2 (1), 5 (1)]'
+        >>> c14.colecao_sem_repeticao()
+        '[3, 4, 6, 7, 8]'
+        >>> c14.colecao_com_repeticao()
+        '[4 (2), 6 (1), 7 (1), 8 (1)]'
+        >>> c13.troca_maxima(c14)
+        >>> c13.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7]'
+        >>> c13.colecao_com_repeticao()
+        '[]'
+        >>> c14.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 5, 6, 7, 8]'
+        >>> c14.colecao_com_repeticao()
+        '[4 (1), 8 (1)]'
+
+        # Teste com álbum *c3* sendo diferente do álbum *c2*
+
+        >>> c3.troca_maxima(c2)
+        Traceback (most recent call last):
+        ...
+        ValueError: Álbuns diferentes
+        '''
+        if self.ultima_figurinha != outra.ultima_figurinha:
+            raise ValueError('Álbuns diferentes')
+
+        # Figurinhas repetidas de cada coleção que a outra coleção não tem
+        trocaveis_self = figurinhas(self.repetidas.bits() & ~outra.presentes.bits())
+        trocaveis_outra = figurinhas(outra.repetidas.bits() & ~self.presentes.bits())
+
+        # Troca as figurinhas repetidas de *self* com as figurinhas repetidas de *outra*
+        for dada, recebida in zip(trocaveis_self, trocaveis_outra):
+            self.remove(dada)
+            outra.remove(recebida)
+            self.insere(recebida)
+            outra.insere(dada)
+
+# Funções auxiliares para manter a árvore AVL
+
+def altura(t: Arvore) -> int:
+    '''
+    Devolve a altura da árvore *t* (-1 se *t* é vazia).
+    '''
+    return -1 if t is None else t.altura
+
+def distintas(t: Arvore) -> int:
+    '''
+    Devolve o número de nós da árvore *t*.
+    '''
+    return 0 if t is None else t.distintas
+
+def repetidas(t: Arvore) -> int:
+    '''
+    Devolve o número de nós com quantidade > 1 da árvore *t*.
+    '''
+    return 0 if t is None else t.repetidas
+
+def atualiza(t: No):
+    '''
+    Recalcula a altura, o número de nós e o número de nós repetidos
+    da subárvore *t* a partir dos seus filhos.
+    '''
+    t.altura = 1 + max(altura(t.esq), altura(t.dir))
+    t.distintas = 1 + distintas(t.esq) + distintas(t.dir)
+    t.repetidas = (1 if t.quantidade > 1 else 0) + repetidas(t.esq) + repetidas(t.dir)
+
+def rotaciona_direita(t: No) -> No:
+    '''
+    Rotaciona a árvore *t* para a direita e devolve a nova raiz.
+    '''
+    e = t.esq
+    assert e is not None
+    t.esq = e.dir
+    e.dir = t
+    atualiza(t)
+    atualiza(e)
+    return e
+
+def rotaciona_esquerda(t: No) -> No:
+    '''
+    Rotaciona a árvore *t* para a esquerda e devolve a nova raiz.
+    '''
+    d = t.dir
+    assert d is not None
+    t.dir = d.esq
+    d.esq = t
+    atualiza(t)
+    atualiza(d)
+    return d
+
+def balanceia(t: No) -> No:
+    '''
+    Atualiza *t* e o rotaciona, se necessário, para que a diferença entre as
+    alturas das suas subárvores seja no máximo 1. Devolve a nova raiz.
+    Requer que as subárvores de *t* sejam árvores AVL.
+    '''
+    atualiza(t)
+    fator = altura(t.esq) - altura(t.dir)
+    if fator > 1:
+        assert t.esq is not None
+        if altura(t.esq.esq) < altura(t.esq.dir):
+            t.esq = rotaciona_esquerda(t.esq)
+        return rotaciona_direita(t)
+    if fator < -1:
+        assert t.dir is not None
+        if altura(t.dir.dir) < altura(t.dir.esq):
+            t.dir = rotaciona_direita(t.dir)
+        return rotaciona_esquerda(t)
+    return t
+
+def insere_no(t: Arvore, figurinha: int) -> No:
+    '''
+    Insere uma cópia da *figurinha* na árvore *t* e devolve a nova raiz.
+    Exemplos
+    >>> t = None
+    >>> for i in range(1, 8):
+    ...     t = insere_no(t, i)
+    >>> t = insere_no(t, 3)
+    >>> t.figurinha, t.altura, t.distintas, t.repetidas
+    (4, 2, 7, 1)
+    >>> [(no.figurinha, no.quantidade) for no in em_ordem(t, 2, 4)]
+    [(2, 1), (3, 2), (4, 1)]
+    '''
+    if t is None:
+        return No(None, figurinha, 1, None, 0, 1, 0)
+    if figurinha == t.figurinha:
+        t.quantidade += 1
+        atualiza(t)
+        return t
+    if figurinha < t.figurinha:
+        t.esq = insere_no(t.esq, figurinha)
+    else:
+        t.dir = insere_no(t.dir, figurinha)
+    return balanceia(t)
+
+def remove_no(t: Arvore, figurinha: int) -> Arvore:
+    '''
+    Remove uma cópia da *figurinha* da árvore *t* e devolve a nova raiz.
+    O nó da *figurinha* é removido quando não sobra nenhuma cópia.
+    Requer que a *figurinha* esteja na árvore.
+    Exemplos
+    >>> t = None
+    >>> for i in [4, 2, 6, 1, 3, 5, 7, 3]:
+    ...     t = insere_no(t, i)
+    >>> t = remove_no(t, 3)
+    >>> t = remove_no(t, 4)
+    >>> t = remove_no(t, 3)
+    >>> [no.figurinha for no in em_ordem(t, 1, 7)]
+    [1, 2, 5, 6, 7]
+    >>> t.distintas, t.repetidas
+    (5, 0)
+    '''
+    assert t is not None
+    if figurinha < t.figurinha:
+        t.esq = remove_no(t.esq, figurinha)
+    elif figurinha > t.figurinha:
+        t.dir = remove_no(t.dir, figurinha)
+    elif t.quantidade > 1:
+        t.quantidade -= 1
+        atualiza(t)
+        return t
+    elif t.esq is None:
+        return t.dir
+    elif t.dir is None:
+        return t.esq
+    else:
+        # Substitui o nó pelo menor nó da subárvore direita
+        menor = t.dir
+        while menor.esq is not None:
+            menor = menor.esq
+        t.figurinha = menor.figurinha
+        t.quantidade = menor.quantidade
+        t.dir = remove_menor(t.dir)
+    return balanceia(t)
+
+def remove_menor(t: No) -> Arvore:
+    '''
+    Remove o nó com a menor figurinha da árvore *t* e devolve a nova raiz.
+    '''
+    if t.esq is None:
+        return t.dir
+    t.esq = remove_menor(t.esq)
+    return balanceia(t)
+
+def busca_no(t: Arvore, figurinha: int) -> No | None:
+    '''
+    Devolve o nó da *figurinha* na árvore *t*, ou None se ela não está na árvore.
+    '''
+    while t is not None and t.figurinha != figurinha:
+        if figurinha < t.figurinha:
+            t = t.esq
+        else:
+            t = t.dir
+    return t
+
+# Funções auxiliares para as consultas por intervalo
+
+def em_ordem(t: Arvore, inicio: int, fim: int, so_repetidas: bool = False) -> Iterator[No]:
+    '''
+    Devolve, em ordem crescente, os nós da árvore *t* com figurinhas entre
+    *inicio* e *fim* (inclusive), ou apenas os com quantidade > 1 se
+    *so_repetidas* for True. As subárvores fora do intervalo (ou sem
+    repetidas, se *so_repetidas* for True) não são percorridas.
+    '''
+    pilha: list[No] = []
+    atual = t
+    while True:
+        # Desce pela esquerda, empilhando os nós que podem estar no intervalo
+        while atual is not None:
+            if so_repetidas and atual.repetidas == 0:
+                atual = None
+            elif atual.figurinha < inicio:
+                atual = atual.dir
+            else:
+                pilha.append(atual)
+                atual = atual.esq
+        if len(pilha) == 0:
+            return
+        no = pilha.pop()
+        if no.figurinha > fim:
+            return
+        if not so_repetidas or no.quantidade > 1:
+            yield no
+        atual = no.dir
+
+def conta_menores(t: Arvore, figurinha: int, so_repetidas: bool = False) -> int:
+    '''
+    Devolve o número de nós da árvore *t* com figurinhas menores que
+    *figurinha* (apenas os com quantidade > 1 se *so_repetidas* for True).
+    '''
+    total = 0
+    while t is not None:
+        if t.figurinha < figurinha:
+            if so_repetidas:
+                total += repetidas(t.esq) + (1 if t.quantidade > 1 else 0)
+            else:
+                total += distintas(t.esq) + 1
+            t = t.dir
+        else:
+            t = t.esq
+    return total
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from ed import array
+from conjunto_bits import ConjuntoBits, todas, figurinhas
 
 class Colecao:
     '''
@@ -35,6 +36,10 @@ class Colecao:
     # A coleção funciona de maneira que possui a quantidade de figurinhas
     # total de cada figurinha
     # (a figurinha 1 está na posição 0, a figurinha 2 na posição 1, etc.)
+    presentes: ConjuntoBits
+    repetidas: ConjuntoBits
+    # Conjuntos (veja conjunto_bits) com as figurinhas que estão na coleção
+    # e com as que estão repetidas, mantidos por *insere* e *remove*
 
     def __init__(self, ultima_figurinha: int):
         '''
@@ -42,6 +47,8 @@ class Colecao:
         do álbum de figurinhas(desconsiderando as repetidas).
         '''
         self.colecao = array(ultima_figurinha, 0)
+        self.presentes = ConjuntoBits(ultima_figurinha)
+        self.repetidas = ConjuntoBits(ultima_figurinha)
 
 
     def insere(self, figurinha: int):
@@ -66,6 +73,10 @@ class Colecao:
         if figurinha < 1 or figurinha > len(self.colecao):
             raise ValueError('figurinha não faz parte do álbum')
         self.colecao[figurinha-1] += 1
+        if self.colecao[figurinha-1] == 1:
+            self.presentes.insere(figurinha)
+        elif self.colecao[figurinha-1] == 2:
+            self.repetidas.insere(figurinha)
 
 
     def remove(self, figurinha: int):
@@ -100,6 +111,10 @@ class Colecao:
         if self.colecao[figurinha-1] == 0:
             raise ValueError('figurinha não está na coleção')
         self.colecao[figurinha-1] -= 1
+        if self.colecao[figurinha-1] == 0:
+            self.presentes.remove(figurinha)
+        elif self.colecao[figurinha-1] == 1:
+            self.repetidas.remove(figurinha)
 
 
     def colecao_sem_repeticao(self) -> str:
@@ -154,6 +169,84 @@ class Colecao:
         colecao += ']'
         return colecao
 
+    def quantidades(self) -> list[int]:
+        '''
+        Devolve uma lista com a quantidade total de cada figurinha da coleção
+        (a quantidade da figurinha 1 está na posição 0, a da figurinha 2 na posição 1, etc.).
+        Exemplos
+        >>> c = Colecao(5)
+        >>> c.quantidades()
+        [0, 0, 0, 0, 0]
+        >>> c.insere(4)
+        >>> c.insere(2)
+        >>> c.insere(4)
+        >>> c.quantidades()
+        [0, 1, 0, 2, 0]
+        '''
+        return list(self.colecao)
+
+    def faltantes(self) -> str:
+        '''
+        Devolve uma lista com as figurinhas do álbum que não estão na coleção.
+        Exemplos
+        >>> c = Colecao(6)
+        >>> c.faltantes()
+        '[1, 2, 3, 4, 5, 6]'
+        >>> c.insere(2)
+        >>> c.insere(5)
+        >>> c.insere(5)
+        >>> c.faltantes()
+        '[1, 3, 4, 6]'
+        >>> c.remove(2)
+        >>> c.remove(5)
+        >>> c.faltantes()
+        '[1, 2, 3, 4, 6]'
+        '''
+        return str(figurinhas(todas(len(self.colecao)) & ~self.presentes.bits()))
+
+    def num_faltantes(self) -> int:
+        '''
+        Devolve o número de figurinhas do álbum que não estão na coleção.
+        Exemplos
+        >>> c = Colecao(6)
+        >>> c.num_faltantes()
+        6
+        >>> c.insere(2)
+        >>> c.insere(5)
+        >>> c.insere(5)
+        >>> c.num_faltantes()
+        4
+        >>> c.remove(5)
+        >>> c.num_faltantes()
+        4
+        '''
+        return len(self.colecao) - len(self.presentes)
+
+    def faltam_de(self, outra: Colecao) -> str:
+        '''
+        Devolve uma lista com as figurinhas que não estão na coleção e que
+        estão repetidas na *outra* coleção.
+        Requer que os álbuns sejam os mesmos(tamanhos iguais).
+        Exemplos
+        >>> c1 = Colecao(6)
+        >>> c2 = Colecao(6)
+        >>> for i in [1, 2, 2, 5]:
+        ...     c1.insere(i)
+        >>> for i in [1, 1, 3, 3, 4, 6, 6]:
+        ...     c2.insere(i)
+        >>> c1.faltam_de(c2)
+        '[3, 6]'
+        >>> c2.faltam_de(c1)
+        '[2]'
+        >>> c1.faltam_de(Colecao(5))
+        Traceback (most recent call last):
+        ...
+        ValueError: Álbuns diferentes
+        '''
+        if len(self.colecao) != len(outra.colecao):
+            raise ValueError('Álbuns diferentes')
+        return str(figurinhas(outra.repetidas.bits() & ~self.presentes.bits()))
+
     def troca_maxima(self, outra: Colecao):
         '''
         Realiza a troca máxima entre *self* e *outra* coleção, de modo que apenas
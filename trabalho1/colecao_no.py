@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from conjunto_bits import ConjuntoBits, todas, figurinhas
 
 @dataclass
 class No:
@@ -39,6 +40,10 @@ class Colecao:
     '''
     inicio: No | None
     fim: No | None
+    presentes: ConjuntoBits
+    repetidas: ConjuntoBits
+    # Conjuntos (veja conjunto_bits) com as figurinhas que estão na coleção
+    # e com as que estão repetidas, mantidos por *insere* e *remove*
 
     def __init__(self, ultima_figurinha: int) -> None:
         '''
@@ -48,6 +53,8 @@ class Colecao:
         self.ultima_figurinha = ultima_figurinha
         self.inicio = None
         self.fim = None
+        self.presentes = ConjuntoBits(ultima_figurinha)
+        self.repetidas = ConjuntoBits(ultima_figurinha)
 
     def insere(self, figurinha: int):
         '''
@@ -77,6 +84,10 @@ class Colecao:
             self.fim.prox = No(figurinha, None)
             self.fim = self.fim.prox
         ordena_no(self.inicio)
+        if figurinha not in self.presentes:
+            self.presentes.insere(figurinha)
+        else:
+            self.repetidas.insere(figurinha)
 
     def remove(self, figurinha: int):
         '''
@@ -110,10 +121,17 @@ class Colecao:
         Traceback (most recent call last):
         ...
         ValueError: figurinha não faz parte do álbum
+
+        # Remoção do último nó do encadeamento
+
+        >>> c.remove(10)
+        >>> c.insere(1)
+        >>> c.colecao_sem_repeticao()
+        '[1, 2, 3, 4, 6, 7, 8, 9]'
         '''
         if figurinha < 1 or figurinha > self.ultima_figurinha:
             raise ValueError('figurinha não faz parte do álbum')
-        if not encontra_figurinha(self.inicio, figurinha):
+        if figurinha not in self.presentes:
             raise ValueError('figurinha não está na coleção')
         atual = self.inicio
         anterior = None
@@ -124,7 +142,14 @@ class Colecao:
                 else:
                     anterior.prox = atual.prox
                 if atual.prox is None:
-                    self.fim = None
+                    self.fim = anterior
+                # Como o encadeamento está ordenado, as outras cópias da
+                # figurinha (se existirem) estão logo depois do nó removido
+                restantes = atual.prox
+                if restantes is None or restantes.item != figurinha:
+                    self.presentes.remove(figurinha)
+                elif restantes.prox is None or restantes.prox.item != figurinha:
+                    self.repetidas.remove(figurinha)
                 break
             anterior = atual
             atual = atual.prox
@@ -191,6 +216,89 @@ class Colecao:
         colecao += ']'
         return colecao
 
+    def quantidades(self) -> list[int]:
+        '''
+        Devolve uma lista com a quantidade total de cada figurinha da coleção
+        (a quantidade da figurinha 1 está na posição 0, a da figurinha 2 na posição 1, etc.).
+        Exemplos
+        >>> c = Colecao(5)
+        >>> c.quantidades()
+        [0, 0, 0, 0, 0]
+        >>> c.insere(4)
+        >>> c.insere(2)
+        >>> c.insere(4)
+        >>> c.quantidades()
+        [0, 1, 0, 2, 0]
+        '''
+        quantidades = [0] * self.ultima_figurinha
+        atual = self.inicio
+        while atual is not None:
+            quantidades[atual.item - 1] += 1
+            atual = atual.prox
+        return quantidades
+
+    def faltantes(self) -> str:
+        '''
+        Devolve uma lista com as figurinhas do álbum que não estão na coleção.
+        Exemplos
+        >>> c = Colecao(6)
+        >>> c.faltantes()
+        '[1, 2, 3, 4, 5, 6]'
+        >>> c.insere(2)
+        >>> c.insere(5)
+        >>> c.insere(5)
+        >>> c.faltantes()
+        '[1, 3, 4, 6]'
+        >>> c.remove(2)
+        >>> c.remove(5)
+        >>> c.faltantes()
+        '[1, 2, 3, 4, 6]'
+        '''
+        return str(figurinhas(todas(self.ultima_figurinha) & ~self.presentes.bits()))
+
+    def num_faltantes(self) -> int:
+        '''
+        Devolve o número de figurinhas do álbum que não estão na coleção.
+        Exemplos
+        >>> c = Colecao(6)
+        >>> c.num_faltantes()
+        6
+        >>> c.insere(2)
+        >>> c.insere(5)
+        >>> c.insere(5)
+        >>> c.num_faltantes()
+        4
+        >>> c.remove(5)
+        >>> c.num_faltantes()
+        4
+        '''
+        return self.ultima_figurinha - len(self.presentes)
+
+    def faltam_de(self, outra: Colecao) -> str:
+        '''
+        Devolve uma lista com as figurinhas que não estão na coleção e que
+        estão repetidas na *outra* coleção.
+        Requer que os álbuns sejam os mesmos(tamanhos iguais).
+        Exemplos
+        >>> c1 = Colecao(6)
+        >>> c2 = Colecao(6)
+        >>> for i in [1, 2, 2, 5]:
+        ...     c1.insere(i)
+        >>> for i in [1, 1, 3, 3, 4, 6, 6]:
+        ...     c2.insere(i)
+        >>> c1.faltam_de(c2)
+        '[3, 6]'
+        >>> c2.faltam_de(c1)
+        '[2]'
+        >>> c1.faltam_de(Colecao(5))
+        Traceback (most recent call last):
+        ...
+        ValueError: Álbuns diferentes
+        '''
+        if self.ultima_figurinha != outra.ultima_figurinha:
+            raise ValueError('Álbuns diferentes')
+        return str(figurinhas(outra.repetidas.bits() & ~self.presentes.bits()))
+
     def troca_maxima(self, outra: Colecao):
         '''
         Realiza a troca máxima entre *self* e *outra* coleção, de modo que apenas
@@ -127,6 +127,82 @@ class Colecao:
         '''
 
 
+    def quantidades(self) -> list[int]:
+        '''
+        Devolve uma lista com a quantidade total de cada figurinha da coleção
+        (a quantidade da figurinha 1 está na posição 0, a da figurinha 2 na posição 1, etc.).
+        Exemplos
+        >>> c = Colecao(5)
+        >>> c.quantidades()
+        [0, 0, 0, 0, 0]
+        >>> c.insere(4)
+        >>> c.insere(2)
+        >>> c.insere(4)
+        >>> c.quantidades()
+        [0, 1, 0, 2, 0]
+        '''
+
+
+    def faltantes(self) -> str:
+        '''
+        Devolve uma lista com as figurinhas do álbum que não estão na coleção.
+        Exemplos
+        >>> c = Colecao(6)
+        >>> c.faltantes()
+        '[1, 2, 3, 4, 5, 6]'
+        >>> c.insere(2)
+        >>> c.insere(5)
+        >>> c.insere(5)
+        >>> c.faltantes()
+        '[1, 3, 4, 6]'
+        >>> c.remove(2)
+        >>> c.remove(5)
+        >>> c.faltantes()
+        '[1, 2, 3, 4, 6]'
+        '''
+
+
+    def num_faltantes(self) -> int:
+        '''
+        Devolve o número de figurinhas do álbum que não estão na coleção.
+        Exemplos
+        >>> c = Colecao(6)
+        >>> c.num_faltantes()
+        6
+        >>> c.insere(2)
+        >>> c.insere(5)
+        >>> c.insere(5)
+        >>> c.num_faltantes()
+        4
+        >>> c.remove(5)
+        >>> c.num_faltantes()
+        4
+        '''
+
+
+    def faltam_de(self, outra: Colecao) -> str:
+        '''
+        Devolve uma lista com as figurinhas que não estão na coleção e que
+        estão repetidas na *outra* coleção.
+        Requer que os álbuns sejam os mesmos(tamanhos iguais).
+        Exemplos
+        >>> c1 = Colecao(6)
+        >>> c2 = Colecao(6)
+        >>> for i in [1, 2, 2, 5]:
+        ...     c1.insere(i)
+        >>> for i in [1, 1, 3, 3, 4, 6, 6]:
+        ...     c2.insere(i)
+        >>> c1.faltam_de(c2)
+        '[3, 6]'
+        >>> c2.faltam_de(c1)
+        '[2]'
+        >>> c1.faltam_de(Colecao(5))
+        Traceback (most recent call last):
+        ...
+        ValueError: Álbuns diferentes
+        '''
+
+
     def troca_maxima(self, outra: Colecao):
         '''
         Realiza a troca máxima entre *self* e *outra* coleção, de modo que apenas
@@ -0,0 +1,137 @@
+from __future__ import annotations
+from array import array
+import sys
+
+# Conjuntos de figurinhas representados por inteiros, onde o bit i
+# representa a figurinha i+1. As operações entre conjuntos (&, |, ~) e a
+# contagem de elementos (int.bit_count) trabalham com vários bits por vez.
+#
+# Os inteiros do Python são imutáveis, e alterar um bit de um inteiro cria
+# um inteiro novo, em tempo proporcional ao tamanho do álbum. Por isso os
+# conjuntos alterados a cada inserção e remoção são mantidos em um
+# ConjuntoBits, que altera uma palavra de 64 bits por operação, e só são
+# convertidos para inteiros nas consultas.
+
+
+def bit(figurinha: int) -> int:
+    '''
+    Devolve o conjunto que contém apenas a *figurinha*.
+    Exemplos
+    >>> bin(bit(1))
+    '0b1'
+    >>> bin(bit(4))
+    '0b1000'
+    '''
+    return 1 << (figurinha - 1)
+
+
+def todas(ultima_figurinha: int) -> int:
+    '''
+    Devolve o conjunto com todas as figurinhas de 1 até *ultima_figurinha*.
+    Exemplos
+    >>> bin(todas(0))
+    '0b0'
+    >>> bin(todas(5))
+    '0b11111'
+    '''
+    return (1 << ultima_figurinha) - 1
+
+
+def figurinhas(bits: int) -> list[int]:
+    '''
+    Devolve em ordem crescente as figurinhas do conjunto *bits*.
+    Requer que *bits* não seja negativo.
+    Exemplos
+    >>> figurinhas(0)
+    []
+    >>> figurinhas(0b101101)
+    [1, 3, 4, 6]
+    '''
+    # A representação binária invertida tem o bit da figurinha 1 na posição 0
+    digitos = bin(bits)[:1:-1]
+    resultado = []
+    i = digitos.find('1')
+    while i != -1:
+        resultado.append(i + 1)
+        i = digitos.find('1', i + 1)
+    return resultado
+
+
+class ConjuntoBits:
+    '''
+    Um conjunto de figurinhas de 1 até *ultima_figurinha* mantido em um
+    arranjo de palavras de 64 bits (a palavra j tem os bits 64j até 64j + 63),
+    que pode ser alterado em tempo constante.
+    Exemplos
+    >>> s = ConjuntoBits(100)
+    >>> s.insere(3)
+    >>> s.insere(70)
+    >>> s.insere(3)
+    >>> len(s), 3 in s, 4 in s
+    (2, True, False)
+    >>> figurinhas(s.bits())
+    [3, 70]
+    >>> s.remove(3)
+    >>> s.remove(5)
+    >>> len(s), figurinhas(s.bits())
+    (1, [70])
+    '''
+    ultima_figurinha: int
+    palavras: array
+    tamanho: int
+    # O número de figurinhas do conjunto, mantido por *insere* e *remove*
+
+    def __init__(self, ultima_figurinha: int):
+        '''
+        Cria um conjunto vazio para as figurinhas de 1 até *ultima_figurinha*.
+        '''
+        self.ultima_figurinha = ultima_figurinha
+        self.palavras = array('Q', bytes(8 * ((ultima_figurinha + 63) // 64)))
+        self.tamanho = 0
+
+    def __len__(self) -> int:
+        return self.tamanho
+
+    def __contains__(self, figurinha: int) -> bool:
+        i = figurinha - 1
+        return self.palavras[i >> 6] >> (i & 63) & 1 == 1
+
+    def insere(self, figurinha: int):
+        '''
+        Insere a *figurinha* no conjunto, se ela ainda não está no conjunto.
+        '''
+        i = figurinha - 1
+        mascara = 1 << (i & 63)
+        palavras = self.palavras
+        if palavras[i >> 6] & mascara == 0:
+            palavras[i >> 6] |= mascara
+            self.tamanho += 1
+
+    def remove(self, figurinha: int):
+        '''
+        Remove a *figurinha* do conjunto, se ela está no conjunto.
+        '''
+        i = figurinha - 1
+        mascara = 1 << (i & 63)
+        palavras = self.palavras
+        if palavras[i >> 6] & mascara != 0:
+            palavras[i >> 6] ^= mascara
+            self.tamanho -= 1
+
+    def bits(self) -> int:
+        '''
+        Devolve o conjunto representado por um inteiro, em tempo proporcional
+        ao tamanho do álbum.
+        Exemplos
+        >>> s = ConjuntoBits(200)
+        >>> s.insere(1)
+        >>> s.insere(130)
+        >>> s.bits() == bit(1) | bit(130)
+        True
+        '''
+        palavras = self.palavras
+        if sys.byteorder == 'big':
+            # A palavra 0 tem os bits menos significativos
+            palavras = array('Q', palavras)
+            palavras.byteswap()
+        return int.from_bytes(palavras.tobytes(), 'little')
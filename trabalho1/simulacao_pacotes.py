@@ -0,0 +1,263 @@
+from __future__ import annotations
+from dataclasses import dataclass
+import math
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Modelo da simulação
+#
+# Cada pacote tem *figurinhas_por_pacote* figurinhas sorteadas uniformemente
+# (com reposição) entre as figurinhas do álbum. Como todas as figurinhas têm a
+# mesma chance de serem sorteadas, o estado de um ensaio é dado apenas por
+# quantas figurinhas faltam e quantas repetidas estão sobrando, e não por
+# quais figurinhas são. Assim, o número de sorteios até a próxima figurinha
+# nova segue uma distribuição geométrica com probabilidade faltam / total, e
+# cada ensaio é simulado com um passo por figurinha faltante, não um por
+# sorteio. Os passos são feitos para todos os ensaios de uma vez.
+#
+# Se *repetidas_por_troca* não for None, a cada *repetidas_por_troca*
+# repetidas acumuladas uma delas é trocada (com outras pessoas) por uma
+# figurinha faltante, assim que possível. Para isso, um passo avança no
+# máximo os sorteios até a próxima troca: se a figurinha nova não aparece
+# nesses sorteios (todos repetidas), a troca é feita e o sorteio recomeça.
+# Como a distribuição geométrica não tem memória, recomeçar não altera o
+# resultado.
+
+
+@dataclass
+class Estatisticas:
+    '''
+    Estatísticas do número de pacotes abertos até completar o álbum.
+    '''
+    ensaios: int
+    media: float
+    desvio_padrao: float
+    minimo: int
+    mediana: float
+    percentil_90: float
+    maximo: int
+
+
+def estado(c) -> tuple[int, int, int]:
+    '''
+    Devolve o estado (total de figurinhas do álbum, figurinhas faltantes,
+    repetidas sobrando) da coleção *c*, que pode ser de qualquer implementação
+    de Colecao.
+    Exemplos
+    >>> from colecao_arranjo import Colecao
+    >>> c = Colecao(5)
+    >>> for i in [1, 1, 1, 4]:
+    ...     c.insere(i)
+    >>> estado(c)
+    (5, 3, 2)
+    '''
+    quantidades = c.quantidades()
+    faltam = 0
+    repetidas = 0
+    for q in quantidades:
+        if q == 0:
+            faltam += 1
+        else:
+            repetidas += q - 1
+    return len(quantidades), faltam, repetidas
+
+
+def simula_pacotes(c, ensaios: int = 1000, figurinhas_por_pacote: int = 5,
+                   repetidas_por_troca: int | None = None, semente: int | None = None,
+                   usa_numpy: bool | None = None) -> Estatisticas:
+    '''
+    Simula *ensaios* vezes a compra de pacotes até completar o álbum a partir
+    das figurinhas da coleção *c* e devolve as estatísticas do número de
+    pacotes abertos. Usa NumPy se *usa_numpy* for True, ou se for None e o
+    NumPy estiver instalado.
+    Requer que *ensaios*, *figurinhas_por_pacote* e *repetidas_por_troca*
+    (se não for None) sejam positivos.
+    Exemplos
+
+    # Coleção completa não precisa de nenhum pacote
+
+    >>> from colecao_arranjo import Colecao
+    >>> c = Colecao(3)
+    >>> for i in range(1, 4):
+    ...     c.insere(i)
+    >>> simula_pacotes(c, ensaios=10)
+    Estatisticas(ensaios=10, media=0.0, desvio_padrao=0.0, minimo=0, mediana=0.0, percentil_90=0.0, maximo=0)
+
+    # Álbum com uma figurinha e pacotes com uma figurinha
+
+    >>> simula_pacotes(Colecao(1), ensaios=10, figurinhas_por_pacote=1).media
+    1.0
+
+    # Problema do colecionador de cupons: 10 * (1 + 1/2 + ... + 1/10) ≈ 29.29
+
+    >>> e = simula_pacotes(Colecao(10), ensaios=4000, figurinhas_por_pacote=1, semente=1, usa_numpy=False)
+    >>> abs(e.media - 29.29) < 1
+    True
+    >>> e.minimo >= 10
+    True
+
+    # Trocar repetidas diminui o número de pacotes. A média de referência
+    # (14.14) é a de uma simulação sorteio a sorteio com 20000 ensaios,
+    # que troca no mesmo sorteio em que a repetida é acumulada.
+
+    >>> t = simula_pacotes(Colecao(50), ensaios=4000, repetidas_por_troca=2, semente=1, usa_numpy=False)
+    >>> abs(t.media - 14.14) < 0.3
+    True
+    >>> simula_pacotes(Colecao(10), ensaios=0)
+    Traceback (most recent call last):
+    ...
+    ValueError: parâmetros da simulação devem ser positivos
+    '''
+    if ensaios < 1 or figurinhas_por_pacote < 1 or (repetidas_por_troca is not None and repetidas_por_troca < 1):
+        raise ValueError('parâmetros da simulação devem ser positivos')
+    if usa_numpy is None:
+        usa_numpy = np is not None
+    total, faltam, repetidas = estado(c)
+    if usa_numpy:
+        sorteios = _sorteios_numpy(total, faltam, repetidas, ensaios, repetidas_por_troca, semente)
+    else:
+        sorteios = _sorteios_python(total, faltam, repetidas, ensaios, repetidas_por_troca, semente)
+    # Um pacote a mais para os sorteios que não completam um pacote
+    pacotes = [(s + figurinhas_por_pacote - 1) // figurinhas_por_pacote for s in sorteios]
+    return estatisticas(pacotes)
+
+
+def simula_colecoes(colecoes: list, ensaios: int = 1000, figurinhas_por_pacote: int = 5,
+                    repetidas_por_troca: int | None = None, semente: int | None = None,
+                    usa_numpy: bool | None = None) -> list[Estatisticas]:
+    '''
+    Devolve as estatísticas de simula_pacotes para cada coleção de *colecoes*.
+    Coleções no mesmo estado (veja a função *estado*) são simuladas apenas uma vez.
+    Exemplos
+    >>> from colecao_arranjo import Colecao
+    >>> c1 = Colecao(4)
+    >>> c2 = Colecao(4)
+    >>> c1.insere(1)
+    >>> c2.insere(3)
+    >>> e1, e2, e3 = simula_colecoes([c1, c2, Colecao(4)], ensaios=100, semente=7)
+    >>> e1 is e2
+    True
+    >>> e3.media >= e1.media
+    True
+    '''
+    simuladas = {}
+    resultado = []
+    for c in colecoes:
+        chave = estado(c)
+        if chave not in simuladas:
+            simuladas[chave] = simula_pacotes(c, ensaios, figurinhas_por_pacote,
+                                              repetidas_por_troca, semente, usa_numpy)
+        resultado.append(simuladas[chave])
+    return resultado
+
+
+def estatisticas(pacotes: list[int]) -> Estatisticas:
+    '''
+    Devolve as estatísticas dos números de *pacotes*.
+    Requer que *pacotes* não seja vazia.
+    Exemplos
+    >>> estatisticas([5, 1, 3])
+    Estatisticas(ensaios=3, media=3.0, desvio_padrao=2.0, minimo=1, mediana=3.0, percentil_90=4.6, maximo=5)
+    '''
+    n = len(pacotes)
+    ordenados = sorted(pacotes)
+    media = sum(ordenados) / n
+    variancia = sum((p - media) ** 2 for p in ordenados) / (n - 1) if n > 1 else 0.0
+    return Estatisticas(n, media, math.sqrt(variancia), ordenados[0],
+                        _quantil(ordenados, 0.5), _quantil(ordenados, 0.9), ordenados[-1])
+
+
+def _quantil(ordenados: list[int], q: float) -> float:
+    '''
+    Devolve o quantil *q* dos valores *ordenados* por interpolação linear.
+    '''
+    pos = q * (len(ordenados) - 1)
+    i = int(pos)
+    if i + 1 >= len(ordenados):
+        return float(ordenados[i])
+    return ordenados[i] + (ordenados[i + 1] - ordenados[i]) * (pos - i)
+
+
+def _sorteios_python(total: int, faltam: int, repetidas: int, ensaios: int,
+                     repetidas_por_troca: int | None, semente: int | None) -> list[int]:
+    '''
+    Devolve o número de sorteios de cada ensaio até completar o álbum.
+    '''
+    rng = random.Random(semente)
+    sorteios = [0] * ensaios
+    for e in range(ensaios):
+        f = faltam
+        r = repetidas
+        s = 0
+        while f > 0:
+            if repetidas_por_troca is not None and r >= repetidas_por_troca:
+                trocas = min(r // repetidas_por_troca, f)
+                f -= trocas
+                r -= trocas * repetidas_por_troca
+                continue
+            # Sorteios até uma figurinha nova (distribuição geométrica)
+            p = f / total
+            g = 1
+            if p < 1:
+                g += int(math.log(1.0 - rng.random()) / math.log1p(-p))
+            if repetidas_por_troca is not None and g > repetidas_por_troca - r:
+                # A troca acontece antes da figurinha nova
+                s += repetidas_por_troca - r
+                r = repetidas_por_troca
+                continue
+            s += g
+            r += g - 1
+            f -= 1
+        sorteios[e] = s
+    return sorteios
+
+
+def _sorteios_numpy(total: int, faltam: int, repetidas: int, ensaios: int,
+                    repetidas_por_troca: int | None, semente: int | None) -> list[int]:
+    '''
+    Devolve o número de sorteios de cada ensaio até completar o álbum,
+    simulando todos os ensaios juntos com arranjos do NumPy.
+    Exemplos
+
+    # As mesmas verificações de simula_pacotes, com o NumPy se ele estiver
+    # instalado (senão, as verificações valem para a implementação em Python)
+
+    >>> from colecao_arranjo import Colecao
+    >>> usa_numpy = np is not None
+    >>> e = simula_pacotes(Colecao(10), ensaios=4000, figurinhas_por_pacote=1, semente=1, usa_numpy=usa_numpy)
+    >>> abs(e.media - 29.29) < 1, e.minimo >= 10
+    (True, True)
+    >>> t = simula_pacotes(Colecao(50), ensaios=4000, repetidas_por_troca=2, semente=1, usa_numpy=usa_numpy)
+    >>> abs(t.media - 14.14) < 0.3
+    True
+    '''
+    rng = np.random.default_rng(semente)
+    f = np.full(ensaios, faltam, dtype=np.int64)
+    r = np.full(ensaios, repetidas, dtype=np.int64)
+    s = np.zeros(ensaios, dtype=np.int64)
+    while True:
+        if repetidas_por_troca is not None:
+            trocas = np.minimum(r // repetidas_por_troca, f)
+            f -= trocas
+            r -= trocas * repetidas_por_troca
+        ativos = f > 0
+        if not ativos.any():
+            break
+        g = rng.geometric(f[ativos] / total)
+        if repetidas_por_troca is None:
+            s[ativos] += g
+            r[ativos] += g - 1
+            f[ativos] -= 1
+            continue
+        # Nos ensaios em que a troca acontece antes da figurinha nova, avança
+        # apenas até a troca (veja _sorteios_python)
+        limite = repetidas_por_troca - r[ativos]
+        nova = g <= limite
+        s[ativos] += np.where(nova, g, limite)
+        r[ativos] += np.where(nova, g - 1, limite)
+        f[ativos] -= nova
+    return s.tolist()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+import os
+from conjunto_bits import figurinhas
+
+# Representação compacta de uma coleção enviada aos processos:
+# (ultima_figurinha, presentes, repetidas), onde *presentes* e *repetidas*
+# são inteiros usados como conjuntos de bits (o bit i representa a figurinha i+1).
+Representacao = tuple[int, int, int]
+
+
+def representacao(c) -> Representacao:
+    '''
+    Devolve a representação compacta da coleção *c*, que pode ser de qualquer
+    implementação de Colecao, em tempo proporcional ao tamanho do álbum.
+    Exemplos
+    >>> from colecao_arranjo import Colecao
+    >>> c = Colecao(5)
+    >>> c.insere(1)
+    >>> c.insere(3)
+    >>> c.insere(3)
+    >>> ultima, presentes, repetidas = representacao(c)
+    >>> ultima, bin(presentes), bin(repetidas)
+    (5, '0b101', '0b100')
+    '''
+    # Os conjuntos são mantidos pelas coleções, e só são convertidos para inteiros
+    return c.presentes.ultima_figurinha, c.presentes.bits(), c.repetidas.bits()
+
+
+def trocas(a: Representacao, b: Representacao) -> list[tuple[int, int]]:
+    '''
+    Devolve os pares (figurinha dada por *a*, figurinha dada por *b*) da troca
+    máxima entre as coleções representadas por *a* e *b*, em ordem crescente,
+    como feito por Colecao.troca_maxima.
+    Requer que os álbuns sejam os mesmos(tamanhos iguais).
+    Exemplos
+    >>> trocas((10, 0b10000011, 0b11), (10, 0b1111101, 0b110101))
+    [(2, 3)]
+    >>> trocas((20, 0b11, 0b1), (20, 0b11, 0b10))
+    []
+    >>> trocas((20, 0b1, 0b1), (10, 0b1, 0b1))
+    Traceback (most recent call last):
+    ...
+    ValueError: Álbuns diferentes
+    '''
+    if a[0] != b[0]:
+        raise ValueError('Álbuns diferentes')
+    # Repetidas de uma coleção que a outra não tem, em ordem crescente
+    trocaveis_a = figurinhas(a[2] & ~b[1])
+    trocaveis_b = figurinhas(b[2] & ~a[1])
+    return list(zip(trocaveis_a, trocaveis_b))
+
+
+def trocas_bloco(bloco: list[tuple[Representacao, Representacao]]) -> list[list[tuple[int, int]]]:
+    '''
+    Calcula as trocas de cada par de representações do *bloco*.
+    É a função executada por cada processo.
+    Exemplos
+    >>> trocas_bloco([((3, 0b11, 0b1), (3, 0b110, 0b100)), ((3, 0b1, 0), (3, 0b1, 0))])
+    [[(1, 3)], []]
+    '''
+    return [trocas(a, b) for a, b in bloco]
+
+
+def troca_maxima_lote(pares: list, max_processos: int | None = None,
+                      tamanho_bloco: int | None = None) -> list[int]:
+    '''
+    Realiza a troca máxima entre as coleções de cada par de *pares*, com o
+    mesmo resultado de chamar c1.troca_maxima(c2) para cada par (c1, c2).
+    As trocas são calculadas em paralelo por até *max_processos* processos
+    (o número de processadores, se None; 1 calcula no próprio processo), que
+    recebem os pares em blocos de *tamanho_bloco* pares. As representações
+    são obtidas e as trocas são aplicadas (com insere e remove) no próprio
+    processo, pois as coleções não são compartilhadas com os outros processos.
+    Devolve uma lista com o número de figurinhas trocadas em cada par.
+    Requer que nenhuma coleção apareça em mais de um par.
+    Requer que os álbuns de cada par sejam os mesmos(tamanhos iguais).
+    Exemplos
+    >>> from colecao_arranjo import Colecao
+    >>> import colecao_no
+    >>> c1 = Colecao(10)
+    >>> c2 = Colecao(10)
+    >>> for i in [1, 1, 2, 2, 2, 8]:
+    ...     c1.insere(i)
+    >>> for i in [1, 1, 3, 3, 3, 4, 5, 5, 5, 6, 6, 7]:
+    ...     c2.insere(i)
+    >>> c3 = colecao_no.Colecao(20)
+    >>> c4 = colecao_no.Colecao(20)
+    >>> for i in [3, 2, 1, 2, 5, 1, 5]:
+    ...     c3.insere(i)
+    >>> for i in [4, 8, 4, 3, 8, 7, 4, 6, 7, 6]:
+    ...     c4.insere(i)
+    >>> troca_maxima_lote([(c1, c2), (c3, c4)], max_processos=2, tamanho_bloco=1)
+    [1, 3]
+    >>> c1.colecao_sem_repeticao()
+    '[1, 2, 3, 8]'
+    >>> c1.colecao_com_repeticao()
+    '[1 (1), 2 (1)]'
+    >>> c2.colecao_com_repeticao()
+    '[1 (1), 3 (1), 5 (2), 6 (1)]'
+    >>> c3.colecao_sem_repeticao()
+    '[1, 2, 3, 4, 5, 6, 7]'
+    >>> c4.colecao_com_repeticao()
+    '[4 (1), 8 (1)]'
+    >>> troca_maxima_lote([(c1, c2), (c3, c4)], max_processos=1)
+    [0, 0]
+    >>> troca_maxima_lote([(c1, c2), (c2, c3)])
+    Traceback (most recent call last):
+    ...
+    ValueError: coleção repetida no lote
+    >>> troca_maxima_lote([(c1, c3)])
+    Traceback (most recent call last):
+    ...
+    ValueError: Álbuns diferentes
+    '''
+    # Verifica os requisitos antes de enviar qualquer par,
+    # para que nenhuma coleção seja alterada se o lote for inválido
+    vistas = set()
+    for c1, c2 in pares:
+        if id(c1) in vistas or id(c2) in vistas or c1 is c2:
+            raise ValueError('coleção repetida no lote')
+        vistas.add(id(c1))
+        vistas.add(id(c2))
+    representacoes = [(representacao(c1), representacao(c2)) for c1, c2 in pares]
+    for a, b in representacoes:
+        if a[0] != b[0]:
+            raise ValueError('Álbuns diferentes')
+
+    if max_processos is None:
+        max_processos = os.cpu_count() or 1
+    if tamanho_bloco is None:
+        # Alguns blocos por processo equilibram a carga sem muitos envios
+        tamanho_bloco = max(1, len(pares) // (4 * max_processos))
+    blocos = [representacoes[i:i + tamanho_bloco] for i in range(0, len(representacoes), tamanho_bloco)]
+
+    resultados = []
+    if max_processos == 1 or len(blocos) <= 1:
+        for bloco in blocos:
+            resultados += trocas_bloco(bloco)
+    else:
+        with ProcessPoolExecutor(max_workers=max_processos) as executor:
+            for resultado in executor.map(trocas_bloco, blocos):
+                resultados += resultado
+
+    # Aplica as trocas calculadas nas coleções originais
+    num_trocas = []
+    for (c1, c2), pares_troca in zip(pares, resultados):
+        for dada, recebida in pares_troca:
+            c1.remove(dada)
+            c2.remove(recebida)
+            c1.insere(recebida)
+            c2.insere(dada)
+        num_trocas.append(len(pares_troca))
+    return num_trocas
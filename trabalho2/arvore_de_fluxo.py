@@ -0,0 +1,95 @@
+from __future__ import annotations
+import os
+import sys
+from typing import Iterable, Iterator
+from trab_arvores import Arvore, cria_ABB
+
+# A ordenação por intercalação de listas encadeadas está no trabalho 3
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'trabalho3'))
+from ordenacao_intercalacao_encadeamento import Lista, No as NoLista, ordena
+
+
+# Função auxiliar que cria uma lista encadeada a partir de um iterável
+def lista_de_fluxo(valores: Iterable[int]) -> Lista:
+    '''
+    Cria uma lista encadeada com os *valores*, lidos uma única vez.
+    Exemplos
+    >>> from ordenacao_intercalacao_encadeamento import arranjo
+    >>> arranjo(lista_de_fluxo(x * x for x in range(4)))
+    [0, 1, 4, 9]
+    '''
+    # cria um sentinela
+    inicio = NoLista(0, None)
+    p = inicio
+    for x in valores:
+        p.prox = NoLista(x, None)
+        p = p.prox
+    # descarta o sentinela
+    return inicio.prox
+
+
+# Função auxiliar que remove os valores repetidos de uma lista ordenada
+def remove_repetidos(lst: Lista) -> int:
+    '''
+    Remove da lista ordenada *lst* os nós com valores iguais ao do nó anterior
+    e devolve o número de nós que restam.
+    Exemplos
+    >>> from ordenacao_intercalacao_encadeamento import arranjo, lista
+    >>> lst = lista([1, 1, 2, 3, 3, 3])
+    >>> remove_repetidos(lst), arranjo(lst)
+    (3, [1, 2, 3])
+    >>> remove_repetidos(None)
+    0
+    '''
+    if lst is None:
+        return 0
+    n = 1
+    while lst.prox is not None:
+        if lst.prox.valor == lst.valor:
+            lst.prox = lst.prox.prox
+        else:
+            lst = lst.prox
+            n += 1
+    return n
+
+
+# Função auxiliar que percorre os valores de uma lista encadeada
+def valores_lista(lst: Lista) -> Iterator[int]:
+    '''
+    Devolve um iterador com os valores da lista *lst*.
+    Exemplos
+    >>> from ordenacao_intercalacao_encadeamento import lista
+    >>> list(valores_lista(lista([3, 1, 2])))
+    [3, 1, 2]
+    '''
+    while lst is not None:
+        yield lst.valor
+        lst = lst.prox
+
+
+def cria_ABB_de_fluxo(valores: Iterable[int]) -> Arvore:
+    '''
+    Cria e devolve a árvore binária de busca (ABB) com os *valores*, que
+    podem estar em qualquer ordem e ter repetições (cada valor aparece uma
+    vez na árvore). A árvore tem a mesma estrutura de cria_ABB com os
+    valores ordenados e sem repetição.
+    Os valores são lidos uma única vez, para uma lista encadeada que é
+    ordenada por intercalação (ordenacao_intercalacao_encadeamento.ordena),
+    e a árvore é criada percorrendo a lista ordenada, sem criar outra lista.
+    Exemplos
+    >>> cria_ABB_de_fluxo([3, 1, 2, 3, 1])
+    No(esq=No(esq=None, val=1, dir=None), val=2, dir=No(esq=None, val=3, dir=None))
+    >>> cria_ABB_de_fluxo(iter([])) is None
+    True
+    >>> import random
+    >>> valores = [random.randrange(1000) for _ in range(5000)]
+    >>> cria_ABB_de_fluxo(valores) == cria_ABB(sorted(set(valores)))
+    True
+    '''
+    lst = ordena(lista_de_fluxo(valores))
+    n = remove_repetidos(lst)
+    # O iterador é o único a referenciar a lista, de modo que os nós da
+    # lista já percorridos podem ser liberados durante a criação da árvore
+    it = valores_lista(lst)
+    lst = None
+    return cria_ABB(it, n)
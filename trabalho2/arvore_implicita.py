@@ -0,0 +1,128 @@
+from __future__ import annotations
+from array import array
+from typing import Iterable
+from trab_arvores import Arvore, em_ordem
+
+class ArvoreImplicita:
+    '''
+    Uma árvore binária de busca somente leitura armazenada implicitamente em
+    um arranjo tipado, na ordem de Eytzinger (em largura): a raiz está na
+    posição 1 e os filhos do nó na posição k estão nas posições 2k e 2k + 1.
+    Não há ponteiros entre nós, e uma busca acessa posições que ficam cada vez
+    mais distantes, mas os primeiros níveis da árvore ficam juntos na memória.
+
+    Exemplos
+    >>> a = ArvoreImplicita([10, 20, 30, 40, 50, 60])
+    >>> len(a)
+    6
+    >>> a.valores
+    array('q', [0, 40, 20, 60, 10, 30, 50])
+    >>> a.busca(30), a.busca(35), 60 in a
+    (True, False, True)
+    >>> a.limite_inferior(30), a.limite_inferior(31), a.limite_inferior(61)
+    (30, 40, None)
+    >>> a.limite_superior(30), a.limite_superior(5), a.limite_superior(60)
+    (40, 10, None)
+    >>> a.busca_lote([60, 5, 20, 25])
+    [True, False, True, False]
+
+    A partir de uma ABB
+    >>> from trab_arvores import cria_ABB
+    >>> ArvoreImplicita.de_ABB(cria_ABB([1, 2, 3])).valores
+    array('q', [0, 2, 1, 3])
+    '''
+    valores: array
+    n: int
+    # Os valores estão nas posições 1 até n (a posição 0 não é usada)
+
+    def __init__(self, valores: Iterable[int], tipo: str = 'q'):
+        '''
+        Cria a árvore com os *valores*, que devem estar em ordem crescente,
+        armazenados em um arranjo com o código de tipo *tipo* do módulo array
+        (o padrão 'q' armazena inteiros de 64 bits).
+        '''
+        ordenados = array(tipo, valores)
+        self.n = len(ordenados)
+        self.valores = array(tipo, [0]) * (self.n + 1)
+        # Percorre em ordem as posições da árvore implícita, que recebem
+        # os valores em ordem crescente
+        i = 0
+        pilha: list[int] = []
+        k = 1
+        while k <= self.n or len(pilha) > 0:
+            while k <= self.n:
+                pilha.append(k)
+                k = 2 * k
+            k = pilha.pop()
+            self.valores[k] = ordenados[i]
+            i += 1
+            k = 2 * k + 1
+
+    @staticmethod
+    def de_ABB(t: Arvore, tipo: str = 'q') -> ArvoreImplicita:
+        '''
+        Cria uma árvore implícita com os valores da ABB *t*.
+        '''
+        return ArvoreImplicita(em_ordem(t), tipo)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __contains__(self, x: int) -> bool:
+        return self.busca(x)
+
+    def posicao_inferior(self, x: int) -> int:
+        '''
+        Devolve a posição do menor valor maior ou igual a *x*, ou 0 se não existe.
+        '''
+        # A descida não tem desvios dependentes da comparação: o resultado da
+        # comparação escolhe o filho. No fim, *k* é a posição depois de uma folha,
+        # e a resposta é o último nó em que a descida foi para a esquerda, obtido
+        # removendo os bits 1 finais de *k* e mais um bit.
+        valores = self.valores
+        n = self.n
+        k = 1
+        while k <= n:
+            k = 2 * k + (valores[k] < x)
+        return k >> (k ^ (k + 1)).bit_length()
+
+    def busca(self, x: int) -> bool:
+        '''
+        Verifica se o valor *x* está na árvore.
+        '''
+        k = self.posicao_inferior(x)
+        return k != 0 and self.valores[k] == x
+
+    def limite_inferior(self, x: int) -> int | None:
+        '''
+        Devolve o menor valor da árvore maior ou igual a *x*, ou None se não existe.
+        '''
+        k = self.posicao_inferior(x)
+        return self.valores[k] if k != 0 else None
+
+    def limite_superior(self, x: int) -> int | None:
+        '''
+        Devolve o menor valor da árvore maior que *x*, ou None se não existe.
+        '''
+        valores = self.valores
+        n = self.n
+        k = 1
+        while k <= n:
+            k = 2 * k + (valores[k] <= x)
+        k >>= (k ^ (k + 1)).bit_length()
+        return valores[k] if k != 0 else None
+
+    def busca_lote(self, consultas: Iterable[int]) -> list[bool]:
+        '''
+        Devolve uma lista que indica, para cada valor de *consultas*, se ele está na árvore.
+        '''
+        valores = self.valores
+        n = self.n
+        resultado = []
+        for x in consultas:
+            k = 1
+            while k <= n:
+                k = 2 * k + (valores[k] < x)
+            k >>= (k ^ (k + 1)).bit_length()
+            resultado.append(k != 0 and valores[k] == x)
+        return resultado
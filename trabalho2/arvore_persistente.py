@@ -0,0 +1,177 @@
+from __future__ import annotations
+from threading import Lock
+from typing import Iterable
+from trab_arvores import Arvore, NoAumentado, altura, aumenta, cria_ABB, num_elementos
+
+# Árvores persistentes: os nós (NoAumentado) nunca são alterados depois de
+# criados. Uma inserção ou remoção cria cópias dos nós do caminho da raiz até
+# a posição alterada e compartilha o restante da árvore com a versão anterior,
+# de modo que cada versão continua válida e pode ser lida pelas funções de
+# trab_arvores (em_ordem, busca_binaria, caminhos_TAMMAX, k_esimo, ...).
+# As versões não podem ser passadas para insere_ABB ou remove_ABB, que
+# alteram os nós.
+
+# Função auxiliar que cria um nó balanceado sem alterar os filhos
+def balanceado(esq: Arvore, val: int, dir: Arvore) -> NoAumentado:
+    '''
+    Cria e devolve a raiz de uma árvore AVL com os valores de *esq*, *val* e
+    *dir*, rotacionando (com cópias dos nós rotacionados) se as alturas de
+    *esq* e *dir* diferem em mais de 1.
+    Requer que *esq* e *dir* sejam AVL e que as suas alturas difiram em no máximo 2.
+    Exemplos
+    >>> t = balanceado(None, 1, NoAumentado(NoAumentado(None, 2, None), 3, None))
+    >>> t.val, t.esq.val, t.dir.val, t.alt
+    (2, 1, 3, 1)
+    '''
+    if altura(esq) - altura(dir) > 1:
+        assert esq is not None
+        if altura(esq.esq) < altura(esq.dir):
+            ed = esq.dir
+            assert ed is not None
+            return NoAumentado(NoAumentado(esq.esq, esq.val, ed.esq), ed.val, NoAumentado(ed.dir, val, dir))
+        return NoAumentado(esq.esq, esq.val, NoAumentado(esq.dir, val, dir))
+    if altura(dir) - altura(esq) > 1:
+        assert dir is not None
+        if altura(dir.dir) < altura(dir.esq):
+            de = dir.esq
+            assert de is not None
+            return NoAumentado(NoAumentado(esq, val, de.esq), de.val, NoAumentado(de.dir, dir.val, dir.dir))
+        return NoAumentado(NoAumentado(esq, val, dir.esq), dir.val, dir.dir)
+    return NoAumentado(esq, val, dir)
+
+# Função auxiliar que copia os nós de um caminho
+def copia_caminho(caminho: list[tuple[NoAumentado, bool]], no: Arvore) -> Arvore:
+    '''
+    Devolve a raiz de uma nova versão da árvore em que a subárvore no fim do
+    *caminho* foi substituída por *no*. O *caminho* começa na raiz e tem, para
+    cada nó, se o próximo nó é o filho esquerdo (True) ou direito (False).
+    Os nós do caminho são copiados e balanceados de baixo para cima.
+    '''
+    for pai, esquerda in reversed(caminho):
+        if esquerda:
+            no = balanceado(no, pai.val, pai.dir)
+        else:
+            no = balanceado(pai.esq, pai.val, no)
+    return no
+
+def insere_persistente(t: Arvore, x: int) -> Arvore:
+    '''
+    Devolve uma nova versão da ABB persistente *t* com o valor *x*, sem
+    alterar *t*. Se *x* já está na árvore, devolve *t*.
+    Requer que *t* seja AVL e aumentada.
+    Exemplos
+    >>> t = None
+    >>> for x in [3, 1, 2]:
+    ...     t = insere_persistente(t, x)
+    >>> t
+    NoAumentado(esq=NoAumentado(esq=None, val=1, dir=None, tam=1, alt=0), val=2, dir=NoAumentado(esq=None, val=3, dir=None, tam=1, alt=0), tam=3, alt=1)
+    >>> insere_persistente(t, 2) is t
+    True
+    '''
+    caminho: list[tuple[NoAumentado, bool]] = []
+    atual = t
+    while atual is not None:
+        assert isinstance(atual, NoAumentado)
+        if x == atual.val:
+            return t
+        caminho.append((atual, x < atual.val))
+        atual = atual.esq if x < atual.val else atual.dir
+    return copia_caminho(caminho, NoAumentado(None, x, None))
+
+def remove_persistente(t: Arvore, x: int) -> Arvore:
+    '''
+    Devolve uma nova versão da ABB persistente *t* sem o valor *x*, sem
+    alterar *t*. Se *x* não está na árvore, devolve *t*.
+    Requer que *t* seja AVL e aumentada.
+    Exemplos
+    >>> from trab_arvores import em_ordem
+    >>> t = aumenta(cria_ABB([1, 2, 3, 4, 5]))
+    >>> r = remove_persistente(t, 3)
+    >>> list(em_ordem(r)), list(em_ordem(t))
+    ([1, 2, 4, 5], [1, 2, 3, 4, 5])
+    >>> remove_persistente(t, 6) is t
+    True
+    '''
+    caminho: list[tuple[NoAumentado, bool]] = []
+    atual = t
+    while atual is not None and atual.val != x:
+        assert isinstance(atual, NoAumentado)
+        caminho.append((atual, x < atual.val))
+        atual = atual.esq if x < atual.val else atual.dir
+    if atual is None:
+        return t
+    if atual.esq is None or atual.dir is None:
+        return copia_caminho(caminho, atual.esq if atual.esq is not None else atual.dir)
+    # O nó é substituído por um nó com o menor valor da subárvore direita,
+    # que é removido dessa subárvore
+    menores: list[tuple[NoAumentado, bool]] = []
+    sucessor = atual.dir
+    while sucessor.esq is not None:
+        assert isinstance(sucessor, NoAumentado)
+        menores.append((sucessor, True))
+        sucessor = sucessor.esq
+    direita = copia_caminho(menores, sucessor.dir)
+    return copia_caminho(caminho, balanceado(atual.esq, sucessor.val, direita))
+
+
+class ArvorePersistente:
+    '''
+    Uma ABB (AVL) que pode ser alterada por escritores enquanto leitores
+    usam instantâneos (versões anteriores) da árvore.
+    Obter um instantâneo leva tempo constante, e cada alteração cria
+    O(log n) nós. Os leitores não esperam pelos escritores nem são afetados
+    pelas alterações; os escritores são executados um de cada vez.
+
+    Exemplos
+    >>> from trab_arvores import caminhos_TAMMAX, em_ordem
+    >>> a = ArvorePersistente([1, 2, 3])
+    >>> v = a.instantaneo()
+    >>> a.insere(4)
+    >>> a.remove(1)
+    >>> list(em_ordem(a.instantaneo())), list(em_ordem(v))
+    ([2, 3, 4], [1, 2, 3])
+    >>> caminhos_TAMMAX(v)
+    [[2, 1], [2, 3]]
+    >>> len(a), 4 in a, 1 in a
+    (3, True, False)
+    '''
+    raiz: Arvore
+
+    def __init__(self, valores: Iterable[int] = ()):
+        '''
+        Cria a árvore com os *valores* (em qualquer ordem, com repetições).
+        '''
+        self.raiz = aumenta(cria_ABB(sorted(set(valores))))
+        self.trava = Lock()
+
+    def __len__(self) -> int:
+        return num_elementos(self.raiz)
+
+    def __contains__(self, x: int) -> bool:
+        t = self.raiz
+        while t is not None:
+            if x == t.val:
+                return True
+            t = t.esq if x < t.val else t.dir
+        return False
+
+    def instantaneo(self) -> Arvore:
+        '''
+        Devolve a versão atual da árvore, que não é alterada pelas próximas
+        inserções e remoções.
+        '''
+        return self.raiz
+
+    def insere(self, x: int):
+        '''
+        Insere o valor *x* na árvore.
+        '''
+        with self.trava:
+            self.raiz = insere_persistente(self.raiz, x)
+
+    def remove(self, x: int):
+        '''
+        Remove o valor *x* da árvore, se ele está na árvore.
+        '''
+        with self.trava:
+            self.raiz = remove_persistente(self.raiz, x)
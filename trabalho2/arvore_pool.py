@@ -0,0 +1,448 @@
+from __future__ import annotations
+from array import array
+from itertools import islice
+from typing import Iterable, Iterator
+from trab_arvores import Arvore, No
+
+# Índice que representa a ausência de nó (árvore vazia)
+NENHUM = -1
+
+class ArvorePool:
+    '''
+    Uma árvore binária de busca (ABB) armazenada em arranjos paralelos
+    tipados: o nó i tem filho esquerdo esq[i], valor val[i], filho direito
+    dir[i] e a altura da sua subárvore alt[i], onde os filhos são índices de
+    nós ou NENHUM. Cada nó ocupa 32 bytes (quatro inteiros de 64 bits), em
+    vez de um objeto No.
+    As alturas são usadas por *insere* e *remove* para manter a árvore
+    balanceada (AVL), como trab_arvores.insere_ABB e remove_ABB.
+    Os nós removidos formam uma lista de livres (encadeada pelo arranjo esq)
+    e são reaproveitados pelas próximas inserções.
+
+    Exemplos
+    >>> a = ArvorePool.cria_ABB([1, 2, 3, 4, 5])
+    >>> a.num_elementos(), a.altura()
+    (5, 2)
+    >>> a.busca_binaria(4), a.busca_binaria(6)
+    (True, False)
+    >>> a.para_arvore()
+    No(esq=No(esq=None, val=1, dir=No(esq=None, val=2, dir=None)), val=3, dir=No(esq=None, val=4, dir=No(esq=None, val=5, dir=None)))
+    >>> a.caminhos_TAMMAX()
+    [[3, 1, 2], [3, 4, 5]]
+    >>> a.remove(3)
+    >>> a.insere(0)
+    >>> list(a.em_ordem()), len(a.val)
+    ([0, 1, 2, 4, 5], 5)
+    >>> a.verifica_ABB()
+    True
+    >>> a.ABB_mesmos_elementos(ArvorePool.cria_ABB([0, 1, 2, 4, 5]))
+    True
+
+    # Inserções em ordem crescente não degeneram a árvore
+    >>> a = ArvorePool()
+    >>> for x in range(1023):
+    ...     a.insere(x)
+    >>> a.altura(), a.verifica_ABB(), a.altura() == a.alturas()[a.raiz]
+    (9, True, True)
+    >>> for x in range(0, 1000, 2):
+    ...     a.remove(x)
+    >>> a.num_elementos(), a.altura() <= 9, a.verifica_ABB(), a.altura() == a.alturas()[a.raiz]
+    (523, True, True, True)
+    '''
+    esq: array
+    val: array
+    dir: array
+    alt: array
+    raiz: int
+    livre: int
+    tam: int
+    # *livre* é o primeiro nó da lista de livres (ou NENHUM)
+    # e *tam* é o número de nós da árvore
+
+    def __init__(self):
+        '''
+        Cria uma árvore vazia.
+        '''
+        self.esq = array('q')
+        self.val = array('q')
+        self.dir = array('q')
+        self.alt = array('q')
+        self.raiz = NENHUM
+        self.livre = NENHUM
+        self.tam = 0
+
+    @staticmethod
+    def cria_ABB(valores: Iterable[int], n: int | None = None) -> ArvorePool:
+        '''
+        Cria a árvore com a mesma estrutura de trab_arvores.cria_ABB para os
+        *valores* em ordem crescente (uma sequência, ou um iterável com *n* valores).
+        Cada valor é lido uma única vez, em ordem.
+        Exemplos
+        >>> ArvorePool.cria_ABB(iter([1, 2]), 2).para_arvore()
+        No(esq=None, val=1, dir=No(esq=None, val=2, dir=None))
+        >>> from trab_arvores import cria_ABB
+        >>> ArvorePool.cria_ABB(range(100)).para_arvore() == cria_ABB(range(100))
+        True
+        >>> ArvorePool.cria_ABB(iter([1, 2]), 3)
+        Traceback (most recent call last):
+        ...
+        ValueError: valores insuficientes
+        '''
+        if n is None:
+            n = len(valores) # type: ignore
+        a = ArvorePool()
+        # O nó i guarda o i-ésimo menor valor, de modo que os valores são
+        # lidos em ordem e só a ligação dos filhos depende da estrutura
+        a.val = array('q', islice(valores, n))
+        if len(a.val) < n:
+            raise ValueError('valores insuficientes')
+        a.esq = array('q', [NENHUM]) * n
+        a.dir = array('q', [NENHUM]) * n
+        a.alt = array('q', [0]) * n
+        a.tam = n
+        # A subárvore com os nós [inicio, fim) tem a raiz no nó
+        # inicio + (fim - inicio - 1) // 2, como em cria_ABB
+        pilha = [(0, n, NENHUM, True)]
+        while len(pilha) > 0:
+            inicio, fim, pai, esquerda = pilha.pop()
+            if inicio >= fim:
+                continue
+            meio = inicio + (fim - inicio - 1) // 2
+            # Uma subárvore com k nós criada assim tem altura piso(log2(k))
+            a.alt[meio] = (fim - inicio).bit_length() - 1
+            if pai == NENHUM:
+                a.raiz = meio
+            elif esquerda:
+                a.esq[pai] = meio
+            else:
+                a.dir[pai] = meio
+            pilha.append((meio + 1, fim, meio, False))
+            pilha.append((inicio, meio, meio, True))
+        return a
+
+    @staticmethod
+    def de_arvore(t: Arvore) -> ArvorePool:
+        '''
+        Cria uma árvore com a mesma estrutura e os mesmos valores da árvore *t*.
+        Exemplos
+        >>> ArvorePool.de_arvore(No(No(None, 1, None), 2, None)).para_arvore()
+        No(esq=No(esq=None, val=1, dir=None), val=2, dir=None)
+        '''
+        a = ArvorePool()
+        if t is None:
+            return a
+        a.raiz = a.novo_no(t.val)
+        pilha: list[tuple[No, int]] = [(t, a.raiz)]
+        while len(pilha) > 0:
+            no, i = pilha.pop()
+            if no.esq is not None:
+                a.esq[i] = a.novo_no(no.esq.val)
+                pilha.append((no.esq, a.esq[i]))
+            if no.dir is not None:
+                a.dir[i] = a.novo_no(no.dir.val)
+                pilha.append((no.dir, a.dir[i]))
+        a.alt = a.alturas()
+        return a
+
+    def para_arvore(self) -> Arvore:
+        '''
+        Devolve a árvore de objetos No com a mesma estrutura e os mesmos valores.
+        '''
+        if self.raiz == NENHUM:
+            return None
+        raiz = No(None, self.val[self.raiz], None)
+        pilha: list[tuple[int, No]] = [(self.raiz, raiz)]
+        while len(pilha) > 0:
+            i, no = pilha.pop()
+            if self.esq[i] != NENHUM:
+                no.esq = No(None, self.val[self.esq[i]], None)
+                pilha.append((self.esq[i], no.esq))
+            if self.dir[i] != NENHUM:
+                no.dir = No(None, self.val[self.dir[i]], None)
+                pilha.append((self.dir[i], no.dir))
+        return raiz
+
+    def novo_no(self, x: int) -> int:
+        '''
+        Devolve o índice de um novo nó sem filhos com o valor *x*,
+        reaproveitando um nó da lista de livres se possível.
+        '''
+        self.tam += 1
+        if self.livre == NENHUM:
+            self.esq.append(NENHUM)
+            self.val.append(x)
+            self.dir.append(NENHUM)
+            self.alt.append(0)
+            return len(self.val) - 1
+        i = self.livre
+        self.livre = self.esq[i]
+        self.esq[i] = NENHUM
+        self.val[i] = x
+        self.dir[i] = NENHUM
+        self.alt[i] = 0
+        return i
+
+    def libera_no(self, i: int):
+        '''
+        Coloca o nó *i* na lista de livres.
+        '''
+        self.tam -= 1
+        self.esq[i] = self.livre
+        self.dir[i] = NENHUM
+        self.livre = i
+
+    def num_elementos(self) -> int:
+        '''
+        Devolve o número de elementos da árvore.
+        '''
+        return self.tam
+
+    def em_ordem(self) -> Iterator[int]:
+        '''
+        Devolve um iterador com os valores da árvore em ordem crescente.
+        '''
+        pilha: list[int] = []
+        i = self.raiz
+        while i != NENHUM or len(pilha) > 0:
+            while i != NENHUM:
+                pilha.append(i)
+                i = self.esq[i]
+            i = pilha.pop()
+            yield self.val[i]
+            i = self.dir[i]
+
+    def busca_binaria(self, x: int) -> bool:
+        '''
+        Verifica se o valor *x* está na árvore.
+        '''
+        i = self.raiz
+        while i != NENHUM:
+            v = self.val[i]
+            if v == x:
+                return True
+            i = self.esq[i] if x < v else self.dir[i]
+        return False
+
+    def altura_no(self, i: int) -> int:
+        '''
+        Devolve a altura da subárvore do nó *i* (-1 se *i* é NENHUM).
+        '''
+        return -1 if i == NENHUM else self.alt[i]
+
+    def atualiza(self, i: int):
+        '''
+        Recalcula a altura do nó *i* a partir dos seus filhos.
+        '''
+        self.alt[i] = 1 + max(self.altura_no(self.esq[i]), self.altura_no(self.dir[i]))
+
+    def rotaciona_direita(self, i: int) -> int:
+        '''
+        Rotaciona a subárvore do nó *i* para a direita e devolve a nova raiz.
+        '''
+        e = self.esq[i]
+        self.esq[i] = self.dir[e]
+        self.dir[e] = i
+        self.atualiza(i)
+        self.atualiza(e)
+        return e
+
+    def rotaciona_esquerda(self, i: int) -> int:
+        '''
+        Rotaciona a subárvore do nó *i* para a esquerda e devolve a nova raiz.
+        '''
+        d = self.dir[i]
+        self.dir[i] = self.esq[d]
+        self.esq[d] = i
+        self.atualiza(i)
+        self.atualiza(d)
+        return d
+
+    def balanceia(self, i: int) -> int:
+        '''
+        Atualiza a altura do nó *i* e, se as alturas dos filhos diferem em
+        mais de 1, rotaciona o nó, como trab_arvores.balanceia. Devolve a
+        nova raiz da subárvore.
+        '''
+        self.atualiza(i)
+        esq = self.esq[i]
+        dir = self.dir[i]
+        fator = self.altura_no(esq) - self.altura_no(dir)
+        if fator > 1:
+            if self.altura_no(self.esq[esq]) < self.altura_no(self.dir[esq]):
+                self.esq[i] = self.rotaciona_esquerda(esq)
+            return self.rotaciona_direita(i)
+        if fator < -1:
+            if self.altura_no(self.dir[dir]) < self.altura_no(self.esq[dir]):
+                self.dir[i] = self.rotaciona_direita(dir)
+            return self.rotaciona_esquerda(i)
+        return i
+
+    def balanceia_caminho(self, caminho: list[int]):
+        '''
+        Balanceia os nós do *caminho* (da raiz até um nó) de baixo para cima,
+        ligando cada nova raiz de subárvore ao seu pai.
+        '''
+        for k in range(len(caminho) - 1, -1, -1):
+            i = self.balanceia(caminho[k])
+            if k == 0:
+                self.raiz = i
+            elif self.esq[caminho[k - 1]] == caminho[k]:
+                self.esq[caminho[k - 1]] = i
+            else:
+                self.dir[caminho[k - 1]] = i
+
+    def insere(self, x: int):
+        '''
+        Insere o valor *x* na árvore, mantendo a árvore balanceada (AVL).
+        Se *x* já está na árvore, a árvore não é alterada.
+        '''
+        # Desce até a posição de *x* guardando o caminho, e depois
+        # balanceia os nós do caminho de baixo para cima
+        caminho: list[int] = []
+        i = self.raiz
+        while i != NENHUM:
+            v = self.val[i]
+            if x == v:
+                return
+            caminho.append(i)
+            i = self.esq[i] if x < v else self.dir[i]
+        novo = self.novo_no(x)
+        if len(caminho) == 0:
+            self.raiz = novo
+            return
+        pai = caminho[-1]
+        if x < self.val[pai]:
+            self.esq[pai] = novo
+        else:
+            self.dir[pai] = novo
+        self.balanceia_caminho(caminho)
+
+    def remove(self, x: int):
+        '''
+        Remove o valor *x* da árvore, mantendo a árvore balanceada (AVL).
+        Se *x* não está na árvore, a árvore não é alterada.
+        '''
+        caminho: list[int] = []
+        i = self.raiz
+        while i != NENHUM and self.val[i] != x:
+            caminho.append(i)
+            i = self.esq[i] if x < self.val[i] else self.dir[i]
+        if i == NENHUM:
+            return
+        if self.esq[i] != NENHUM and self.dir[i] != NENHUM:
+            # O valor do nó é substituído pelo menor valor da subárvore
+            # direita, e o nó com esse valor é removido
+            caminho.append(i)
+            sucessor = self.dir[i]
+            while self.esq[sucessor] != NENHUM:
+                caminho.append(sucessor)
+                sucessor = self.esq[sucessor]
+            self.val[i] = self.val[sucessor]
+            i = sucessor
+        filho = self.esq[i] if self.esq[i] != NENHUM else self.dir[i]
+        self.libera_no(i)
+        if len(caminho) == 0:
+            self.raiz = filho
+            return
+        pai = caminho[-1]
+        if self.esq[pai] == i:
+            self.esq[pai] = filho
+        else:
+            self.dir[pai] = filho
+        self.balanceia_caminho(caminho)
+
+    def verifica_ABB(self) -> bool:
+        '''
+        Verifica se a árvore é uma árvore binária de busca (ABB),
+        como trab_arvores.verifica_ABB.
+        Exemplos
+        >>> ArvorePool.de_arvore(No(No(None, 1, None), 2, No(None, 1, None))).verifica_ABB()
+        False
+        '''
+        pilha: list[tuple[int, int | None, int | None]] = []
+        if self.raiz != NENHUM:
+            pilha.append((self.raiz, None, None))
+        while len(pilha) > 0:
+            i, inferior, superior = pilha.pop()
+            v = self.val[i]
+            if (inferior is not None and v < inferior) or (superior is not None and v > superior):
+                return False
+            if self.dir[i] != NENHUM:
+                pilha.append((self.dir[i], v, superior))
+            if self.esq[i] != NENHUM:
+                pilha.append((self.esq[i], inferior, v))
+        return True
+
+    def altura(self) -> int:
+        '''
+        Devolve a altura da árvore (-1 se a árvore é vazia).
+        '''
+        return self.altura_no(self.raiz)
+
+    def caminhos_TAMMAX(self) -> list[list[int]]:
+        '''
+        Devolve uma lista com todos os caminhos de tamanho máximo da árvore,
+        na mesma ordem de trab_arvores.caminhos_TAMMAX.
+        Exemplos
+        >>> t = No(No(No(None, 3, No(None, 4, None)), 8, None), 2, No(No(None, 7, None), 3, No(No(None, 2, None), 5, None)))
+        >>> ArvorePool.de_arvore(t).caminhos_TAMMAX()
+        [[2, 8, 3, 4], [2, 3, 5, 2]]
+        '''
+        alt = self.alt
+        caminhos = []
+        caminho: list[int] = []
+        pilha: list[tuple[int, int]] = []
+        if self.raiz != NENHUM:
+            pilha.append((self.raiz, 0))
+        while len(pilha) > 0:
+            i, profundidade = pilha.pop()
+            del caminho[profundidade:]
+            caminho.append(self.val[i])
+            if alt[i] == 0:
+                caminhos.append(list(caminho))
+            # Só desce para os filhos que levam a uma folha na profundidade máxima
+            if self.dir[i] != NENHUM and alt[self.dir[i]] == alt[i] - 1:
+                pilha.append((self.dir[i], profundidade + 1))
+            if self.esq[i] != NENHUM and alt[self.esq[i]] == alt[i] - 1:
+                pilha.append((self.esq[i], profundidade + 1))
+        return caminhos
+
+    def alturas(self) -> array:
+        '''
+        Devolve um arranjo com a altura da subárvore de cada nó da árvore,
+        calculada a partir da estrutura (e não do arranjo alt).
+        '''
+        alt = array('q', [NENHUM]) * len(self.val)
+        # Visita os nós em pré-ordem e calcula as alturas na ordem inversa,
+        # quando as alturas dos filhos já estão calculadas
+        ordem: list[int] = []
+        pilha: list[int] = []
+        if self.raiz != NENHUM:
+            pilha.append(self.raiz)
+        while len(pilha) > 0:
+            i = pilha.pop()
+            ordem.append(i)
+            if self.esq[i] != NENHUM:
+                pilha.append(self.esq[i])
+            if self.dir[i] != NENHUM:
+                pilha.append(self.dir[i])
+        for i in reversed(ordem):
+            e = self.esq[i]
+            d = self.dir[i]
+            alt[i] = 1 + max(alt[e] if e != NENHUM else -1, alt[d] if d != NENHUM else -1)
+        return alt
+
+    def ABB_mesmos_elementos(self, outra: ArvorePool) -> bool:
+        '''
+        Verifica se a árvore e a *outra* árvore têm os mesmos elementos,
+        comparando os seus valores em ordem.
+        Exemplos
+        >>> ArvorePool.cria_ABB([1, 2, 3]).ABB_mesmos_elementos(ArvorePool.cria_ABB([1, 2]))
+        False
+        '''
+        if self.tam != outra.tam:
+            return False
+        for a, b in zip(self.em_ordem(), outra.em_ordem()):
+            if a != b:
+                return False
+        return True
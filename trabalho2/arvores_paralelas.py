@@ -0,0 +1,268 @@
+'''
+Escrita e verificação de árvores grandes em paralelo, usando o formato
+de serialização de serializacao_arvores (valores e tamanhos das subárvores
+esquerdas em pré-ordem).
+
+Os níveis de cima da árvore são processados no próprio processo, e as
+subárvores de baixo, que são independentes, são enviadas a um conjunto de
+processos. Na escrita, cada processo devolve os arranjos de pré-ordem da
+sua subárvore, que são concatenados na ordem em que as subárvores aparecem
+na pré-ordem; na verificação, cada processo lê a sua faixa de posições
+diretamente do arquivo mapeado na memória.
+'''
+from __future__ import annotations
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import os
+from serializacao_arvores import ArvoreMapeada, salva_arranjos
+
+# Parte da pré-ordem: (inicio, fim, tarefa), onde [inicio, fim) é a faixa de
+# valores de uma subárvore. Se *tarefa* é True, a subárvore toda é enviada a
+# um processo; senão a parte é apenas a raiz da subárvore.
+Parte = tuple[int, int, bool]
+
+# Subárvore verificada por um processo: (caminho do arquivo, faixa [inicio, fim)
+# de posições da pré-ordem, limites inferior e superior dos valores)
+Verificacao = tuple[str, int, int, int | None, int | None]
+
+
+def arranjos_ABB(valores, tipo: str = 'q') -> tuple[array, array]:
+    '''
+    Devolve os arranjos de pré-ordem (valores e tamanhos das subárvores
+    esquerdas) da árvore criada por trab_arvores.cria_ABB(*valores*), sem
+    criar os nós.
+    Exemplos
+    >>> arranjos_ABB([1, 2, 3, 4, 5])
+    (array('q', [3, 1, 2, 4, 5]), array('Q', [2, 0, 0, 0, 0]))
+    >>> from trab_arvores import cria_ABB
+    >>> from serializacao_arvores import arranjos_preordem
+    >>> v, t = arranjos_ABB(range(100))
+    >>> w, r = arranjos_preordem(cria_ABB(range(100)))
+    >>> v == w, list(t) == list(r)
+    (True, True)
+    '''
+    preordem = array(tipo)
+    tamanhos = array('Q')
+    # A subárvore com os valores [inicio, fim) tem a raiz na posição
+    # inicio + (fim - inicio - 1) // 2, como em cria_ABB
+    pilha = [(0, len(valores))]
+    while len(pilha) > 0:
+        inicio, fim = pilha.pop()
+        if inicio >= fim:
+            continue
+        meio = inicio + (fim - inicio - 1) // 2
+        preordem.append(valores[meio])
+        tamanhos.append(meio - inicio)
+        pilha.append((meio + 1, fim))
+        pilha.append((inicio, meio))
+    return preordem, tamanhos
+
+
+# Função auxiliar que divide os níveis de cima da árvore
+def divide_construcao(n: int, tamanho_bloco: int) -> list[Parte]:
+    '''
+    Devolve as partes da pré-ordem da árvore criada por cria_ABB com *n*
+    valores, em que as subárvores com no máximo *tamanho_bloco* valores são
+    tarefas e os nós acima delas são processados no próprio processo.
+    Exemplos
+    >>> divide_construcao(7, 3)
+    [(0, 7, False), (0, 3, True), (4, 7, True)]
+    >>> divide_construcao(2, 1)
+    [(0, 2, False), (1, 2, True)]
+    '''
+    partes: list[Parte] = []
+    pilha = [(0, n)]
+    while len(pilha) > 0:
+        inicio, fim = pilha.pop()
+        if inicio >= fim:
+            continue
+        if fim - inicio <= tamanho_bloco:
+            partes.append((inicio, fim, True))
+            continue
+        partes.append((inicio, fim, False))
+        meio = inicio + (fim - inicio - 1) // 2
+        pilha.append((meio + 1, fim))
+        pilha.append((inicio, meio))
+    return partes
+
+
+# Função auxiliar que define o número de processos e o tamanho dos blocos
+def divisao(n: int, max_processos: int | None, tamanho_bloco: int | None) -> tuple[int, int]:
+    '''
+    Devolve o número de processos (o número de processadores, se
+    *max_processos* é None) e o número máximo de nós de cada tarefa (para
+    *n* nós, se *tamanho_bloco* é None).
+    Exemplos
+    >>> divisao(1000, 2, None)
+    (2, 125)
+    >>> divisao(1000, 2, 10)
+    (2, 10)
+    '''
+    if max_processos is None:
+        max_processos = os.cpu_count() or 1
+    if tamanho_bloco is None:
+        # Algumas subárvores por processo equilibram a carga
+        tamanho_bloco = max(1, n // (4 * max_processos))
+    return max_processos, tamanho_bloco
+
+
+def arranjos_ABB_paralelo(valores, tipo: str = 'q', max_processos: int | None = None,
+                          tamanho_bloco: int | None = None) -> tuple[array, array]:
+    '''
+    Devolve os mesmos arranjos que arranjos_ABB(*valores*, *tipo*),
+    calculados por até *max_processos* processos (o número de processadores,
+    se None; 1 calcula no próprio processo) que recebem subárvores com até
+    *tamanho_bloco* valores.
+    Exemplos
+    >>> arranjos_ABB_paralelo(range(1000), max_processos=2, tamanho_bloco=100) == arranjos_ABB(range(1000))
+    True
+    >>> arranjos_ABB_paralelo([], max_processos=1)
+    (array('q'), array('Q'))
+    '''
+    max_processos, tamanho_bloco = divisao(len(valores), max_processos, tamanho_bloco)
+    partes = divide_construcao(len(valores), tamanho_bloco)
+    blocos = [array(tipo, valores[inicio:fim]) for inicio, fim, tarefa in partes if tarefa]
+    if max_processos == 1 or len(blocos) <= 1:
+        resultados = [arranjos_ABB(bloco, tipo) for bloco in blocos]
+    else:
+        with ProcessPoolExecutor(max_workers=max_processos) as executor:
+            resultados = list(executor.map(arranjos_ABB, blocos, [tipo] * len(blocos)))
+
+    preordem = array(tipo)
+    tamanhos = array('Q')
+    proximo = iter(resultados)
+    for inicio, fim, tarefa in partes:
+        if tarefa:
+            p, t = next(proximo)
+            preordem.extend(p)
+            tamanhos.extend(t)
+        else:
+            meio = inicio + (fim - inicio - 1) // 2
+            preordem.append(valores[meio])
+            tamanhos.append(meio - inicio)
+    return preordem, tamanhos
+
+
+def salva_ABB_paralelo(valores, caminho: str, tipo: str = 'q', max_processos: int | None = None,
+                       tamanho_bloco: int | None = None):
+    '''
+    Escreve no arquivo *caminho* (no formato de serializacao_arvores.salva)
+    a árvore criada por cria_ABB(*valores*), sem criar os nós. A estrutura
+    é calculada em paralelo (veja arranjos_ABB_paralelo).
+    Exemplos
+    >>> import os, tempfile
+    >>> from serializacao_arvores import carrega
+    >>> from trab_arvores import cria_ABB
+    >>> caminho = os.path.join(tempfile.mkdtemp(), 'arvore.abb')
+    >>> salva_ABB_paralelo(range(1000), caminho, max_processos=2)
+    >>> carrega(caminho) == cria_ABB(range(1000))
+    True
+    '''
+    preordem, tamanhos = arranjos_ABB_paralelo(valores, tipo, max_processos, tamanho_bloco)
+    salva_arranjos(preordem, tamanhos, caminho)
+
+
+def verifica_faixa(verificacao: Verificacao) -> int | None:
+    '''
+    Verifica a subárvore descrita por *verificacao* do arquivo e devolve a sua
+    altura, ou None se ela não é uma ABB com valores entre os limites
+    (inclusive) ou se os tamanhos das subárvores não cabem na faixa.
+    '''
+    caminho, inicio, fim, inferior, superior = verificacao
+    with ArvoreMapeada(caminho) as a:
+        return verifica_arranjos(a.valores, a.tamanhos, inicio, fim, inferior, superior)
+
+
+# Função auxiliar que verifica uma faixa da pré-ordem
+def verifica_arranjos(valores, tamanhos, inicio: int, fim: int,
+                      inferior: int | None = None, superior: int | None = None) -> int | None:
+    '''
+    Devolve a altura da subárvore que ocupa as posições [*inicio*, *fim*) dos
+    arranjos de pré-ordem, ou None se ela não é uma ABB com valores entre
+    *inferior* e *superior* (None quando não há limite) ou se os tamanhos
+    das subárvores não cabem na faixa.
+    Exemplos
+    >>> verifica_arranjos([3, 1, 2, 4, 5], [2, 0, 0, 0, 0], 0, 5)
+    2
+    >>> verifica_arranjos([3, 1, 2, 4, 5], [2, 0, 0, 0, 0], 0, 5, superior=4) is None
+    True
+    >>> verifica_arranjos([3, 1, 4, 2, 5], [2, 0, 0, 0, 0], 0, 5) is None
+    True
+    >>> verifica_arranjos([3, 1], [2, 0], 0, 2) is None
+    True
+    >>> verifica_arranjos([], [], 0, 0)
+    -1
+    '''
+    # Como em trab_arvores.no_invalido, com a profundidade de cada nó
+    maior = -1
+    pilha = [(inicio, fim, inferior, superior, 0)]
+    while len(pilha) > 0:
+        i, f, inf, sup, profundidade = pilha.pop()
+        if i >= f:
+            continue
+        v = valores[i]
+        if (inf is not None and v < inf) or (sup is not None and v > sup):
+            return None
+        meio = i + 1 + tamanhos[i]
+        if meio > f:
+            return None
+        maior = max(maior, profundidade)
+        pilha.append((meio, f, v, sup, profundidade + 1))
+        pilha.append((i + 1, meio, inf, v, profundidade + 1))
+    return maior
+
+
+def verifica_paralela(caminho: str, max_processos: int | None = None,
+                      tamanho_bloco: int | None = None) -> tuple[bool, int, int]:
+    '''
+    Verifica a árvore escrita no arquivo *caminho* e devolve uma tupla com
+    (é ABB, altura, número de elementos), como verifica_ABB, altura e
+    num_elementos de trab_arvores. Os níveis de cima são verificados no
+    próprio processo, e as subárvores com até *tamanho_bloco* nós por até
+    *max_processos* processos, que leem o arquivo mapeado na memória.
+    Se a árvore não é uma ABB, a altura é -1.
+    Exemplos
+    >>> import os, tempfile
+    >>> from serializacao_arvores import salva
+    >>> from trab_arvores import No, cria_ABB
+    >>> caminho = os.path.join(tempfile.mkdtemp(), 'arvore.abb')
+    >>> salva(cria_ABB(range(1000)), caminho)
+    >>> verifica_paralela(caminho, 2, 50)
+    (True, 9, 1000)
+    >>> salva(No(No(None, 1, No(None, 5, None)), 4, No(None, 6, None)), caminho)
+    >>> verifica_paralela(caminho, 1)
+    (False, -1, 4)
+    '''
+    with ArvoreMapeada(caminho) as a:
+        n = len(a)
+        max_processos, tamanho_bloco = divisao(n, max_processos, tamanho_bloco)
+        verificacoes: list[Verificacao] = []
+        profundidades = []
+        maior = -1
+        pilha: list[tuple[int, int, int | None, int | None, int]] = [(0, n, None, None, 0)]
+        while len(pilha) > 0:
+            i, f, inf, sup, profundidade = pilha.pop()
+            if i >= f:
+                continue
+            if f - i <= tamanho_bloco:
+                verificacoes.append((caminho, i, f, inf, sup))
+                profundidades.append(profundidade)
+                continue
+            v = a.valores[i]
+            meio = i + 1 + a.tamanhos[i]
+            if (inf is not None and v < inf) or (sup is not None and v > sup) or meio > f:
+                return False, -1, n
+            maior = max(maior, profundidade)
+            pilha.append((meio, f, v, sup, profundidade + 1))
+            pilha.append((i + 1, meio, inf, v, profundidade + 1))
+
+    if max_processos == 1 or len(verificacoes) <= 1:
+        alturas = [verifica_faixa(verificacao) for verificacao in verificacoes]
+    else:
+        with ProcessPoolExecutor(max_workers=max_processos) as executor:
+            alturas = list(executor.map(verifica_faixa, verificacoes))
+    for profundidade, alt in zip(profundidades, alturas):
+        if alt is None:
+            return False, -1, n
+        maior = max(maior, profundidade + alt)
+    return True, maior, n
@@ -0,0 +1,362 @@
+'''
+Mede o desempenho das funções de trab_arvores em árvores de vários tamanhos
+e formas:
+
+- balanceada: criada por cria_ABB;
+- aleatoria: criada inserindo os valores em ordem aleatória, sem balancear;
+- degenerada: todos os nós à direita (uma lista).
+
+Para cada forma e tamanho, mede o tempo de cria_ABB (com os valores da
+árvore em ordem), busca_binaria, verifica_ABB, ABB_mesmos_elementos (com a
+árvore balanceada com os mesmos valores) e caminhos_TAMMAX. Até o tamanho
+--max-instrumentado, também mede o pico de memória (tracemalloc) e a
+profundidade máxima de chamadas (sys.setprofile) de cada operação, que
+cresce com o tamanho quando uma função é recursiva.
+
+O resultado é escrito em JSON, com o expoente da curva de escala de cada
+operação (inclinação de log(tempo) por log(tamanho)). Com --compara, o
+resultado é comparado com um resultado anterior e o programa termina com
+código 1 se alguma operação ficou mais lenta que a tolerância, falhou (por
+exemplo, com RecursionError) ou não terminou no limite de tempo, ou se o
+expoente de alguma curva aumentou (por exemplo, de linear para quadrático).
+
+Uso:
+    python benchmark_arvores.py --tamanhos 1000 10000 100000 --saida base.json
+    python benchmark_arvores.py --tamanhos 1000 10000 100000 --compara base.json
+'''
+from __future__ import annotations
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+from trab_arvores import (Arvore, No, ABB_mesmos_elementos, busca_binaria, caminhos_TAMMAX,
+                          cria_ABB, verifica_ABB)
+
+# O prazo e o expoente das curvas são os do benchmark das coleções do trabalho 1
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'trabalho1'))
+from benchmark_colecao import expoente, verifica_prazo
+
+FORMAS = ['balanceada', 'aleatoria', 'degenerada']
+OPERACOES = ['cria_ABB', 'busca_binaria', 'verifica_ABB', 'ABB_mesmos_elementos', 'caminhos_TAMMAX']
+
+
+def gera_arvore(forma: str, n: int, semente: int, prazo: float = math.inf) -> Arvore:
+    '''
+    Cria a árvore com a *forma* e os valores 0 até *n* - 1.
+    Gera TimeoutError se a árvore não é criada até o instante *prazo*
+    (de time.perf_counter).
+    Exemplos
+    >>> gera_arvore('balanceada', 3, 0)
+    No(esq=No(esq=None, val=0, dir=None), val=1, dir=No(esq=None, val=2, dir=None))
+    >>> gera_arvore('degenerada', 2, 0)
+    No(esq=None, val=0, dir=No(esq=None, val=1, dir=None))
+    >>> from trab_arvores import em_ordem
+    >>> list(em_ordem(gera_arvore('aleatoria', 10, 1)))
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    '''
+    if forma == 'balanceada':
+        return cria_ABB(range(n))
+    if forma == 'degenerada':
+        t = None
+        for i in range(n - 1, -1, -1):
+            t = No(None, i, t)
+        return t
+    if forma != 'aleatoria':
+        raise ValueError('forma inválida')
+    valores = list(range(n))
+    random.Random(semente).shuffle(valores)
+    t = None
+    for i, x in enumerate(valores):
+        # Insere *x* sem balancear a árvore
+        novo = No(None, x, None)
+        if t is None:
+            t = novo
+        pai = t
+        while pai is not novo:
+            if x < pai.val:
+                if pai.esq is None:
+                    pai.esq = novo
+                pai = pai.esq
+            else:
+                if pai.dir is None:
+                    pai.dir = novo
+                pai = pai.dir
+        if i % 1024 == 0:
+            verifica_prazo(prazo)
+    return t
+
+
+# Função auxiliar que devolve as chamadas de cada operação
+def operacoes(t: Arvore, n: int, consultas: list[int]) -> dict:
+    '''
+    Devolve um dicionário que associa o nome de cada operação a uma função
+    sem parâmetros que executa a operação na árvore *t* com *n* valores, e
+    ao número de operações que ela realiza.
+    '''
+    balanceada = cria_ABB(range(n))
+
+    def busca():
+        for x in consultas:
+            busca_binaria(t, x)
+
+    return {
+        'cria_ABB': (lambda: cria_ABB(range(n)), 1),
+        'busca_binaria': (busca, len(consultas)),
+        'verifica_ABB': (lambda: verifica_ABB(t), 1),
+        'ABB_mesmos_elementos': (lambda: ABB_mesmos_elementos(t, balanceada, verifica=False), 1),
+        'caminhos_TAMMAX': (lambda: caminhos_TAMMAX(t), 1),
+    }
+
+
+def profundidade_maxima(f) -> int:
+    '''
+    Executa *f* (sem parâmetros) e devolve o número máximo de chamadas de
+    funções Python ativas ao mesmo tempo durante a execução, contando *f*.
+    Exemplos
+    >>> def r(k):
+    ...     return 0 if k == 0 else r(k - 1)
+    >>> profundidade_maxima(lambda: r(10))
+    12
+    >>> profundidade_maxima(lambda: sum(range(10)))
+    1
+    '''
+    atual = 0
+    maior = 0
+
+    def perfil(frame, evento, arg):
+        nonlocal atual, maior
+        if evento == 'call':
+            atual += 1
+            maior = max(maior, atual)
+        elif evento == 'return':
+            atual -= 1
+
+    sys.setprofile(perfil)
+    try:
+        f()
+    finally:
+        sys.setprofile(None)
+    return maior
+
+
+def pico_memoria(f) -> int:
+    '''
+    Executa *f* (sem parâmetros) e devolve o pico de memória (em bytes)
+    alocada durante a execução.
+    '''
+    tracemalloc.start()
+    try:
+        f()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def executa(forma: str, n: int, semente: int, consultas: int, instrumenta: bool,
+            prazo: float = math.inf, repeticoes: int = 3) -> dict:
+    '''
+    Executa as operações na árvore com a *forma* e *n* valores e devolve um
+    dicionário com o número de operações, o tempo (em segundos, o menor de
+    *repeticoes* execuções, que é o menos afetado por interferências) e, se
+    *instrumenta* é True, o pico de memória e a profundidade máxima de
+    chamadas de cada operação.
+    Uma operação que gera RecursionError tem no dicionário o nome do erro
+    (em 'erro') em vez das medidas.
+    Gera TimeoutError se o instante *prazo* passa antes do fim da criação da
+    árvore ou de alguma operação (uma operação iniciada não é interrompida).
+    Exemplos
+    >>> r = executa('degenerada', 100, 0, 10, True)
+    >>> sorted(r) == sorted(OPERACOES)
+    True
+    >>> r['busca_binaria']['operacoes'], r['verifica_ABB']['profundidade_maxima'] < 10
+    (10, True)
+    >>> executa('balanceada', 100, 0, 10, False, prazo=0)
+    Traceback (most recent call last):
+    ...
+    TimeoutError: prazo esgotado
+    '''
+    t = gera_arvore(forma, n, semente, prazo)
+    rng = random.Random(semente)
+    buscas = [rng.randrange(2 * n) for _ in range(consultas)]
+    resultado = {}
+    for nome, (f, num) in operacoes(t, n, buscas).items():
+        segundos = math.inf
+        try:
+            for _ in range(repeticoes):
+                verifica_prazo(prazo)
+                inicio = time.perf_counter()
+                f()
+                segundos = min(segundos, time.perf_counter() - inicio)
+            medida = {'operacoes': num, 'segundos': segundos, 'segundos_por_operacao': segundos / num}
+            if instrumenta:
+                verifica_prazo(prazo)
+                medida['pico_memoria'] = pico_memoria(f)
+                verifica_prazo(prazo)
+                medida['profundidade_maxima'] = profundidade_maxima(f)
+        except RecursionError:
+            medida = {'operacoes': num, 'erro': 'RecursionError'}
+        resultado[nome] = medida
+    return resultado
+
+
+def benchmark(formas: list[str], tamanhos: list[int], semente: int = 0, consultas: int = 1000,
+              limite: float = 60.0, max_instrumentado: int = 100000, repeticoes: int = 3,
+              verboso: bool = False) -> dict:
+    '''
+    Executa as operações para cada forma e tamanho e devolve o resultado que
+    é escrito em JSON. Se uma execução leva mais que *limite* segundos, os
+    tamanhos maiores não são executados para a mesma forma.
+    Se *verboso* é True, escreve o progresso na saída de erros.
+    Exemplos
+    >>> r = benchmark(['balanceada', 'degenerada'], [100, 1000], consultas=10)
+    >>> len(r['execucoes'])
+    4
+    >>> sorted(r['curvas']['degenerada']) == sorted(OPERACOES)
+    True
+    '''
+    execucoes = []
+    curvas: dict = {}
+    for forma in formas:
+        pontos: dict[str, list] = {nome: [] for nome in OPERACOES}
+        esgotada = False
+        for n in sorted(tamanhos):
+            execucao = {'forma': forma, 'tamanho': n}
+            execucoes.append(execucao)
+            if esgotada:
+                execucao['ignorada'] = True
+                continue
+            inicio = time.perf_counter()
+            try:
+                execucao['operacoes'] = executa(forma, n, semente, consultas, n <= max_instrumentado,
+                                                inicio + limite, repeticoes)
+            except TimeoutError:
+                execucao['esgotada'] = True
+                esgotada = True
+                continue
+            for nome in OPERACOES:
+                if 'erro' not in execucao['operacoes'][nome]:
+                    pontos[nome].append((n, execucao['operacoes'][nome]['segundos_por_operacao']))
+            if time.perf_counter() - inicio > limite:
+                esgotada = True
+            if verboso:
+                print(f'concluída: forma {forma}, tamanho {n}', file=sys.stderr)
+        curvas[forma] = {nome: {'pontos': pontos[nome], 'expoente': expoente(pontos[nome])}
+                         for nome in OPERACOES}
+    return {
+        'parametros': {'formas': formas, 'tamanhos': tamanhos, 'semente': semente,
+                       'consultas': consultas, 'limite': limite, 'max_instrumentado': max_instrumentado,
+                       'repeticoes': repeticoes},
+        'execucoes': execucoes,
+        'curvas': curvas,
+    }
+
+
+def compara(atual: dict, base: dict, tolerancia: float = 1.5, tolerancia_expoente: float = 0.3,
+            minimo_segundos: float = 0.01) -> list[str]:
+    '''
+    Devolve a descrição das regressões do resultado *atual* em relação ao
+    resultado *base*: operações que falharam em *atual*, execuções que
+    terminaram em *base* e não terminaram no limite de tempo em *atual*,
+    operações cujo tempo aumentou mais que *tolerancia* vezes e curvas cujo
+    expoente aumentou mais que *tolerancia_expoente*.
+    Operações que levaram menos que *minimo_segundos* em *base* não são
+    comparadas, porque o tempo de execuções tão curtas varia muito.
+    Exemplos
+    >>> base = {'execucoes': [{'forma': 'balanceada', 'tamanho': 10,
+    ...          'operacoes': {'verifica_ABB': {'segundos': 1.0, 'segundos_por_operacao': 1.0}}}],
+    ...         'curvas': {'balanceada': {'verifica_ABB': {'expoente': 1.0}}}}
+    >>> atual = {'execucoes': [{'forma': 'balanceada', 'tamanho': 10,
+    ...           'operacoes': {'verifica_ABB': {'segundos': 2.0, 'segundos_por_operacao': 2.0}}}],
+    ...          'curvas': {'balanceada': {'verifica_ABB': {'expoente': 2.0}}}}
+    >>> for regressao in compara(atual, base):
+    ...     print(regressao)
+    balanceada 10 verifica_ABB: 2.00 vezes mais lenta
+    balanceada verifica_ABB: expoente 1.00 -> 2.00
+    >>> compara(base, base)
+    []
+    >>> falha = {'execucoes': [{'forma': 'balanceada', 'tamanho': 10,
+    ...          'operacoes': {'verifica_ABB': {'operacoes': 1, 'erro': 'RecursionError'}}},
+    ...                        {'forma': 'balanceada', 'tamanho': 100, 'esgotada': True}],
+    ...          'curvas': {'balanceada': {'verifica_ABB': {'expoente': None}}}}
+    >>> base['execucoes'].append({'forma': 'balanceada', 'tamanho': 100, 'operacoes': {}})
+    >>> for regressao in compara(falha, base):
+    ...     print(regressao)
+    balanceada 10 verifica_ABB: RecursionError
+    balanceada 100: não terminou no limite de tempo
+    '''
+    regressoes = []
+    anteriores = {(e['forma'], e['tamanho']): e for e in base['execucoes'] if 'operacoes' in e}
+    for execucao in atual['execucoes']:
+        anterior = anteriores.get((execucao['forma'], execucao['tamanho']))
+        if 'operacoes' not in execucao:
+            # Os tamanhos ignorados depois de uma execução esgotada não são repetidos
+            if execucao.get('esgotada') and anterior is not None:
+                regressoes.append(f'{execucao["forma"]} {execucao["tamanho"]}: '
+                                  'não terminou no limite de tempo')
+            continue
+        for nome, medida in execucao['operacoes'].items():
+            if 'erro' in medida:
+                regressoes.append(f'{execucao["forma"]} {execucao["tamanho"]} {nome}: {medida["erro"]}')
+                continue
+            if anterior is None or nome not in anterior['operacoes']:
+                continue
+            if 'erro' in anterior['operacoes'][nome] or anterior['operacoes'][nome]['segundos'] < minimo_segundos:
+                continue
+            antes = anterior['operacoes'][nome]['segundos_por_operacao']
+            agora = medida['segundos_por_operacao']
+            if agora / antes > tolerancia:
+                regressoes.append(f'{execucao["forma"]} {execucao["tamanho"]} {nome}: '
+                                  f'{agora / antes:.2f} vezes mais lenta')
+    for forma, curvas in atual['curvas'].items():
+        for nome, curva in curvas.items():
+            antes = base['curvas'].get(forma, {}).get(nome, {}).get('expoente')
+            agora = curva['expoente']
+            if antes is not None and agora is not None and agora - antes > tolerancia_expoente:
+                regressoes.append(f'{forma} {nome}: expoente {antes:.2f} -> {agora:.2f}')
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mede o desempenho das funções de trab_arvores.')
+    parser.add_argument('--formas', nargs='+', default=FORMAS, choices=FORMAS)
+    parser.add_argument('--tamanhos', nargs='+', type=int, default=[10 ** k for k in range(3, 8)])
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--consultas', type=int, default=1000, help='número de buscas')
+    parser.add_argument('--limite', type=float, default=60.0,
+                        help='tempo máximo (em segundos) para cada forma e tamanho; ao passar dele a '
+                             'execução para antes da próxima operação e não mede os tamanhos maiores da forma')
+    parser.add_argument('--max-instrumentado', type=int, default=100000,
+                        help='maior tamanho em que a memória e a profundidade de chamadas são medidas')
+    parser.add_argument('--repeticoes', type=int, default=3, help='execuções de cada operação (vale a mais rápida)')
+    parser.add_argument('--saida', help='arquivo JSON (padrão: saída padrão)')
+    parser.add_argument('--verboso', action='store_true', help='escreve o progresso na saída de erros')
+    parser.add_argument('--compara', help='arquivo JSON de um resultado anterior')
+    parser.add_argument('--tolerancia', type=float, default=1.5,
+                        help='razão entre os tempos a partir da qual uma operação é uma regressão')
+    args = parser.parse_args()
+
+    resultado = benchmark(args.formas, args.tamanhos, args.semente, args.consultas,
+                          args.limite, args.max_instrumentado, args.repeticoes, args.verboso)
+    if args.saida is None:
+        json.dump(resultado, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.saida, 'w') as arquivo:
+            json.dump(resultado, arquivo, indent=2)
+
+    if args.compara is not None:
+        with open(args.compara) as arquivo:
+            base = json.load(arquivo)
+        regressoes = compara(resultado, base, args.tolerancia)
+        for regressao in regressoes:
+            print(f'regressão: {regressao}', file=sys.stderr)
+        if len(regressoes) > 0:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
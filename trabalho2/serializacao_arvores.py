@@ -0,0 +1,269 @@
+'''
+Serialização de árvores binárias de busca (ABB) em um formato binário compacto.
+
+O arquivo tem um cabeçalho de 16 bytes seguido de dois arranjos tipados com
+um item por nó, na ordem dos nós em pré-ordem (raiz, esquerda, direita):
+
+- valores: o valor do nó, com o código de tipo do módulo array escolhido
+  na escrita ('q' por padrão, inteiros de 64 bits);
+- tamanhos: o número de nós da subárvore esquerda do nó ('I' ou 'Q').
+
+Em pré-ordem, a subárvore com raiz na posição i ocupa as posições i até
+i + k - 1, onde k é o seu número de nós. O filho esquerdo está na posição
+i + 1 e o filho direito na posição i + 1 + tamanhos[i], e um filho existe
+se a sua faixa de posições não é vazia. Por isso a estrutura pode ser
+percorrida sem ponteiros, diretamente no arquivo (ArvoreMapeada).
+
+Cabeçalho: a assinatura b'ABB1', o código de tipo dos valores, o código de
+tipo dos tamanhos, a ordem dos bytes (0 para little-endian e 1 para
+big-endian), um byte sem uso e o número de nós (8 bytes, little-endian).
+'''
+from __future__ import annotations
+from array import array
+import mmap
+import struct
+import sys
+from trab_arvores import Arvore, No
+
+ASSINATURA = b'ABB1'
+CABECALHO = struct.Struct('<4sccBxQ')
+ORDENS = ['little', 'big']
+
+
+def arranjos_preordem(t: Arvore, tipo: str = 'q') -> tuple[array, array]:
+    '''
+    Devolve os arranjos de valores (com o código de tipo *tipo*) e de
+    tamanhos das subárvores esquerdas dos nós da árvore *t* em pré-ordem.
+    Exemplos
+    >>> from trab_arvores import cria_ABB
+    >>> arranjos_preordem(cria_ABB([1, 2, 3, 4, 5]))
+    (array('q', [3, 1, 2, 4, 5]), array('I', [2, 0, 0, 0, 0]))
+    >>> arranjos_preordem(None, 'i')
+    (array('i'), array('I'))
+    '''
+    valores = array(tipo)
+    tamanhos = array('Q')
+    # A pilha tem nós que ainda serão visitados e, entre o filho direito e o
+    # filho esquerdo de um nó, a posição do nó como um inteiro, que é
+    # desempilhada quando toda a subárvore esquerda já foi visitada.
+    pilha: list[No | int | None] = [t]
+    while len(pilha) > 0:
+        no = pilha.pop()
+        if no is None:
+            continue
+        if isinstance(no, int):
+            tamanhos[no] = len(valores) - no - 1
+            continue
+        pilha.append(no.dir)
+        pilha.append(len(valores))
+        pilha.append(no.esq)
+        valores.append(no.val)
+        tamanhos.append(0)
+    if len(valores) < 2 ** 32:
+        tamanhos = array('I', tamanhos)
+    return valores, tamanhos
+
+
+def arvore_de_arranjos(valores, tamanhos) -> Arvore:
+    '''
+    Cria a árvore com os arranjos (ou sequências) de *valores* e *tamanhos*
+    das subárvores esquerdas em pré-ordem. É a inversa de arranjos_preordem.
+    Exemplos
+    >>> arvore_de_arranjos([3, 1, 2, 4, 5], [2, 0, 0, 0, 0])
+    No(esq=No(esq=None, val=1, dir=No(esq=None, val=2, dir=None)), val=3, dir=No(esq=None, val=4, dir=No(esq=None, val=5, dir=None)))
+    >>> arvore_de_arranjos([], []) is None
+    True
+    >>> arvore_de_arranjos([2, 1], [2, 0])
+    Traceback (most recent call last):
+    ...
+    ValueError: tamanhos inválidos
+    '''
+    n = len(valores)
+    if n == 0:
+        return None
+    if tamanhos[0] >= n:
+        raise ValueError('tamanhos inválidos')
+    raiz = No(None, valores[0], None)
+    # A pilha guarda, para cada nó cuja subárvore ainda tem posições a
+    # preencher, o nó, a posição onde começa a subárvore direita e a
+    # posição onde termina a subárvore.
+    pilha = [(raiz, 1 + tamanhos[0], n)]
+    for i in range(1, n):
+        while pilha[-1][2] <= i:
+            pilha.pop()
+        pai, inicio_dir, fim = pilha[-1]
+        no = No(None, valores[i], None)
+        if i < inicio_dir:
+            pai.esq = no
+            fim = inicio_dir
+        else:
+            pai.dir = no
+        if i + 1 + tamanhos[i] > fim:
+            raise ValueError('tamanhos inválidos')
+        pilha.append((no, i + 1 + tamanhos[i], fim))
+    return raiz
+
+
+def salva(t: Arvore, caminho: str, tipo: str = 'q'):
+    '''
+    Escreve a árvore *t* no arquivo *caminho*, com os valores armazenados
+    com o código de tipo *tipo* do módulo array.
+    Exemplos
+    >>> import os, tempfile
+    >>> from trab_arvores import cria_ABB
+    >>> caminho = os.path.join(tempfile.mkdtemp(), 'arvore.abb')
+    >>> salva(cria_ABB([1, 2, 3]), caminho, 'i')
+    >>> os.path.getsize(caminho)
+    40
+    >>> carrega(caminho)
+    No(esq=No(esq=None, val=1, dir=None), val=2, dir=No(esq=None, val=3, dir=None))
+    '''
+    valores, tamanhos = arranjos_preordem(t, tipo)
+    salva_arranjos(valores, tamanhos, caminho)
+
+
+def salva_arranjos(valores: array, tamanhos: array, caminho: str):
+    '''
+    Escreve no arquivo *caminho* a árvore com os arranjos de *valores* e
+    *tamanhos* das subárvores esquerdas em pré-ordem.
+    '''
+    if tamanhos.typecode == 'Q' and len(tamanhos) < 2 ** 32:
+        tamanhos = array('I', tamanhos)
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(CABECALHO.pack(ASSINATURA, valores.typecode.encode(), tamanhos.typecode.encode(),
+                                     ORDENS.index(sys.byteorder), len(valores)))
+        valores.tofile(arquivo)
+        tamanhos.tofile(arquivo)
+
+
+# Função auxiliar que lê e verifica o cabeçalho
+def le_cabecalho(dados: bytes) -> tuple[str, str, str, int]:
+    '''
+    Devolve o código de tipo dos valores, o código de tipo dos tamanhos, a
+    ordem dos bytes e o número de nós do cabeçalho no início de *dados*.
+    Exemplos
+    >>> le_cabecalho(CABECALHO.pack(b'ABB1', b'q', b'I', 0, 7))
+    ('q', 'I', 'little', 7)
+    >>> le_cabecalho(b'ABB2' + bytes(12))
+    Traceback (most recent call last):
+    ...
+    ValueError: arquivo inválido
+    '''
+    if len(dados) < CABECALHO.size:
+        raise ValueError('arquivo inválido')
+    assinatura, tipo, tipo_tamanho, ordem, n = CABECALHO.unpack_from(dados)
+    if assinatura != ASSINATURA or ordem >= len(ORDENS):
+        raise ValueError('arquivo inválido')
+    return tipo.decode(), tipo_tamanho.decode(), ORDENS[ordem], n
+
+
+def carrega(caminho: str) -> Arvore:
+    '''
+    Lê e devolve a árvore escrita por salva no arquivo *caminho*.
+    '''
+    with open(caminho, 'rb') as arquivo:
+        tipo, tipo_tamanho, ordem, n = le_cabecalho(arquivo.read(CABECALHO.size))
+        valores = array(tipo)
+        tamanhos = array(tipo_tamanho)
+        try:
+            valores.fromfile(arquivo, n)
+            tamanhos.fromfile(arquivo, n)
+        except EOFError:
+            raise ValueError('arquivo inválido')
+    if ordem != sys.byteorder:
+        valores.byteswap()
+        tamanhos.byteswap()
+    return arvore_de_arranjos(valores, tamanhos)
+
+
+class ArvoreMapeada:
+    '''
+    Uma árvore escrita por salva, lida sob demanda de um arquivo mapeado na
+    memória (mmap). A busca acessa apenas as posições do caminho da raiz até
+    o valor, sem criar os nós, e abrir a árvore não lê o arquivo todo.
+    O arquivo deve ter a mesma ordem de bytes da máquina.
+
+    Exemplos
+    >>> import os, tempfile
+    >>> from trab_arvores import cria_ABB
+    >>> caminho = os.path.join(tempfile.mkdtemp(), 'arvore.abb')
+    >>> salva(cria_ABB(range(0, 100, 2)), caminho)
+    >>> with ArvoreMapeada(caminho) as a:
+    ...     len(a), a.busca_binaria(42), a.busca_binaria(43), 98 in a, -2 in a
+    (50, True, False, True, False)
+    >>> with ArvoreMapeada(caminho) as a:
+    ...     a.para_arvore() == cria_ABB(range(0, 100, 2))
+    True
+    '''
+    n: int
+    valores: memoryview
+    tamanhos: memoryview
+
+    def __init__(self, caminho: str):
+        '''
+        Abre a árvore escrita no arquivo *caminho*.
+        '''
+        with open(caminho, 'rb') as arquivo:
+            self.mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            tipo, tipo_tamanho, ordem, self.n = le_cabecalho(self.mapa)
+            if ordem != sys.byteorder:
+                raise ValueError('ordem dos bytes diferente da máquina')
+            inicio = CABECALHO.size
+            meio = inicio + self.n * array(tipo).itemsize
+            fim = meio + self.n * array(tipo_tamanho).itemsize
+            if fim > len(self.mapa):
+                raise ValueError('arquivo inválido')
+            dados = memoryview(self.mapa)
+            self.valores = dados[inicio:meio].cast(tipo)
+            self.tamanhos = dados[meio:fim].cast(tipo_tamanho)
+            dados.release()
+        except BaseException:
+            self.mapa.close()
+            raise
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __contains__(self, x: int) -> bool:
+        return self.busca_binaria(x)
+
+    def __enter__(self) -> ArvoreMapeada:
+        return self
+
+    def __exit__(self, *excecao):
+        self.fecha()
+
+    def fecha(self):
+        '''
+        Libera o mapeamento do arquivo.
+        '''
+        self.valores.release()
+        self.tamanhos.release()
+        self.mapa.close()
+
+    def busca_binaria(self, x: int) -> bool:
+        '''
+        Verifica se o valor *x* está na árvore.
+        '''
+        valores = self.valores
+        tamanhos = self.tamanhos
+        # A subárvore atual ocupa as posições i até fim - 1
+        i = 0
+        fim = self.n
+        while i < fim:
+            v = valores[i]
+            if x == v:
+                return True
+            if x < v:
+                fim = i + 1 + tamanhos[i]
+                i += 1
+            else:
+                i += 1 + tamanhos[i]
+        return False
+
+    def para_arvore(self) -> Arvore:
+        '''
+        Cria e devolve a árvore com nós No.
+        '''
+        return arvore_de_arranjos(self.valores, self.tamanhos)
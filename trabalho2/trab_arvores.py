@@ -1,5 +1,10 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import IO
+from typing import Iterable, Iterator
 
 @dataclass
 class No:
@@ -10,15 +15,83 @@ class No:
     val: int
     dir: Arvore
 
+@dataclass
+class NoAumentado(No):
+    '''
+    Um nó em uma árvore binária de busca (ABB) que guarda o número de
+    elementos (*tam*), a altura (*alt*) e a impressão digital (*imp*) da sua
+    subárvore.
+    Os valores são mantidos por *insere_ABB* e *remove_ABB*, que usam a altura
+    para manter a árvore balanceada (AVL), e todos os nós de uma árvore
+    aumentada devem ser do tipo NoAumentado.
+    Os três valores são calculados na criação do nó a partir dos filhos,
+    que devem ser aumentados.
+    Exemplos:
+    >>> NoAumentado(NoAumentado(None, 1, None), 2, None)
+    NoAumentado(esq=NoAumentado(esq=None, val=1, dir=None, tam=1, alt=0), val=2, dir=None, tam=2, alt=1)
+    '''
+    tam: int = field(default=1, init=False)
+    alt: int = field(default=0, init=False)
+    imp: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        atualiza(self)
+
 # Árvore binária de busca (ABB)
 Arvore = No | None
 
+# A impressão digital de uma árvore é a soma (módulo 2**64) dos valores
+# misturados de todos os seus elementos. Ela não depende da estrutura da
+# árvore, e pode ser atualizada somando ou subtraindo um elemento.
+MASCARA = 2 ** 64 - 1
+
+# Função auxiliar que mistura os bits de um valor
+def mistura(x: int) -> int:
+    '''
+    Devolve um inteiro de 64 bits obtido misturando os bits de *x* (função
+    final do splitmix64), de modo que valores próximos têm resultados diferentes.
+    Exemplos:
+    >>> mistura(0)
+    16294208416658607535
+    >>> mistura(1) != mistura(2)
+    True
+    '''
+    z = (x + 0x9E3779B97F4A7C15) & MASCARA
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASCARA
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASCARA
+    return z ^ (z >> 31)
+
+# Função auxiliar para encontrar a impressão digital de uma árvore
+def impressao(t: Arvore) -> int:
+    '''
+    Devolve a impressão digital dos elementos da árvore *t*. Árvores com os
+    mesmos elementos têm a mesma impressão digital, e árvores com impressões
+    digitais diferentes têm elementos diferentes.
+    Em uma árvore aumentada a impressão digital está guardada no nó.
+    Exemplos:
+    >>> impressao(None)
+    0
+    >>> impressao(cria_ABB([1, 2, 3])) == impressao(No(None, 1, No(None, 2, No(None, 3, None))))
+    True
+    >>> impressao(aumenta(cria_ABB([1, 2, 3]))) == impressao(cria_ABB([1, 2, 3]))
+    True
+    >>> impressao(cria_ABB([1, 2, 3])) == impressao(cria_ABB([1, 2, 4]))
+    False
+    '''
+    if t is None:
+        return 0
+    if isinstance(t, NoAumentado):
+        return t.imp
+    return sum(mistura(x) for x in em_ordem(t)) & MASCARA
+
 
 # Função 1: Cria uma árvore binária de busca (ABB) a partir de uma lista de valores
-def cria_ABB(valores: list[int]) -> Arvore:
+def cria_ABB(valores: Iterable[int], n: int | None = None) -> Arvore:
     '''
     Cria e retorna a árvore binária de busca (ABB) que contém os valores
     do vetor *valores* que estão em ordem crescente.
+    *valores* pode ser qualquer sequência, ou um iterável com *n* valores.
+    Cada valor é lido uma única vez, em ordem, e nenhuma parte de *valores* é copiada.
 
     Exemplos:
 
@@ -45,23 +118,62 @@ def cria_ABB(valores: list[int]) -> Arvore:
     # Árvore com seis nós: (( 1 ( 2 )) 3 (( 4 ) 5 ( 6 )))
     >>> cria_ABB([1, 2, 3, 4, 5, 6])
     No(esq=No(esq=None, val=1, dir=No(esq=None, val=2, dir=None)), val=3, dir=No(esq=No(esq=None, val=4, dir=None), val=5, dir=No(esq=None, val=6, dir=None)))
+
+    # A partir de um iterador com tamanho conhecido: (( 1 ( 2 )) 3 ( 4 ( 5 )))
+    >>> cria_ABB(iter(range(1, 6)), 5) == cria_ABB([1, 2, 3, 4, 5])
+    True
+    >>> cria_ABB(iter([1, 2]), 3)
+    Traceback (most recent call last):
+    ...
+    ValueError: valores insuficientes
     '''
-    # Retorna um Nó, onde o valor do nó é o valor do meio do vetor
-    # e os filhos são as árvores criadas com os valores menores e maiores que o valor do meio
-    if len(valores) == 0:
-        return None
-    inicio = 0
-    fim = len(valores) - 1
-    meio = (inicio + fim) // 2
-    return No(cria_ABB(valores[:meio]), valores[meio], cria_ABB(valores[meio+1:]))
+    # O valor da raiz é o valor do meio do vetor e os filhos são as árvores
+    # criadas com os valores menores e maiores que o valor do meio.
+    # Uma subárvore com k valores tem (k - 1) // 2 valores na esquerda.
+    # Os nós são criados descendo pelas subárvores esquerdas e recebem os seus
+    # valores na ordem em que são desempilhados (percurso em ordem), que é a
+    # ordem dos valores no vetor. A pilha guarda, para cada nó que ainda não
+    # recebeu valor, o tamanho da sua subárvore direita.
+    if n is None:
+        n = len(valores) # type: ignore
+    it = iter(valores)
+    sentinela = No(None, 0, None)
+    pilha: list[tuple[No, int]] = []
+    pai = sentinela
+    esquerda = True
+    k = n
+    while True:
+        while k > 0:
+            no = No(None, 0, None)
+            if esquerda:
+                pai.esq = no
+            else:
+                pai.dir = no
+            tam_esq = (k - 1) // 2
+            pilha.append((no, k - tam_esq - 1))
+            pai = no
+            esquerda = True
+            k = tam_esq
+        if len(pilha) == 0:
+            return sentinela.esq
+        no, k = pilha.pop()
+        try:
+            no.val = next(it)
+        except StopIteration:
+            raise ValueError('valores insuficientes') from None
+        pai = no
+        esquerda = False
 
 
 # Função 2: Verifica se duas ABBs têm os mesmos elementos
-def ABB_mesmos_elementos(t: Arvore, r: Arvore) -> bool:
+def ABB_mesmos_elementos(t: Arvore, r: Arvore, verifica: bool = True) -> bool:
     '''
     Verifica e devolve True se as ABBs *t* e *r* têm os mesmos elementos,
     mesmo que as árvores não tenham a mesma estrutura (manténdo a propriedade de uma ABB)
     senão retorna False.
+    Se *verifica* for False, as árvores não são verificadas com *verifica_ABB*.
+    Se as duas árvores são aumentadas e têm números de elementos ou impressões
+    digitais diferentes, o resultado é False sem percorrer as árvores.
 
     Exemplos:
 
@@ -112,34 +224,142 @@ def ABB_mesmos_elementos(t: Arvore, r: Arvore) -> bool:
     # Árvore *t* com quatro nós e *r* com três nós
     >>> ABB_mesmos_elementos(No(No(None, 1, None), 2, No(None, 3, No(None, 4, None))), No(None, 1, No(None, 2, No(None, 3, None))))
     False
+
+    # Árvores grandes com os mesmos valores e estruturas diferentes, sem verificação
+    >>> t = cria_ABB(range(100000))
+    >>> r = None
+    >>> for i in range(99999, -1, -1):
+    ...     r = No(None, i, r)
+    >>> ABB_mesmos_elementos(t, r, verifica=False)
+    True
+
+    # Árvores aumentadas com impressões digitais diferentes
+    >>> ABB_mesmos_elementos(aumenta(t), aumenta(cria_ABB(range(1, 100001))))
+    False
     '''
-    # Se as duas árvores não são vazias, mas têm número de elementos diferentes, 
-    # elas não têm os mesmos elementos
-    # Se as duas árvores não são vazias e têm o mesmo número de elementos,
-    # a função *ABB_mesmos_elementos_aux* verifica se todas as chaves de *t* estão em *r*
-    assert verifica_ABB(t) and verifica_ABB(r)
-    if num_elementos(t) != num_elementos(r):
+    # As duas árvores são percorridas em ordem ao mesmo tempo, e têm os mesmos
+    # elementos se as duas sequências (crescentes) de valores são iguais.
+    # A comparação para no primeiro valor diferente ou quando uma acaba antes da outra.
+    if isinstance(t, NoAumentado) and isinstance(r, NoAumentado) and (t.tam != r.tam or t.imp != r.imp):
         return False
-    return ABB_mesmos_elementos_aux(t, r)
+    if verifica:
+        assert verifica_ABB(t) and verifica_ABB(r)
+    valores_t = em_ordem(t)
+    valores_r = em_ordem(r)
+    fim = object()
+    while True:
+        a = next(valores_t, fim)
+        b = next(valores_r, fim)
+        if a is fim or b is fim:
+            return a is b
+        if a != b:
+            return False
 
-# Função auxiliar para verificar se duas ABBs têm os mesmos elementos
-def ABB_mesmos_elementos_aux(t: Arvore, r: Arvore) -> bool:
+# Função auxiliar para percorrer uma árvore em ordem
+def em_ordem(t: Arvore) -> Iterator[int]:
     '''
-    Verifica se as ABBs *t* e *r* têm os mesmos elementos,
-    mesmo que as árvores não tenham a mesma estrutura (manténdo a propriedade de uma ABB)
-    senão retorna False.
-    Como essa função é apenas uma auxiliar da função *ABB_mesmos_elementos*,
-    ela não possui exemplos, pois ela não leva em consideração todos os casos possíveis.
-    Por isso os exemplos estão apenas na função principal *ABB_mesmos_elementos*.
-    '''
-    # Nesse caso a função *num_elementos* já foi chamada e sabemos que as árvores
-    # têm o mesmo número de elementos.
-    # Portanto, se *t* é vazia, *r* também é vazia e a função retorna True.
-    # Senão, a função verifica se todos os elementos de *t* estão em *r*.
-    # E as árvores *t* e *r*, na primeira chamada dessa função serão sempre Nós.
-    if t is None:
-        return True
-    return busca_binaria(r, t.val) and ABB_mesmos_elementos_aux(t.esq, r) and ABB_mesmos_elementos_aux(t.dir, r)
+    Devolve um iterador com os valores da árvore *t* em ordem (esquerda, raiz, direita).
+    A memória usada é proporcional à altura da árvore.
+    Exemplos:
+    >>> list(em_ordem(None))
+    []
+    >>> list(em_ordem(No(No(None, 1, None), 2, No(None, 3, No(None, 4, None)))))
+    [1, 2, 3, 4]
+    '''
+    for no in nos_em_ordem(t):
+        yield no.val
+
+# Percursos da árvore com pilhas (ou filas) explícitas, que não dependem do
+# limite de recursão e funcionam com árvores de qualquer altura
+
+def nos_em_ordem(t: Arvore) -> Iterator[No]:
+    '''
+    Devolve um iterador com os nós da árvore *t* em ordem (esquerda, raiz, direita).
+    A memória usada é proporcional à altura da árvore.
+    Exemplos:
+    >>> [no.val for no in nos_em_ordem(cria_ABB([1, 2, 3]))]
+    [1, 2, 3]
+    '''
+    pilha: list[No] = []
+    while t is not None or len(pilha) > 0:
+        while t is not None:
+            pilha.append(t)
+            t = t.esq
+        no = pilha.pop()
+        yield no
+        t = no.dir
+
+def nos_preordem(t: Arvore) -> Iterator[No]:
+    '''
+    Devolve um iterador com os nós da árvore *t* em pré-ordem (raiz, esquerda, direita).
+    Exemplos:
+    >>> [no.val for no in nos_preordem(cria_ABB([1, 2, 3, 4, 5]))]
+    [3, 1, 2, 4, 5]
+    '''
+    for no, _ in profundidades(t):
+        yield no
+
+def profundidades(t: Arvore) -> Iterator[tuple[No, int]]:
+    '''
+    Devolve um iterador com os nós da árvore *t* em pré-ordem, cada um com a
+    sua profundidade (a raiz tem profundidade 0).
+    Exemplos:
+    >>> [(no.val, p) for no, p in profundidades(cria_ABB([1, 2, 3, 4, 5]))]
+    [(3, 0), (1, 1), (2, 2), (4, 1), (5, 2)]
+    '''
+    pilha: list[tuple[No, int]] = []
+    if t is not None:
+        pilha.append((t, 0))
+    while len(pilha) > 0:
+        no, profundidade = pilha.pop()
+        yield no, profundidade
+        # A subárvore direita é empilhada primeiro para que a esquerda seja visitada antes
+        if no.dir is not None:
+            pilha.append((no.dir, profundidade + 1))
+        if no.esq is not None:
+            pilha.append((no.esq, profundidade + 1))
+
+def nos_posordem(t: Arvore) -> Iterator[No]:
+    '''
+    Devolve um iterador com os nós da árvore *t* em pós-ordem (esquerda, direita, raiz).
+    Exemplos:
+    >>> [no.val for no in nos_posordem(cria_ABB([1, 2, 3, 4, 5]))]
+    [2, 1, 5, 4, 3]
+    '''
+    # Cada nó é empilhado duas vezes: a primeira para empilhar os filhos e a
+    # segunda (com *visitado* True) para devolver o nó depois dos filhos
+    pilha: list[tuple[No, bool]] = []
+    if t is not None:
+        pilha.append((t, False))
+    while len(pilha) > 0:
+        no, visitado = pilha.pop()
+        if visitado:
+            yield no
+        else:
+            pilha.append((no, True))
+            if no.dir is not None:
+                pilha.append((no.dir, False))
+            if no.esq is not None:
+                pilha.append((no.esq, False))
+
+def nos_em_largura(t: Arvore) -> Iterator[No]:
+    '''
+    Devolve um iterador com os nós da árvore *t* em largura (por níveis, da
+    esquerda para a direita). A memória usada é proporcional à largura da árvore.
+    Exemplos:
+    >>> [no.val for no in nos_em_largura(cria_ABB([1, 2, 3, 4, 5]))]
+    [3, 1, 4, 2, 5]
+    '''
+    fila: deque[No] = deque()
+    if t is not None:
+        fila.append(t)
+    while len(fila) > 0:
+        no = fila.popleft()
+        yield no
+        if no.esq is not None:
+            fila.append(no.esq)
+        if no.dir is not None:
+            fila.append(no.dir)
 
 # Função auxiliar para encontrar o número de elementos de uma árvore
 def num_elementos(t: Arvore) -> int:
@@ -152,10 +372,15 @@ def num_elementos(t: Arvore) -> int:
     1
     >>> num_elementos(No(No(None, 1, None), 2, No(None, 3, None)))
     3
+    >>> num_elementos(aumenta(No(No(None, 1, None), 2, No(None, 3, None))))
+    3
     '''
+    # Em uma árvore aumentada o número de elementos está guardado no nó
     if t is None:
         return 0
-    return 1 + num_elementos(t.esq) + num_elementos(t.dir)
+    if isinstance(t, NoAumentado):
+        return t.tam
+    return sum(1 for _ in nos_preordem(t))
 
 # Função auxiliar que verifica se uma árvore é uma ABB
 def verifica_ABB(t: Arvore) -> bool:
@@ -172,17 +397,44 @@ def verifica_ABB(t: Arvore) -> bool:
     False
     >>> verifica_ABB(No(No(None, 2, None), 1, No(None, 3, None)))
     False
+
+    # Árvore degenerada (todos os nós à direita) com 100000 nós
+    >>> t = None
+    >>> for i in range(99999, -1, -1):
+    ...     t = No(None, i, t)
+    >>> verifica_ABB(t)
+    True
     '''
-    # Se a árvore é vazia, ela é uma ABB
-    # Se a árvore é um nó, ela é uma ABB se as subárvores esquerda e direita são ABBs
-    # e se o valor do nó é maior que o maior valor da subárvore esquerda e menor que o menor valor da subárvore direita
-    if t is None:
-        return True
-    if t.esq is not None and maximo(t.esq) > t.val:
-        return False
-    if t.dir is not None and minimo(t.dir) < t.val:
-        return False
-    return verifica_ABB(t.esq) and verifica_ABB(t.dir)
+    return no_invalido(t) is None
+
+# Função auxiliar que encontra um nó que não respeita a propriedade de uma ABB
+def no_invalido(t: Arvore) -> No | None:
+    '''
+    Devolve o primeiro nó (em pré-ordem) da árvore *t* cujo valor não está
+    entre os limites definidos pelos seus ancestrais, ou None se *t* é uma ABB.
+    Exemplos:
+    >>> no_invalido(No(No(None, 1, None), 2, No(None, 3, None))) is None
+    True
+    >>> no_invalido(No(No(None, 1, No(None, 5, None)), 4, No(None, 6, None)))
+    No(esq=None, val=5, dir=None)
+    '''
+    # Cada nó da subárvore esquerda de um nó deve ser menor ou igual ao valor do nó
+    # e cada nó da subárvore direita deve ser maior ou igual ao valor do nó.
+    # A pilha guarda os nós a visitar com os limites (inferior, superior) dos seus valores
+    # (None quando não há limite).
+    pilha: list[tuple[No, int | None, int | None]] = []
+    if t is not None:
+        pilha.append((t, None, None))
+    while len(pilha) > 0:
+        no, inferior, superior = pilha.pop()
+        if (inferior is not None and no.val < inferior) or (superior is not None and no.val > superior):
+            return no
+        # A subárvore direita é empilhada primeiro para que a esquerda seja visitada antes
+        if no.dir is not None:
+            pilha.append((no.dir, no.val, superior))
+        if no.esq is not None:
+            pilha.append((no.esq, inferior, no.val))
+    return None
 
 # Função auxiliar para encontrar o maior valor de uma árvore
 def maximo(t: No) -> int:
@@ -196,9 +448,9 @@ def maximo(t: No) -> int:
     >>> maximo(No(No(None, 1, None), 2, No(None, 3, No(None, 4, None))))
     4
     '''
-    if t.dir is None:
-        return t.val
-    return maximo(t.dir)
+    while t.dir is not None:
+        t = t.dir
+    return t.val
 
 # Função auxiliar para encontrar o menor valor de uma árvore
 def minimo(t: No) -> int:
@@ -212,9 +464,9 @@ def minimo(t: No) -> int:
     >>> minimo(No(No(None, 2, None), 3, No(None, 4, No(None, 5, None))))
     2
     '''
-    if t.esq is None:
-        return t.val
-    return minimo(t.esq)
+    while t.esq is not None:
+        t = t.esq
+    return t.val
 
 # Função auxiliar para encontrar um elemento em uma árvore binária de busca
 def busca_binaria(t: Arvore, x: int) -> bool:
@@ -232,21 +484,67 @@ def busca_binaria(t: Arvore, x: int) -> bool:
     >>> busca_binaria(No(No(None, 1, None), 2, No(None, 3, None)), 4)
     False
     '''
-    if t is None:
-        return False
-    if t.val == x:
-        return True
-    if x < t.val:
-        return busca_binaria(t.esq, x)
-    return busca_binaria(t.dir, x)
+    while t is not None:
+        if t.val == x:
+            return True
+        t = t.esq if x < t.val else t.dir
+    return False
+
+# Busca vários valores em uma árvore binária de busca
+def busca_lote(t: Arvore, consultas: list[int], ordenadas: bool = False) -> list[bool]:
+    '''
+    Devolve uma lista que indica, para cada valor de *consultas*, se ele está
+    na árvore binária de busca *t*.
+    As consultas são ordenadas (a não ser que *ordenadas* seja True, indicando
+    que já estão em ordem crescente) e descem juntas pela árvore: em cada nó,
+    as consultas menores que o valor do nó seguem para a esquerda e as maiores
+    para a direita, de modo que cada nó é visitado no máximo uma vez e as
+    subárvores sem consultas não são visitadas.
+    Exemplos:
+    >>> t = cria_ABB([1, 3, 5, 7, 9])
+    >>> busca_lote(t, [7, 2, 9, 1, 10, 7])
+    [True, False, True, True, False, True]
+    >>> busca_lote(t, [0, 1, 2, 3], ordenadas=True)
+    [False, True, False, True]
+    >>> busca_lote(None, [1])
+    [False]
+    '''
+    if ordenadas:
+        ordem = list(range(len(consultas)))
+        valores = consultas
+    else:
+        ordem = sorted(range(len(consultas)), key=lambda i: consultas[i])
+        valores = [consultas[i] for i in ordem]
+    resultado = [False] * len(consultas)
+    # A pilha guarda os nós a visitar com o intervalo [inicio, fim) das
+    # consultas (ordenadas) que chegam até o nó
+    pilha: list[tuple[No, int, int]] = []
+    if t is not None and len(valores) > 0:
+        pilha.append((t, 0, len(valores)))
+    while len(pilha) > 0:
+        no, inicio, fim = pilha.pop()
+        meio_inicio = bisect_left(valores, no.val, inicio, fim)
+        meio_fim = bisect_right(valores, no.val, meio_inicio, fim)
+        for i in range(meio_inicio, meio_fim):
+            resultado[ordem[i]] = True
+        if no.esq is not None and inicio < meio_inicio:
+            pilha.append((no.esq, inicio, meio_inicio))
+        if no.dir is not None and meio_fim < fim:
+            pilha.append((no.dir, meio_fim, fim))
+    return resultado
 
 
 # Função 3: Encontra todos os caminhos de tamanho máximo em uma árvore
-def caminhos_TAMMAX(t: Arvore) -> list[list[int]]:
+def caminhos_TAMMAX(t: Arvore, limite: int | None = None, a_partir_de: str | None = None,
+                    alt: dict[int, int] | None = None) -> list[list[int]]:
     r'''
     Devolve uma lista com todos os caminhos de tamanho máximo da árvore *t*, ou seja,
     uma lista com caminhos(listas) que contém os valores dos nós que pertencem ao caminho
     onde a altura + 1 da árvore é o tamanho do caminho.
+    Se *limite* não é None, devolve no máximo *limite* caminhos, e se
+    *a_partir_de* não é None, devolve apenas os caminhos depois do caminho
+    com esse cursor, e *alt* pode ter as alturas dos nós para as próximas
+    páginas (veja gera_caminhos).
 
     Exemplos:
 
@@ -285,15 +583,242 @@ def caminhos_TAMMAX(t: Arvore) -> list[list[int]]:
 
     >>> caminhos_TAMMAX(No(No(No(None, 3, No(None, 4, None)), 8, None), 2, No(No(None, 7, None), 3, No(No(None, 2, None), 5, None))))
     [[2, 8, 3, 4], [2, 3, 5, 2]]
+
+    # Paginação
+    >>> t = cria_ABB(range(15))
+    >>> caminhos_TAMMAX(t, limite=3)
+    [[7, 3, 1, 0], [7, 3, 1, 2], [7, 3, 5, 4]]
+    >>> caminhos_TAMMAX(t, limite=2, a_partir_de='eed')
+    [[7, 3, 5, 4], [7, 3, 5, 6]]
+    >>> caminhos_TAMMAX(t, limite=2, a_partir_de='eed', alt=alturas(t))
+    [[7, 3, 5, 4], [7, 3, 5, 6]]
+    '''
+    return [caminho for _, caminho in islice(gera_caminhos(t, a_partir_de, True, alt), limite)]
+
+# Função auxiliar que gera os caminhos de tamanho máximo de uma árvore
+def gera_caminhos_TAMMAX(t: Arvore) -> Iterator[list[int]]:
+    '''
+    Devolve um iterador com os caminhos de tamanho máximo da árvore *t*,
+    na mesma ordem de *caminhos_TAMMAX*.
+    A busca só desce para os filhos cuja altura é a altura do pai - 1, ou seja,
+    que levam a uma folha na profundidade máxima. O caminho atual é mantido em
+    uma única lista e uma cópia dela é produzida para cada caminho encontrado.
+    Exemplos:
+    >>> list(gera_caminhos_TAMMAX(None))
+    []
+    >>> t = No(No(No(None, 3, No(None, 4, None)), 8, None), 2, No(No(None, 7, None), 3, No(No(None, 2, None), 5, None)))
+    >>> for caminho in gera_caminhos_TAMMAX(t):
+    ...     print(caminho)
+    [2, 8, 3, 4]
+    [2, 3, 5, 2]
+    '''
+    for _, caminho in gera_caminhos(t, so_maximos=True):
+        yield caminho
+
+# Gera os caminhos de uma árvore a partir de um cursor
+def gera_caminhos(t: Arvore, a_partir_de: str | None = None, so_maximos: bool = False,
+                  alt: dict[int, int] | None = None) -> Iterator[tuple[str, list[int]]]:
+    '''
+    Devolve um iterador com os caminhos da raiz até as folhas da árvore *t*
+    (apenas os de tamanho máximo, se *so_maximos* é True), na ordem de
+    *caminhos* e *caminhos_TAMMAX*, cada um com o seu cursor: as direções
+    ('e' para esquerda e 'd' para direita) da raiz até a folha.
+    Se *a_partir_de* não é None, a busca continua depois da folha com esse
+    cursor: a descida até a folha reconstrói a pilha da busca, sem gerar
+    os caminhos anteriores.
+    Gera ValueError se o cursor não leva a uma folha (de um caminho de
+    tamanho máximo, se *so_maximos* é True).
+    A memória usada é proporcional à altura da árvore.
+    Se *so_maximos* é True, a busca usa as alturas dos nós: as guardadas nos
+    nós de uma árvore aumentada, as do dicionário *alt* (como devolvido por
+    *alturas*) se ele não é None, ou senão as calculadas por *alturas* antes
+    da busca, o que visita toda a árvore. Assim, para gerar os caminhos em
+    páginas, o trabalho de cada página é proporcional ao tamanho da página
+    (vezes a altura) se a árvore é aumentada ou se o mesmo *alt* é passado
+    para todas as páginas.
+    Exemplos:
+    >>> t = cria_ABB([1, 2, 3, 4, 5])
+    >>> list(gera_caminhos(t))
+    [('ed', [3, 1, 2]), ('dd', [3, 4, 5])]
+    >>> list(gera_caminhos(t, 'ed'))
+    [('dd', [3, 4, 5])]
+    >>> list(gera_caminhos(t, 'e'))
+    Traceback (most recent call last):
+    ...
+    ValueError: cursor inválido
+    >>> list(gera_caminhos(aumenta(t), 'ed', so_maximos=True))
+    [('dd', [3, 4, 5])]
+    '''
+    if t is None:
+        return
+    if so_maximos and alt is None and not isinstance(t, NoAumentado):
+        alt = alturas(t)
+
+    # Verifica se a busca desce de *no* para o *filho*
+    def desce(no: No, filho: Arvore) -> bool:
+        if filho is None:
+            return False
+        if not so_maximos:
+            return True
+        if alt is None:
+            return altura(filho) == altura(no) - 1
+        return alt[id(filho)] == alt[id(no)] - 1
+
+    caminho: list[int] = []
+    direcoes: list[str] = []
+    # A pilha guarda os nós a visitar com as suas profundidades e a direção
+    # em que estão em relação ao pai
+    pilha: list[tuple[No, int, str]] = []
+    if a_partir_de is None:
+        pilha.append((t, 0, ''))
+    else:
+        no = t
+        caminho.append(no.val)
+        for direcao in a_partir_de:
+            if direcao == 'e' and desce(no, no.esq):
+                if desce(no, no.dir):
+                    pilha.append((no.dir, len(caminho), 'd'))
+                no = no.esq
+            elif direcao == 'd' and desce(no, no.dir):
+                no = no.dir
+            else:
+                raise ValueError('cursor inválido')
+            caminho.append(no.val)
+            direcoes.append(direcao)
+        if no.esq is not None or no.dir is not None:
+            raise ValueError('cursor inválido')
+    while len(pilha) > 0:
+        no, profundidade, direcao = pilha.pop()
+        del caminho[profundidade:]
+        del direcoes[max(profundidade - 1, 0):]
+        caminho.append(no.val)
+        if profundidade > 0:
+            direcoes.append(direcao)
+        if no.esq is None and no.dir is None:
+            yield ''.join(direcoes), list(caminho)
+        # A subárvore direita é empilhada primeiro para que a esquerda seja visitada antes
+        if desce(no, no.dir):
+            pilha.append((no.dir, profundidade + 1, 'd'))
+        if desce(no, no.esq):
+            pilha.append((no.esq, profundidade + 1, 'e'))
+
+# Escreve os caminhos de uma árvore em um arquivo
+def escreve_caminhos(t: Arvore, arquivo: IO[str], so_maximos: bool = False,
+                     alt: dict[int, int] | None = None) -> int:
+    '''
+    Escreve no *arquivo* (de texto) os caminhos da raiz até as folhas da
+    árvore *t* (apenas os de tamanho máximo, se *so_maximos* é True), na
+    ordem de *caminhos*, e devolve o número de caminhos escritos.
+    Cada caminho é escrito em uma linha com o número de valores iniciais
+    iguais aos do caminho anterior seguido dos demais valores, separados
+    por espaços. Os caminhos são gerados e escritos um de cada vez, e a
+    memória usada não depende do número de caminhos: é proporcional à
+    altura da árvore se *so_maximos* é False ou se a árvore é aumentada.
+    Se *so_maximos* é True e a árvore não é aumentada, as alturas dos nós
+    são as do dicionário *alt* (como devolvido por *alturas*), ou senão são
+    calculadas por *alturas* antes da escrita, o que usa memória
+    proporcional ao número de nós (veja gera_caminhos).
+    Exemplos:
+    >>> import io
+    >>> arquivo = io.StringIO()
+    >>> escreve_caminhos(cria_ABB(range(7)), arquivo)
+    4
+    >>> print(arquivo.getvalue(), end='')
+    0 3 1 0
+    2 2
+    1 5 4
+    2 6
+    >>> arquivo.seek(0)
+    0
+    >>> list(le_caminhos(arquivo))
+    [[3, 1, 0], [3, 1, 2], [3, 5, 4], [3, 5, 6]]
+    >>> t = cria_ABB(range(6))
+    >>> escreve_caminhos(t, io.StringIO(), True), escreve_caminhos(aumenta(t), io.StringIO(), True)
+    (3, 3)
+    >>> escreve_caminhos(t, io.StringIO(), True, alturas(t))
+    3
+    '''
+    anterior: list[int] = []
+    n = 0
+    for _, caminho in gera_caminhos(t, so_maximos=so_maximos, alt=alt):
+        comum = 0
+        while comum < len(anterior) and comum < len(caminho) and anterior[comum] == caminho[comum]:
+            comum += 1
+        arquivo.write(' '.join(map(str, [comum] + caminho[comum:])))
+        arquivo.write('\n')
+        anterior = caminho
+        n += 1
+    return n
+
+# Lê os caminhos escritos por escreve_caminhos
+def le_caminhos(arquivo: IO[str]) -> Iterator[list[int]]:
+    '''
+    Devolve um iterador com os caminhos escritos por *escreve_caminhos* no *arquivo*.
     '''
-    alt = altura(t)
-    caminhos_t = caminhos(t)
-    return [caminho for caminho in caminhos_t if len(caminho) == alt + 1]
+    caminho: list[int] = []
+    for linha in arquivo:
+        numeros = [int(x) for x in linha.split()]
+        del caminho[numeros[0]:]
+        caminho.extend(numeros[1:])
+        yield list(caminho)
+
+# Função auxiliar que conta os caminhos de tamanho máximo de uma árvore
+def conta_caminhos_TAMMAX(t: Arvore) -> int:
+    '''
+    Devolve o número de caminhos de tamanho máximo da árvore *t*, ou seja,
+    o número de folhas na maior profundidade, sem construir os caminhos.
+    Exemplos:
+    >>> conta_caminhos_TAMMAX(None)
+    0
+    >>> conta_caminhos_TAMMAX(No(No(No(None, 1, None), 2, No(None, 3, None)), 4, No(No(None, 5, None), 6, No(None, 7, None))))
+    4
+    >>> conta_caminhos_TAMMAX(No(No(No(None, 3, No(None, 4, None)), 8, None), 2, No(No(None, 7, None), 3, No(No(None, 2, None), 5, None))))
+    2
+    '''
+    maior = -1
+    quantidade = 0
+    pilha: list[tuple[No, int]] = []
+    if t is not None:
+        pilha.append((t, 0))
+    while len(pilha) > 0:
+        no, profundidade = pilha.pop()
+        if no.esq is None and no.dir is None:
+            if profundidade > maior:
+                maior = profundidade
+                quantidade = 0
+            if profundidade == maior:
+                quantidade += 1
+        if no.dir is not None:
+            pilha.append((no.dir, profundidade + 1))
+        if no.esq is not None:
+            pilha.append((no.esq, profundidade + 1))
+    return quantidade
+
+# Função auxiliar que calcula a altura de todas as subárvores de uma árvore
+def alturas(t: Arvore) -> dict[int, int]:
+    '''
+    Devolve um dicionário que associa o id de cada nó da árvore *t* à altura
+    da subárvore do nó. Os nós são visitados uma única vez, em pós-ordem.
+    Exemplos:
+    >>> t = No(No(None, 1, None), 2, None)
+    >>> a = alturas(t)
+    >>> a[id(t)], a[id(t.esq)]
+    (1, 0)
+    '''
+    alt: dict[int, int] = {}
+    # Em pós-ordem, as alturas dos filhos já foram calculadas
+    for no in nos_posordem(t):
+        alt[id(no)] = 1 + max(alt[id(no.esq)] if no.esq is not None else -1,
+                              alt[id(no.dir)] if no.dir is not None else -1)
+    return alt
 
 # Função auxiliar para encontrar todos os caminhos de uma árvore
-def caminhos(t: Arvore) -> list[list[int]]:
+def caminhos(t: Arvore, limite: int | None = None, a_partir_de: str | None = None) -> list[list[int]]:
     r'''
     Devolve uma lista com todos os caminhos da árvore *t*.
+    Se *limite* não é None, devolve no máximo *limite* caminhos, e se
+    *a_partir_de* não é None, devolve apenas os caminhos depois do caminho
+    com esse cursor (veja gera_caminhos).
     Exemplos:
     >>> caminhos(None)
     []
@@ -316,16 +841,7 @@ def caminhos(t: Arvore) -> list[list[int]]:
     >>> caminhos(No(No(No(None, 3, No(None, 4, None)), 8, None), 2, No(No(None, 7, None), 3, No(No(None, 2, None), 5, None))))
     [[2, 8, 3, 4], [2, 3, 7], [2, 3, 5, 2]]
     '''
-    if t is None:
-        return []
-    if t.esq is None and t.dir is None:
-        return [[t.val]]
-    c = []
-    caminhos_esq = caminhos(t.esq)
-    caminhos_dir = caminhos(t.dir)
-    for caminho in caminhos_esq + caminhos_dir:
-        c += [[t.val] + caminho]
-    return c
+    return [caminho for _, caminho in islice(gera_caminhos(t, a_partir_de), limite)]
 
 # Função auxiliar para encontrar a altura de uma árvore
 def altura(t: Arvore) -> int:
@@ -342,7 +858,709 @@ def altura(t: Arvore) -> int:
     2
     >>> altura(No(No(No(None, 3, No(None, 4, None)), 8, None), 2, No(No(None, 7, None), 3, No(No(None, 2, None), 5, None))))
     3
+    >>> altura(aumenta(No(No(No(None, 1, None), 2, No(None, 3, None)), 4, None)))
+    2
+
+    # Árvore degenerada com 100000 nós
+    >>> t = None
+    >>> for i in range(100000):
+    ...     t = No(t, i, None)
+    >>> altura(t), num_elementos(t), minimo(t), busca_binaria(t, 0), len(caminhos(t)[0])
+    (99999, 100000, 0, True, 100000)
     '''
+    # Em uma árvore aumentada a altura está guardada no nó
     if t is None:
         return -1
-    return 1 + max(altura(t.esq), altura(t.dir))
+    if isinstance(t, NoAumentado):
+        return t.alt
+    return max(profundidade for _, profundidade in profundidades(t))
+
+
+# Árvores aumentadas: cada nó guarda o número de elementos e a altura da sua subárvore
+
+# Função auxiliar que atualiza as informações de um nó aumentado
+def atualiza(t: NoAumentado):
+    '''
+    Recalcula o número de elementos, a altura e a impressão digital do nó *t* a partir dos seus filhos,
+    que devem estar atualizados.
+    '''
+    t.tam = 1 + num_elementos(t.esq) + num_elementos(t.dir)
+    t.alt = 1 + max(altura(t.esq), altura(t.dir))
+    t.imp = (mistura(t.val) + impressao(t.esq) + impressao(t.dir)) & MASCARA
+
+# Funções auxiliares que rotacionam um nó aumentado
+def rotaciona_direita(t: NoAumentado) -> NoAumentado:
+    '''
+    Rotaciona a árvore *t* para a direita e devolve a nova raiz.
+    Requer que *t* tenha filho esquerdo.
+    Exemplos:
+    >>> rotaciona_direita(aumenta(No(No(None, 1, None), 2, None)))
+    NoAumentado(esq=None, val=1, dir=NoAumentado(esq=None, val=2, dir=None, tam=1, alt=0), tam=2, alt=1)
+    '''
+    e = t.esq
+    assert isinstance(e, NoAumentado)
+    t.esq = e.dir
+    e.dir = t
+    atualiza(t)
+    atualiza(e)
+    return e
+
+def rotaciona_esquerda(t: NoAumentado) -> NoAumentado:
+    '''
+    Rotaciona a árvore *t* para a esquerda e devolve a nova raiz.
+    Requer que *t* tenha filho direito.
+    Exemplos:
+    >>> rotaciona_esquerda(aumenta(No(None, 1, No(None, 2, None))))
+    NoAumentado(esq=NoAumentado(esq=None, val=1, dir=None, tam=1, alt=0), val=2, dir=None, tam=2, alt=1)
+    '''
+    d = t.dir
+    assert isinstance(d, NoAumentado)
+    t.dir = d.esq
+    d.esq = t
+    atualiza(t)
+    atualiza(d)
+    return d
+
+# Função auxiliar que balanceia um nó aumentado
+def balanceia(t: NoAumentado) -> NoAumentado:
+    '''
+    Atualiza o nó *t* e, se as alturas das suas subárvores diferem em mais
+    de 1, rotaciona o nó (rotação simples ou dupla). Devolve a nova raiz.
+    Requer que as subárvores de *t* sejam AVL e que as suas alturas difiram em no máximo 2.
+    Exemplos:
+    >>> balanceia(aumenta(No(None, 1, No(No(None, 2, None), 3, None))))
+    NoAumentado(esq=NoAumentado(esq=None, val=1, dir=None, tam=1, alt=0), val=2, dir=NoAumentado(esq=None, val=3, dir=None, tam=1, alt=0), tam=3, alt=1)
+    '''
+    atualiza(t)
+    fator = altura(t.esq) - altura(t.dir)
+    if fator > 1:
+        assert t.esq is not None
+        if altura(t.esq.esq) < altura(t.esq.dir):
+            t.esq = rotaciona_esquerda(t.esq) # type: ignore
+        return rotaciona_direita(t)
+    if fator < -1:
+        assert t.dir is not None
+        if altura(t.dir.dir) < altura(t.dir.esq):
+            t.dir = rotaciona_direita(t.dir) # type: ignore
+        return rotaciona_esquerda(t)
+    return t
+
+# Função auxiliar que balanceia os nós de um caminho
+def balanceia_caminho(t: Arvore, caminho: list[NoAumentado]) -> Arvore:
+    '''
+    Balanceia os nós do *caminho* a partir da raiz *t*, de baixo para cima,
+    ligando cada nova raiz de subárvore ao seu pai, e devolve a raiz da árvore.
+    Requer que o *caminho* comece na raiz *t* e que cada nó seja filho do anterior.
+    '''
+    for i in range(len(caminho) - 1, -1, -1):
+        no = balanceia(caminho[i])
+        if i == 0:
+            t = no
+        elif caminho[i - 1].esq is caminho[i]:
+            caminho[i - 1].esq = no
+        else:
+            caminho[i - 1].dir = no
+    return t
+
+# Cria uma árvore aumentada a partir de uma árvore
+def aumenta(t: Arvore) -> Arvore:
+    '''
+    Devolve uma cópia aumentada da árvore *t*, com a mesma estrutura.
+    Exemplos:
+    >>> aumenta(None) is None
+    True
+    >>> aumenta(No(No(None, 1, None), 2, None))
+    NoAumentado(esq=NoAumentado(esq=None, val=1, dir=None, tam=1, alt=0), val=2, dir=None, tam=2, alt=1)
+    '''
+    if t is None:
+        return None
+    raiz = NoAumentado(None, t.val, None)
+    # Os nós são copiados em pré-ordem e atualizados na ordem inversa,
+    # quando os filhos de cada nó já estão atualizados
+    copias: list[NoAumentado] = []
+    pilha: list[tuple[No, NoAumentado]] = [(t, raiz)]
+    while len(pilha) > 0:
+        no, copia = pilha.pop()
+        copias.append(copia)
+        if no.esq is not None:
+            copia.esq = NoAumentado(None, no.esq.val, None)
+            pilha.append((no.esq, copia.esq))
+        if no.dir is not None:
+            copia.dir = NoAumentado(None, no.dir.val, None)
+            pilha.append((no.dir, copia.dir))
+    for copia in reversed(copias):
+        atualiza(copia)
+    return raiz
+
+# Função auxiliar que verifica se um nó de uma árvore é aumentado
+def no_aumentado(no: No) -> NoAumentado:
+    '''
+    Devolve o nó *no*, se ele é aumentado.
+    Exemplos:
+    >>> no_aumentado(No(None, 1, None))
+    Traceback (most recent call last):
+    ...
+    ValueError: árvore não aumentada (use aumenta)
+    '''
+    if not isinstance(no, NoAumentado):
+        raise ValueError('árvore não aumentada (use aumenta)')
+    return no
+
+# Insere um valor em uma árvore aumentada
+def insere_ABB(t: Arvore, x: int) -> Arvore:
+    '''
+    Insere o valor *x* na ABB aumentada *t* e devolve a raiz da árvore,
+    mantendo a árvore balanceada (AVL).
+    Se *x* já está na árvore, a árvore não é alterada.
+    Requer que *t* seja AVL e aumentada (como as árvores criadas por
+    *aumenta(cria_ABB(...))* ou por esta função).
+    Exemplos:
+    >>> t = None
+    >>> for x in [2, 1, 3, 3]:
+    ...     t = insere_ABB(t, x)
+    >>> t
+    NoAumentado(esq=NoAumentado(esq=None, val=1, dir=None, tam=1, alt=0), val=2, dir=NoAumentado(esq=None, val=3, dir=None, tam=1, alt=0), tam=3, alt=1)
+
+    # Inserção em ordem crescente não degenera a árvore
+    >>> t = None
+    >>> for x in range(1, 1024):
+    ...     t = insere_ABB(t, x)
+    >>> altura(t), verifica_ABB(t)
+    (9, True)
+
+    # Árvores que não são aumentadas não são alteradas
+    >>> t = cria_ABB([1, 2, 3])
+    >>> insere_ABB(t, 4)
+    Traceback (most recent call last):
+    ...
+    ValueError: árvore não aumentada (use aumenta)
+    >>> t
+    No(esq=No(esq=None, val=1, dir=None), val=2, dir=No(esq=None, val=3, dir=None))
+    '''
+    # Desce até a posição de *x* guardando o caminho, e depois atualiza
+    # e balanceia os nós do caminho de baixo para cima
+    caminho: list[NoAumentado] = []
+    atual = t
+    while atual is not None:
+        atual = no_aumentado(atual)
+        if x == atual.val:
+            return t
+        caminho.append(atual)
+        atual = atual.esq if x < atual.val else atual.dir
+    novo = NoAumentado(None, x, None)
+    if len(caminho) == 0:
+        return novo
+    pai = caminho[-1]
+    if x < pai.val:
+        pai.esq = novo
+    else:
+        pai.dir = novo
+    return balanceia_caminho(t, caminho)
+
+# Remove um valor de uma árvore aumentada
+def remove_ABB(t: Arvore, x: int) -> Arvore:
+    '''
+    Remove o valor *x* da ABB aumentada *t* e devolve a raiz da árvore,
+    mantendo a árvore balanceada (AVL).
+    Se *x* não está na árvore, a árvore não é alterada.
+    Requer que *t* seja AVL e aumentada (como as árvores criadas por
+    *aumenta(cria_ABB(...))* ou por *insere_ABB*).
+    Exemplos:
+    >>> t = aumenta(cria_ABB([1, 2, 3, 4, 5]))
+    >>> t = remove_ABB(t, 3)
+    >>> list(em_ordem(t)), num_elementos(t), altura(t)
+    ([1, 2, 4, 5], 4, 2)
+    >>> t = remove_ABB(t, 6)
+    >>> num_elementos(t)
+    4
+    >>> t = remove_ABB(remove_ABB(remove_ABB(remove_ABB(t, 1), 2), 5), 4)
+    >>> t is None
+    True
+
+    # Remoções continuam balanceando a árvore
+    >>> t = aumenta(cria_ABB(range(1023)))
+    >>> for x in range(0, 1000, 2):
+    ...     t = remove_ABB(t, x)
+    >>> num_elementos(t), altura(t) <= 9, verifica_ABB(t)
+    (523, True, True)
+    >>> remove_ABB(cria_ABB([1, 2, 3]), 1)
+    Traceback (most recent call last):
+    ...
+    ValueError: árvore não aumentada (use aumenta)
+    '''
+    caminho: list[NoAumentado] = []
+    atual = t
+    while atual is not None and atual.val != x:
+        atual = no_aumentado(atual)
+        caminho.append(atual)
+        atual = atual.esq if x < atual.val else atual.dir
+    if atual is None:
+        return t
+    atual = no_aumentado(atual)
+    if atual.esq is not None and atual.dir is not None:
+        # O valor do nó é substituído pelo menor valor da subárvore direita,
+        # e o nó com esse valor (que não tem filho esquerdo) é removido
+        caminho.append(atual)
+        sucessor = atual.dir
+        while sucessor.esq is not None:
+            sucessor = no_aumentado(sucessor)
+            caminho.append(sucessor)
+            sucessor = sucessor.esq
+        atual.val = sucessor.val
+        atual = sucessor
+    filho = atual.esq if atual.esq is not None else atual.dir
+    if len(caminho) == 0:
+        return filho
+    pai = caminho[-1]
+    if pai.esq is atual:
+        pai.esq = filho
+    else:
+        pai.dir = filho
+    return balanceia_caminho(t, caminho)
+
+# Encontra o k-ésimo menor valor de uma árvore
+def k_esimo(t: Arvore, k: int) -> int:
+    '''
+    Devolve o *k*-ésimo menor valor da ABB *t* (o primeiro é o menor).
+    Em uma árvore aumentada o tempo é proporcional à altura da árvore.
+    Requer que 1 <= *k* <= num_elementos(t).
+    Exemplos:
+    >>> t = aumenta(cria_ABB([10, 20, 30, 40, 50]))
+    >>> [k_esimo(t, k) for k in range(1, 6)]
+    [10, 20, 30, 40, 50]
+    >>> k_esimo(t, 6)
+    Traceback (most recent call last):
+    ...
+    ValueError: k fora do intervalo
+    '''
+    if k < 1 or k > num_elementos(t):
+        raise ValueError('k fora do intervalo')
+    while t is not None:
+        menores = num_elementos(t.esq)
+        if k == menores + 1:
+            return t.val
+        if k <= menores:
+            t = t.esq
+        else:
+            k -= menores + 1
+            t = t.dir
+    raise ValueError('k fora do intervalo')
+
+# Encontra o posto de um valor em uma árvore
+def posto(t: Arvore, x: int, inclusivo: bool = False) -> int:
+    '''
+    Devolve o posto de *x* na ABB *t*, ou seja, o número de valores de *t*
+    menores que *x* (ou menores ou iguais a *x*, se *inclusivo* é True).
+    Em uma árvore aumentada o tempo é proporcional à altura da árvore.
+    Exemplos:
+    >>> t = aumenta(cria_ABB([10, 20, 30, 40, 50]))
+    >>> posto(t, 10), posto(t, 35), posto(t, 50), posto(t, 60)
+    (0, 3, 4, 5)
+    >>> posto(t, 10, True), posto(t, 35, True), posto(t, 50, True)
+    (1, 3, 5)
+    '''
+    menores = 0
+    while t is not None:
+        if t.val < x or (inclusivo and t.val == x):
+            menores += num_elementos(t.esq) + 1
+            t = t.dir
+        else:
+            t = t.esq
+    return menores
+
+
+# Operações de conjuntos entre ABBs: os valores das duas árvores são
+# intercalados em ordem e o resultado é criado com cria_ABB
+
+# Função auxiliar que intercala os valores de duas árvores
+# Função auxiliar que descarta os valores repetidos de uma sequência ordenada
+def sem_repeticao(valores: Iterator[int]) -> Iterator[int]:
+    '''
+    Devolve um iterador com os *valores* (em ordem crescente) sem os valores
+    iguais ao anterior.
+    Exemplos:
+    >>> list(sem_repeticao(iter([1, 1, 2, 3, 3])))
+    [1, 2, 3]
+    '''
+    anterior = None
+    for x in valores:
+        if x != anterior:
+            yield x
+            anterior = x
+
+def intercala(t: Arvore, r: Arvore, so_t: bool, ambas: bool, so_r: bool) -> Iterator[int]:
+    '''
+    Devolve um iterador com os valores das ABBs *t* e *r* em ordem crescente,
+    sem repetição, que estão somente em *t* (se *so_t* é True), nas duas
+    árvores (se *ambas* é True) ou somente em *r* (se *so_r* é True).
+    Exemplos:
+    >>> t = cria_ABB([1, 2, 3])
+    >>> r = cria_ABB([2, 3, 4])
+    >>> list(intercala(t, r, True, False, True))
+    [1, 4]
+    >>> list(intercala(t, None, True, True, True))
+    [1, 2, 3]
+
+    # Valores repetidos em uma mesma árvore (que verifica_ABB aceita)
+    >>> d = No(None, 1, No(None, 1, No(None, 2, None)))
+    >>> list(intercala(d, None, True, True, True))
+    [1, 2]
+    >>> list(intercala(d, cria_ABB([1]), True, False, False))
+    [2]
+    '''
+    valores_t = sem_repeticao(em_ordem(t))
+    valores_r = sem_repeticao(em_ordem(r))
+    a = next(valores_t, None)
+    b = next(valores_r, None)
+    while a is not None and b is not None:
+        if a < b:
+            if so_t:
+                yield a
+            a = next(valores_t, None)
+        elif b < a:
+            if so_r:
+                yield b
+            b = next(valores_r, None)
+        else:
+            if ambas:
+                yield a
+            a = next(valores_t, None)
+            b = next(valores_r, None)
+    if so_t:
+        while a is not None:
+            yield a
+            a = next(valores_t, None)
+    if so_r:
+        while b is not None:
+            yield b
+            b = next(valores_r, None)
+
+def uniao(t: Arvore, r: Arvore) -> Arvore:
+    '''
+    Cria e devolve a ABB com os valores que estão em *t* ou em *r*.
+    O tempo é proporcional à soma dos números de elementos das árvores.
+    Exemplos:
+    >>> uniao(cria_ABB([1, 3]), cria_ABB([2, 3]))
+    No(esq=No(esq=None, val=1, dir=None), val=2, dir=No(esq=None, val=3, dir=None))
+    >>> uniao(None, None) is None
+    True
+    '''
+    return cria_ABB(list(intercala(t, r, True, True, True)))
+
+def intersecao(t: Arvore, r: Arvore) -> Arvore:
+    '''
+    Cria e devolve a ABB com os valores que estão em *t* e em *r*.
+    Exemplos:
+    >>> list(em_ordem(intersecao(cria_ABB([1, 2, 3, 5]), cria_ABB([2, 3, 4, 5]))))
+    [2, 3, 5]
+    >>> intersecao(cria_ABB([1]), None) is None
+    True
+    '''
+    return cria_ABB(list(intercala(t, r, False, True, False)))
+
+def diferenca(t: Arvore, r: Arvore) -> Arvore:
+    '''
+    Cria e devolve a ABB com os valores que estão em *t* e não estão em *r*.
+    Exemplos:
+    >>> list(em_ordem(diferenca(cria_ABB([1, 2, 3, 5]), cria_ABB([2, 3, 4]))))
+    [1, 5]
+    '''
+    return cria_ABB(list(intercala(t, r, True, False, False)))
+
+def diferenca_simetrica(t: Arvore, r: Arvore) -> Arvore:
+    '''
+    Cria e devolve a ABB com os valores que estão em somente uma das árvores *t* e *r*.
+    Exemplos:
+    >>> list(em_ordem(diferenca_simetrica(cria_ABB([1, 2, 3, 5]), cria_ABB([2, 3, 4]))))
+    [1, 4, 5]
+    '''
+    return cria_ABB(list(intercala(t, r, True, False, True)))
+
+
+# Consultas por intervalo e por vizinhos de um valor
+
+# Percorre os valores de um intervalo
+def intervalo(t: Arvore, inicio: int, fim: int) -> Iterator[int]:
+    '''
+    Devolve um iterador com os valores da ABB *t* que estão no intervalo
+    [*inicio*, *fim*], em ordem crescente.
+    As subárvores fora do intervalo não são visitadas, e o tempo para obter
+    k valores é proporcional à altura da árvore mais k.
+    Exemplos:
+    >>> t = cria_ABB(range(0, 100, 10))
+    >>> list(intervalo(t, 15, 50))
+    [20, 30, 40, 50]
+    >>> list(intervalo(t, 91, 200)), list(intervalo(t, 50, 40))
+    ([], [])
+    '''
+    # Como em em_ordem, mas a descida não empilha os nós menores que
+    # *inicio* (e as suas subárvores esquerdas), e o percurso termina no
+    # primeiro valor maior que *fim*
+    pilha: list[No] = []
+    while t is not None or len(pilha) > 0:
+        while t is not None:
+            if t.val < inicio:
+                t = t.dir
+            else:
+                pilha.append(t)
+                t = t.esq
+        if len(pilha) == 0:
+            return
+        no = pilha.pop()
+        if no.val > fim:
+            return
+        yield no.val
+        t = no.dir
+
+# Conta os valores de um intervalo
+def conta_intervalo(t: Arvore, inicio: int, fim: int) -> int:
+    '''
+    Devolve o número de valores da ABB *t* no intervalo [*inicio*, *fim*].
+    Em uma árvore aumentada o tempo é proporcional à altura da árvore,
+    senão ao número de valores no intervalo.
+    Exemplos:
+    >>> t = cria_ABB(range(0, 100, 10))
+    >>> conta_intervalo(t, 15, 50), conta_intervalo(aumenta(t), 15, 50)
+    (4, 4)
+    >>> conta_intervalo(aumenta(t), 0, 90), conta_intervalo(aumenta(t), 50, 40)
+    (10, 0)
+    '''
+    if fim < inicio:
+        return 0
+    if isinstance(t, NoAumentado):
+        return posto(t, fim, True) - posto(t, inicio)
+    return sum(1 for _ in intervalo(t, inicio, fim))
+
+def piso(t: Arvore, x: int) -> int | None:
+    '''
+    Devolve o maior valor da ABB *t* menor ou igual a *x*, ou None se não existe.
+    Exemplos:
+    >>> t = cria_ABB([10, 20, 30])
+    >>> piso(t, 20), piso(t, 25), piso(t, 5)
+    (20, 20, None)
+    '''
+    resultado = None
+    while t is not None:
+        if t.val == x:
+            return x
+        if t.val < x:
+            resultado = t.val
+            t = t.dir
+        else:
+            t = t.esq
+    return resultado
+
+def teto(t: Arvore, x: int) -> int | None:
+    '''
+    Devolve o menor valor da ABB *t* maior ou igual a *x*, ou None se não existe.
+    Exemplos:
+    >>> t = cria_ABB([10, 20, 30])
+    >>> teto(t, 20), teto(t, 25), teto(t, 35)
+    (20, 30, None)
+    '''
+    resultado = None
+    while t is not None:
+        if t.val == x:
+            return x
+        if t.val > x:
+            resultado = t.val
+            t = t.esq
+        else:
+            t = t.dir
+    return resultado
+
+def sucessor(t: Arvore, x: int) -> int | None:
+    '''
+    Devolve o menor valor da ABB *t* maior que *x*, ou None se não existe.
+    Exemplos:
+    >>> t = cria_ABB([10, 20, 30])
+    >>> sucessor(t, 20), sucessor(t, 5), sucessor(t, 30)
+    (30, 10, None)
+    '''
+    resultado = None
+    while t is not None:
+        if t.val > x:
+            resultado = t.val
+            t = t.esq
+        else:
+            t = t.dir
+    return resultado
+
+def antecessor(t: Arvore, x: int) -> int | None:
+    '''
+    Devolve o maior valor da ABB *t* menor que *x*, ou None se não existe.
+    Exemplos:
+    >>> t = cria_ABB([10, 20, 30])
+    >>> antecessor(t, 20), antecessor(t, 35), antecessor(t, 10)
+    (10, 30, None)
+    '''
+    resultado = None
+    while t is not None:
+        if t.val < x:
+            resultado = t.val
+            t = t.dir
+        else:
+            t = t.esq
+    return resultado
+
+
+# Comparação de árvores aumentadas pelas impressões digitais
+
+def mesma_impressao(t: Arvore, r: Arvore) -> bool:
+    '''
+    Verifica se as árvores *t* e *r* têm o mesmo número de elementos e a mesma
+    impressão digital. Se o resultado é False, as árvores têm elementos
+    diferentes; se é True, as árvores têm os mesmos elementos, exceto com
+    probabilidade desprezível (em torno de 2**-64 para elementos arbitrários).
+    Em árvores aumentadas o tempo é constante.
+    Exemplos:
+    >>> t = aumenta(cria_ABB([1, 2, 3]))
+    >>> mesma_impressao(t, insere_ABB(insere_ABB(insere_ABB(None, 3), 1), 2))
+    True
+    >>> mesma_impressao(t, aumenta(cria_ABB([1, 2])))
+    False
+    '''
+    return num_elementos(t) == num_elementos(r) and impressao(t) == impressao(r)
+
+# Função auxiliar que encontra a impressão digital dos valores menores que um valor
+def impressao_menores(t: Arvore, x: int, inclusivo: bool = False) -> int:
+    '''
+    Devolve a impressão digital dos valores da ABB aumentada *t* menores que
+    *x* (ou menores ou iguais, se *inclusivo* é True), em tempo proporcional
+    à altura da árvore.
+    Exemplos:
+    >>> t = aumenta(cria_ABB([1, 2, 3, 4]))
+    >>> impressao_menores(t, 3) == impressao(cria_ABB([1, 2]))
+    True
+    >>> impressao_menores(t, 3, True) == impressao(cria_ABB([1, 2, 3]))
+    True
+    '''
+    # Como em posto, somando as impressões em vez dos tamanhos
+    soma = 0
+    while t is not None:
+        if t.val < x or (inclusivo and t.val == x):
+            soma += impressao(t.esq) + mistura(t.val)
+            t = t.dir
+        else:
+            t = t.esq
+    return soma & MASCARA
+
+# Função auxiliar que encontra a impressão digital dos valores de um intervalo
+def impressao_intervalo(t: Arvore, inicio: int, fim: int) -> int:
+    '''
+    Devolve a impressão digital dos valores da ABB aumentada *t* no
+    intervalo [*inicio*, *fim*], em tempo proporcional à altura da árvore.
+    Exemplos:
+    >>> t = aumenta(cria_ABB(range(10)))
+    >>> impressao_intervalo(t, 3, 5) == impressao(cria_ABB([3, 4, 5]))
+    True
+    '''
+    return (impressao_menores(t, fim, True) - impressao_menores(t, inicio)) & MASCARA
+
+def diferencas(t: Arvore, r: Arvore) -> list[int]:
+    '''
+    Devolve em ordem crescente os valores que estão em somente uma das ABBs
+    aumentadas *t* e *r*.
+    O intervalo de valores das árvores é dividido ao meio repetidamente, e
+    os intervalos em que as duas árvores têm a mesma impressão digital não
+    são percorridos. Para d diferenças, o tempo é proporcional a
+    d * h * log(U), onde h é a altura das árvores e U é o tamanho do
+    intervalo de valores, em vez do número de elementos.
+    Exemplos:
+    >>> t = aumenta(cria_ABB(range(0, 100000, 2)))
+    >>> r = remove_ABB(insere_ABB(insere_ABB(aumenta(cria_ABB(range(0, 100000, 2))), 7), 50001), 500)
+    >>> diferencas(t, r)
+    [7, 500, 50001]
+    >>> diferencas(t, t), diferencas(None, r)[:3]
+    ([], [0, 2, 4])
+    '''
+    # Intervalos com poucos elementos são comparados diretamente
+    LIMITE = 16
+    if t is None or r is None:
+        return list(em_ordem(t if r is None else r))
+    resultado: list[int] = []
+    pilha = [(min(minimo(t), minimo(r)), max(maximo(t), maximo(r)))]
+    while len(pilha) > 0:
+        inicio, fim = pilha.pop()
+        tam_t = conta_intervalo(t, inicio, fim)
+        tam_r = conta_intervalo(r, inicio, fim)
+        if tam_t == tam_r and impressao_intervalo(t, inicio, fim) == impressao_intervalo(r, inicio, fim):
+            continue
+        if tam_t + tam_r <= LIMITE or inicio == fim:
+            valores_t = set(intervalo(t, inicio, fim))
+            valores_r = set(intervalo(r, inicio, fim))
+            resultado.extend(sorted(valores_t ^ valores_r))
+            continue
+        meio = (inicio + fim) // 2
+        # O intervalo da direita é empilhado primeiro para que os valores
+        # sejam encontrados em ordem crescente
+        pilha.append((meio + 1, fim))
+        pilha.append((inicio, meio))
+    return resultado
+
+
+# Estatísticas de uma árvore calculadas em um único percurso em largura
+
+@dataclass
+class EstatisticasArvore:
+    '''
+    Estatísticas dos níveis visitados de uma árvore: o número de elementos,
+    a altura, os valores mínimo e máximo (None se a árvore é vazia), o
+    número de folhas, o número de nós (larguras) e de folhas em cada nível,
+    e se o percurso parou antes do último nível (truncada).
+    '''
+    num_elementos: int
+    altura: int
+    minimo: int | None
+    maximo: int | None
+    folhas: int
+    larguras: list[int]
+    folhas_por_nivel: list[int]
+    truncada: bool
+
+def estatisticas(t: Arvore, profundidade_maxima: int | None = None) -> EstatisticasArvore:
+    '''
+    Devolve as estatísticas da árvore *t* (que não precisa ser uma ABB),
+    calculadas em um único percurso em largura, nível por nível.
+    Se *profundidade_maxima* não é None, apenas os níveis até essa
+    profundidade são visitados, e as estatísticas são desses níveis (os nós
+    com filhos no último nível visitado não são contados como folhas).
+    Exemplos:
+    >>> estatisticas(cria_ABB([1, 2, 3, 4, 5, 6]))
+    EstatisticasArvore(num_elementos=6, altura=2, minimo=1, maximo=6, folhas=3, larguras=[1, 2, 3], folhas_por_nivel=[0, 0, 3], truncada=False)
+    >>> estatisticas(cria_ABB([1, 2, 3, 4, 5, 6]), profundidade_maxima=1)
+    EstatisticasArvore(num_elementos=3, altura=1, minimo=1, maximo=5, folhas=0, larguras=[1, 2], folhas_por_nivel=[0, 0], truncada=True)
+    >>> estatisticas(None)
+    EstatisticasArvore(num_elementos=0, altura=-1, minimo=None, maximo=None, folhas=0, larguras=[], folhas_por_nivel=[], truncada=False)
+    '''
+    menor = None
+    maior = None
+    larguras: list[int] = []
+    folhas_por_nivel: list[int] = []
+    truncada = False
+    # A fila tem os nós de um nível e, no fim de cada nível, os nós do próximo nível
+    fila: deque[No] = deque()
+    if t is not None:
+        fila.append(t)
+    while len(fila) > 0:
+        if profundidade_maxima is not None and len(larguras) > profundidade_maxima:
+            truncada = True
+            break
+        largura = len(fila)
+        folhas = 0
+        for _ in range(largura):
+            no = fila.popleft()
+            if menor is None or no.val < menor:
+                menor = no.val
+            if maior is None or no.val > maior:
+                maior = no.val
+            if no.esq is None and no.dir is None:
+                folhas += 1
+            if no.esq is not None:
+                fila.append(no.esq)
+            if no.dir is not None:
+                fila.append(no.dir)
+        larguras.append(largura)
+        folhas_por_nivel.append(folhas)
+    return EstatisticasArvore(sum(larguras), len(larguras) - 1, menor, maior, sum(folhas_por_nivel),
+                              larguras, folhas_por_nivel, truncada)
@@ -56,10 +56,14 @@ def num_itens(lst: Lista) -> int:
     6
     >>> num_itens(lista([]))
     0
+    >>> num_itens(lista(list(range(100000))))
+    100000
     '''
-    if lst is None:
-        return 0
-    return 1 + num_itens(lst.prox)
+    n = 0
+    while lst is not None:
+        n += 1
+        lst = lst.prox
+    return n
 
 def divide(lst: Lista) -> tuple[Lista, Lista]:
     '''
@@ -112,22 +116,25 @@ def merge(esquerda: Lista, direita: Lista) -> Lista:
     [2, 5, 8]
     >>> arranjo(merge(lista([]), lista([])))
     []
+    >>> num_itens(merge(lista(list(range(0, 200000, 2))), lista(list(range(1, 200000, 2)))))
+    200000
     '''
-    # Caso base: Se uma das listas é vazia, retorna a outra lista
-    if esquerda is None:
-        return direita
-    elif direita is None:
-        return esquerda
-    
+    # cria um sentinela, ao qual os nós são ligados em ordem
+    inicio = No(0, None)
+    fim = inicio
     # Comparar os elementos das duas listas e combinar em ordem
-    if esquerda.valor <= direita.valor:
-        resultado = esquerda
-        resultado.prox = merge(esquerda.prox, direita)
-    else:
-        resultado = direita
-        resultado.prox = merge(esquerda, direita.prox)
-    
-    return resultado
+    while esquerda is not None and direita is not None:
+        if esquerda.valor <= direita.valor:
+            fim.prox = esquerda
+            esquerda = esquerda.prox
+        else:
+            fim.prox = direita
+            direita = direita.prox
+        fim = fim.prox
+    # Quando uma das listas é vazia, o restante da outra lista é ligado ao fim
+    fim.prox = esquerda if esquerda is not None else direita
+    # descarta o sentinela
+    return inicio.prox
 
 
 def lista(a: list[int]) -> Lista: